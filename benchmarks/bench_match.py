@@ -0,0 +1,67 @@
+"""
+Benchmark for :func:`ContactMap.match <conkit.core.contactmap.ContactMap.match>`
+
+The fixtures of the ``test_match_*`` unit tests are scaled up to a
+prediction of ``ncontacts`` contacts on a ``length``-residue sequence,
+which is matched against a reference structure of the same sequence
+with a numbering offset.
+
+Usage::
+
+   python benchmarks/bench_match.py [length] [ncontacts]
+
+"""
+
+from __future__ import print_function
+
+import random
+import sys
+import time
+import warnings
+
+from conkit.core.contact import Contact
+from conkit.core.contactmap import ContactMap
+from conkit.core.sequence import Sequence
+
+AMINO_ACIDS = "ACDEFGHIKLMNPQRSTVWY"
+
+
+def make_fixtures(length, ncontacts, offset=10, seed=42):
+    rng = random.Random(seed)
+    sequence = "".join(rng.choice(AMINO_ACIDS) for _ in range(length))
+
+    prediction = ContactMap("prediction")
+    while len(prediction) < ncontacts:
+        res1_seq = rng.randint(1, length - 6)
+        res2_seq = rng.randint(res1_seq + 5, length)
+        if (res1_seq, res2_seq) not in prediction:
+            prediction.add(Contact(res1_seq, res2_seq, rng.random()))
+    prediction.sequence = Sequence("prediction", sequence)
+    prediction.assign_sequence_register()
+
+    reference = ContactMap("reference")
+    for res1_seq in range(1, length - 5):
+        for res2_seq in range(res1_seq + 5, min(res1_seq + 15, length + 1)):
+            contact = Contact(res1_seq + offset, res2_seq + offset, 1.0)
+            contact.res1_altseq = res1_seq
+            contact.res2_altseq = res2_seq
+            reference.add(contact)
+    reference.sequence = Sequence("reference", sequence)
+    reference.assign_sequence_register(altloc=True)
+    return prediction, reference
+
+
+def main(length=1000, ncontacts=10000):
+    prediction, reference = make_fixtures(length, ncontacts)
+    print("Prediction: {} contacts, reference: {} contacts, L={}".format(len(prediction), len(reference), length))
+
+    for renumber in (False, True):
+        start = time.time()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            matched = prediction.match(reference, renumber=renumber)
+        print("match(renumber={}): {:.2f}s precision={:.3f}".format(renumber, time.time() - start, matched.precision))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
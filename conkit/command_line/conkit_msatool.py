@@ -53,6 +53,9 @@ logger = None
 
 def main():
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--approximate', action='store_true', default=False,
+                        help='estimate the number of effective sequences from a random sample of sequences')
+    parser.add_argument('-nproc', dest='nproc', default=1, type=int, help='number of processes for the sequence weighting')
     parser.add_argument('msafile', help='Multiple Sequence Alignment file')
     parser.add_argument('msaformat', help='Multiple Sequence Alignment format')
     args = parser.parse_args()
@@ -71,7 +74,11 @@ def main():
     logger.info('Input MSA Format:                          %s', args.msaformat)
     logger.info('Length of the Target Sequence:             %d', msa.top_sequence.seq_len)
     logger.info('Total Number of Sequences:                 %d', msa.nseq)
-    logger.info('Number of Effective Sequences:             %d', msa.neff)
+    if args.approximate:
+        neff, error = msa.estimate_neff(identity=0.8)
+        logger.info('Number of Effective Sequences:             %d (+/- %d)', neff, error)
+    else:
+        logger.info('Number of Effective Sequences:             %d', msa.calculate_neff_with_identity(0.8, nproc=args.nproc))
     logger.info('Sequence Coverage Plot:                    %s', plot)
 
 
@@ -246,22 +246,16 @@ def main():
         logger.info('Contact list cutoff factor: %f * L', args.dfactor)
 
         seq = conkit.io.read(args.seqfile, args.seqformat)[0]
-        con = conkit.io.read(args.confile, args.conformat)[0]
-
-        con.sequence = seq
-        con.assign_sequence_register()
-        con.remove_neighbors(min_distance=args.dtn, inplace=True)
         ncontacts = int(seq.seq_len * args.dfactor)
-        con.sort('raw_score', reverse=True, inplace=True)
-        con_sliced = con[:ncontacts]
+        con_sliced = conkit.io.read(args.confile, args.conformat, min_separation=args.dtn, top=ncontacts)[0]
+
+        con_sliced.sequence = seq
+        con_sliced.assign_sequence_register()
 
         if args.otherfile:
-            other = conkit.io.read(args.otherfile, args.otherformat)[0]
-            other.sequence = seq
-            other.assign_sequence_register()
-            other.remove_neighbors(min_distance=args.dtn, inplace=True)
-            other.sort('raw_score', reverse=True, inplace=True)
-            other_sliced = other[:ncontacts]
+            other_sliced = conkit.io.read(args.otherfile, args.otherformat, min_separation=args.dtn, top=ncontacts)[0]
+            other_sliced.sequence = seq
+            other_sliced.assign_sequence_register()
         else:
             other_sliced = None
 
@@ -319,14 +313,11 @@ def main():
         logger.info('Contact list cutoff factor: %f * L', args.dfactor)
 
         seq = conkit.io.read(args.seqfile, args.seqformat)[0]
-        con = conkit.io.read(args.confile, args.conformat)[0]
-
-        con.sequence = seq
-        con.assign_sequence_register()
-        con.remove_neighbors(min_distance=args.dtn, inplace=True)
-        con.sort('raw_score', reverse=True, inplace=True)
         ncontacts = int(seq.seq_len * args.dfactor)
-        con_sliced = con[:ncontacts]
+        con_sliced = conkit.io.read(args.confile, args.conformat, min_separation=args.dtn, top=ncontacts)[0]
+
+        con_sliced.sequence = seq
+        con_sliced.assign_sequence_register()
 
         figure = conkit.plot.ContactMapChordFigure(con_sliced, use_conf=args.confidence, legend=True)
         figure_aspect_ratio = 1.0
@@ -337,14 +328,11 @@ def main():
         logger.info('Bandwidth estimator: %s', args.bw_method)
 
         seq = conkit.io.read(args.seqfile, args.seqformat)[0]
-        con = conkit.io.read(args.confile, args.conformat)[0]
-
-        con.sequence = seq
-        con.assign_sequence_register()
-        con.remove_neighbors(min_distance=args.dtn, inplace=True)
-        con.sort('raw_score', reverse=True, inplace=True)
         ncontacts = int(seq.seq_len * args.dfactor)
-        con_sliced = con[:ncontacts]
+        con_sliced = conkit.io.read(args.confile, args.conformat, min_separation=args.dtn, top=ncontacts)[0]
+
+        con_sliced.sequence = seq
+        con_sliced.assign_sequence_register()
 
         figure = conkit.plot.ContactDensityFigure(con_sliced, bw_method=args.bw_method, legend=True)
         figure_aspect_ratio = 0.3
@@ -359,11 +347,10 @@ def main():
         logger.info('Contact list cutoff factor step: %f', args.cutoff_step)
 
         seq = conkit.io.read(args.seqfile, args.seqformat)[0]
-        con = conkit.io.read(args.confile, args.conformat)[0]
+        con = conkit.io.read(args.confile, args.conformat, min_separation=args.dtn)[0]
 
         con.sequence = seq
         con.assign_sequence_register()
-        con.remove_neighbors(min_distance=args.dtn, inplace=True)
         con.sort('raw_score', reverse=True, inplace=True)
 
         if args.pdbchain:
@@ -74,7 +74,8 @@ def main():
     else:
         pdb = conkit.io.read(args.pdbfile, args.pdbformat)[0]
     seq = conkit.io.read(args.seqfile, args.seqformat)[0]
-    con = conkit.io.read(args.confile, args.conformat)[0]
+    ncontacts = int(seq.seq_len * args.dfactor)
+    con = conkit.io.read(args.confile, args.conformat, min_separation=args.dtn, top=ncontacts)[0]
     
     con.sequence = seq
     con.assign_sequence_register()
@@ -82,13 +83,7 @@ def main():
     logger.info('Min sequence separation for contacting residues: %d', args.dtn)
     logger.info('Contact list cutoff factor: %f * L', args.dfactor)
 
-    con.remove_neighbors(min_distance=args.dtn, inplace=True)
-    ncontacts = int(seq.seq_len * args.dfactor)
-    con.sort('raw_score', reverse=True, inplace=True)
-    con_sliced = con[:ncontacts]
-
-
-    con_matched = con_sliced.match(pdb)
+    con_matched = con.match(pdb)
     precision = con_matched.precision
     
     logger.info('Precision score: %f', precision)
@@ -40,6 +40,10 @@ It uses two external programs to perform this task.
 
 *** The two programs above need to be installed separately ***
 
+Alternatively, contacts can be predicted without CCMpred by pseudo-likelihood
+(-method plmdca) or mean-field (-method mfdca) Direct Coupling Analysis, or by
+Mutual Information (-method mi). The CCMpred executable is then ignored.
+
 """
 
 __author__ = "Felix Simkovic"
@@ -55,14 +59,19 @@ import conkit.command_line
 import conkit.io
 import conkit.plot
 import conkit.plot.tools
+import conkit.predict
 
 logger = None
 
 
 def add_default_args(parser):
     """Define default arguments"""
+    parser.add_argument('-method', default='ccmpred', choices=['ccmpred', 'mfdca', 'mi', 'plmdca'],
+                        help='Contact prediction method')
     parser.add_argument('-prefix', default='conkit', help='Job ID')
     parser.add_argument('-wdir', default=os.getcwd(), help='Working directory')
+    parser.add_argument('--npz', default=False, action="store_true",
+                        help='Store a binary copy of the CCMpred coupling matrix')
     parser.add_argument('--demo', default=False, action="store_true", help=argparse.SUPPRESS)
 
 
@@ -196,24 +205,38 @@ def main(argl=None):
     if args.which == 'sequence' and args.nodca:
         return
 
-    ccmpred = args.ccmpred
-    matrix_fname = os.path.join(args.wdir, args.prefix + '.mat')
-    ccmpred_cline = conkit.applications.CCMpredCommandline(
-        cmd=ccmpred, alnfile=jon_fname, matfile=matrix_fname, threads=2, renormalize=True)
-    logger.info('Executing: %s', ccmpred_cline)
-    if args.demo:
-        assert os.path.isfile(matrix_fname)
-        time.sleep(5)
+    if args.method == 'ccmpred':
+        ccmpred = args.ccmpred
+        matrix_fname = os.path.join(args.wdir, args.prefix + '.mat')
+        ccmpred_cline = conkit.applications.CCMpredCommandline(
+            cmd=ccmpred, alnfile=jon_fname, matfile=matrix_fname, threads=2, renormalize=True)
+        logger.info('Executing: %s', ccmpred_cline)
+        if args.demo:
+            assert os.path.isfile(matrix_fname)
+            time.sleep(5)
+        else:
+            ccmpred_cline()
+        prediction_file = conkit.io.read(matrix_fname, 'ccmpred')
+        prediction = prediction_file.top_map
+        prediction.sequence = msa_h.top_sequence.copy()
+        if args.npz:
+            npz_fname = os.path.join(args.wdir, args.prefix + '.npz')
+            conkit.io.write(npz_fname, 'ccmpred-npz', prediction_file)
+            logger.info('Binary coupling matrix: %s', npz_fname)
     else:
-        ccmpred_cline()
+        logger.info('Predicting contacts with method: %s', args.method)
+        if args.method == 'mfdca':
+            prediction = conkit.predict.mean_field_dca(msa_h)
+        elif args.method == 'plmdca':
+            prediction = conkit.predict.pseudo_likelihood_dca(msa_h, nthreads=2)
+        else:
+            prediction = conkit.predict.mutual_information(msa_h)
 
     dtn = 5
     dfactor = 1.
-    cmap = conkit.io.read(matrix_fname, 'ccmpred').top_map
-    cmap.sequence = conkit.io.read(jon_fname, 'jones').top_sequence
-    cmap.remove_neighbors(min_distance=dtn, inplace=True)
+    cmap = prediction.remove_neighbors(min_distance=dtn, inplace=False)
     cmap.sort('raw_score', reverse=True, inplace=True)
-    cmap = cmap[:cmap.sequence.seq_len]
+    cmap = cmap.view(stop=cmap.sequence.seq_len)
 
     contact_map_fname = os.path.join(args.wdir, args.prefix + 'cmap.png')
     figure = conkit.plot.ContactMapFigure(cmap, legend=True)
@@ -225,7 +248,10 @@ def main(argl=None):
     logger.info('|- Contact list cutoff factor: %f * L', dfactor)
 
     casprr_fname = os.path.join(args.wdir, args.prefix + '.rr')
-    conkit.io.convert(matrix_fname, 'ccmpred', casprr_fname, 'casprr')
+    if args.method == 'ccmpred':
+        conkit.io.write(casprr_fname, 'casprr', prediction_file)
+    else:
+        conkit.io.write(casprr_fname, 'casprr', prediction)
     logger.info('Final prediction file: %s', casprr_fname)
 
 
@@ -0,0 +1,308 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-18, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Column-oriented storage used by the :obj:`ContactMap <conkit.core.contactmap.ContactMap>` backend"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+__version__ = "1.0"
+
+import numpy as np
+import sys
+
+if sys.version_info.major < 3:
+    from itertools import izip as zip
+
+from conkit.core.contact import Contact, ContactMatchState
+
+# Column name, data type and default value of each per-contact attribute
+_FIELDS = (
+    ('res1_seq', np.int64, None),
+    ('res2_seq', np.int64, None),
+    ('raw_score', np.float64, None),
+    ('res1_altseq', np.int64, 0),
+    ('res2_altseq', np.int64, 0),
+    ('res1', 'U1', 'X'),
+    ('res2', 'U1', 'X'),
+    ('res1_chain', np.str_, ''),
+    ('res2_chain', np.str_, ''),
+    ('scalar_score', np.float64, 0.0),
+    ('status', np.int8, ContactMatchState.unknown.value),
+    ('weight', np.float64, 1.0),
+    ('lower_bound', np.float64, 0.0),
+    ('upper_bound', np.float64, 8.0),
+)
+FIELD_NAMES = tuple(f[0] for f in _FIELDS)
+_DTYPES = dict((f[0], f[1]) for f in _FIELDS)
+
+
+class _ContactColumns(object):
+    """Struct-of-arrays storage for the contacts of a single contact map
+
+    Each per-contact attribute is held in a contiguous, read-only :obj:`numpy.ndarray`.
+    Instances are never modified in place: operations changing the order or
+    number of contacts return a new instance and value updates swap in a new
+    array via :meth:`replace`. This allows slices and copies to share their
+    memory with the original storage.
+
+    Columns holding nothing but the default value are stored as zero-stride
+    broadcast arrays and occupy no memory.
+
+    """
+    __slots__ = FIELD_NAMES + ('_index',)
+
+    def __init__(self, **columns):
+        """Initialise the storage from trusted, equally sized arrays
+
+        Parameters
+        ----------
+        **columns
+           One :obj:`numpy.ndarray` per field in :data:`FIELD_NAMES`
+
+        """
+        for name in FIELD_NAMES:
+            array = columns[name]
+            array.flags.writeable = False
+            setattr(self, name, array)
+        self._index = None
+
+    def __len__(self):
+        return self.res1_seq.shape[0]
+
+    def __repr__(self):
+        return "{0}(ncontacts={1})".format(self.__class__.__name__, len(self))
+
+    def __getstate__(self):
+        return self.to_arrays()
+
+    def __setstate__(self, state):
+        nrows, columns = state
+        self.__init__(**self._expand(nrows, columns))
+
+    @classmethod
+    def from_arrays(cls, nrows, columns):
+        """Create a new storage from the compact arrays of :meth:`to_arrays`
+
+        Parameters
+        ----------
+        nrows : int
+           The number of contacts
+        columns : dict
+           One :obj:`numpy.ndarray` per field in :data:`FIELD_NAMES`, single values
+           are repeated for all contacts
+
+        """
+        return cls(**cls._expand(nrows, columns))
+
+    def to_arrays(self):
+        """The number of contacts and a compact array for each column
+
+        Columns holding nothing but the default value are returned as a single value
+        to keep serialised storages small.
+
+        Returns
+        -------
+        tuple
+           The number of contacts and a dictionary of :obj:`numpy.ndarray` per field
+
+        """
+        columns = {}
+        for name in FIELD_NAMES:
+            array = getattr(self, name)
+            columns[name] = array[:1].copy() if array.strides == (0, ) else array
+        return len(self), columns
+
+    @staticmethod
+    def _expand(nrows, columns):
+        """Repeat the single values of compact columns for all rows"""
+        columns = dict(columns)
+        for name, array in columns.items():
+            if array.shape[0] != nrows:
+                columns[name] = np.broadcast_to(array, (nrows, ))
+        return columns
+
+    @property
+    def index(self):
+        """A dictionary mapping each contact identifier to its row"""
+        if self._index is None:
+            ids = zip(self.res1_seq.tolist(), self.res2_seq.tolist())
+            self._index = dict(zip(ids, range(len(self))))
+        return self._index
+
+    @classmethod
+    def create(cls, res1_seq, res2_seq, raw_score, **kwargs):
+        """Create a new storage from array-like data
+
+        All data is copied and converted to the column data types. Fields
+        not provided are set to their default value.
+
+        Parameters
+        ----------
+        res1_seq : list, tuple, :obj:`numpy.ndarray`
+        res2_seq : list, tuple, :obj:`numpy.ndarray`
+        raw_score : list, tuple, :obj:`numpy.ndarray`
+        **kwargs
+           Any other field in :data:`FIELD_NAMES`
+
+        Raises
+        ------
+        ValueError
+           Unknown column provided
+        ValueError
+           Columns differ in length
+
+        """
+        kwargs.update(res1_seq=res1_seq, res2_seq=res2_seq, raw_score=raw_score)
+        unknown = set(kwargs) - set(FIELD_NAMES)
+        if unknown:
+            raise ValueError("Unknown column(s): {}".format(", ".join(sorted(unknown))))
+
+        nrows = len(res1_seq)
+        columns = {}
+        for name, dtype, default in _FIELDS:
+            values = kwargs.get(name)
+            if values is None:
+                columns[name] = _broadcast(default, dtype, nrows)
+                continue
+            array = np.array(values, dtype=dtype)
+            if array.ndim == 0:
+                array = _broadcast(array, dtype, nrows)
+            elif array.shape != (nrows, ):
+                raise ValueError("Column {} has {} rows, expected {}".format(name, array.shape[0], nrows))
+            columns[name] = array
+        return cls(**columns)
+
+    @classmethod
+    def from_contacts(cls, contacts):
+        """Create a new storage from :obj:`Contact <conkit.core.contact.Contact>` instances"""
+        contacts = list(contacts)
+        return cls.create(**{name: [getattr(c, name) for c in contacts] for name in FIELD_NAMES})
+
+    def copy(self):
+        """A new storage sharing all arrays with this one"""
+        return self.__class__(**{name: getattr(self, name) for name in FIELD_NAMES})
+
+    def replace(self, **columns):
+        """A new storage with some of the columns exchanged
+
+        Parameters
+        ----------
+        **columns
+           The new array for each field in :data:`FIELD_NAMES` to replace
+
+        """
+        new = {name: getattr(self, name) for name in FIELD_NAMES}
+        for name, values in columns.items():
+            new[name] = np.asarray(values, dtype=_DTYPES[name])
+        replacement = self.__class__(**new)
+        if 'res1_seq' not in columns and 'res2_seq' not in columns:
+            replacement._index = self._index
+        return replacement
+
+    def take(self, key):
+        """A new storage of the rows selected by ``key``
+
+        Parameters
+        ----------
+        key : slice, :obj:`numpy.ndarray`
+           A slice, boolean mask or array of row indices
+
+           Slices return views sharing memory with this storage.
+
+        """
+        if not isinstance(key, slice):
+            key = np.asarray(key)
+            if key.dtype == np.bool_:
+                key = np.flatnonzero(key)
+        nrows = len(range(*key.indices(len(self)))) if isinstance(key, slice) else key.shape[0]
+        columns = {}
+        for name in FIELD_NAMES:
+            array = getattr(self, name)
+            if array.strides == (0, ):
+                columns[name] = np.broadcast_to(array[:1], (nrows, ))
+            else:
+                columns[name] = array[key]
+        return self.__class__(**columns)
+
+    def order(self, name, reverse=False):
+        """The row indices sorting the storage by column ``name``
+
+        The sort is stable, also in reverse order.
+
+        """
+        values = getattr(self, name)
+        if reverse:
+            order = np.argsort(values[::-1], kind='mergesort')
+            return (len(self) - 1 - order)[::-1]
+        return np.argsort(values, kind='mergesort')
+
+    def to_contacts(self):
+        """Materialise the storage as :obj:`Contact <conkit.core.contact.Contact>` instances
+
+        Returns
+        -------
+        list
+           A list of :obj:`Contact <conkit.core.contact.Contact>` instances without parent
+
+        """
+        states = {s.value: s for s in ContactMatchState}
+        columns = [getattr(self, name).tolist() for name in FIELD_NAMES]
+        contacts = []
+        for res1_seq, res2_seq, raw_score, res1_altseq, res2_altseq, res1, res2, res1_chain, res2_chain, \
+                scalar_score, status, weight, lower_bound, upper_bound in zip(*columns):
+            # Skip the property setters, all values were validated when the columns were created
+            contact = Contact.__new__(Contact)
+            contact._id = (res1_seq, res2_seq)
+            contact._parent = None
+            contact._child_list = []
+            contact._child_dict = {}
+            contact._removed = None
+            contact._distance_bound = [lower_bound, upper_bound]
+            contact._raw_score = raw_score
+            contact._res1 = res1
+            contact._res2 = res2
+            contact._res1_chain = res1_chain
+            contact._res2_chain = res2_chain
+            contact._res1_seq = res1_seq
+            contact._res2_seq = res2_seq
+            contact._res1_altseq = res1_altseq
+            contact._res2_altseq = res2_altseq
+            contact._scalar_score = scalar_score
+            contact._status = states[status]
+            contact._weight = weight
+            contacts.append(contact)
+        return contacts
+
+
+def _broadcast(value, dtype, nrows):
+    """Create a zero-stride array of ``nrows`` repeating ``value``"""
+    return np.broadcast_to(np.array(value, dtype=dtype), (nrows, ))
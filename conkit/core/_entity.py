@@ -68,8 +68,13 @@ class _Entity(object):
     It is strongly advised against the use of the :obj:`Entity <conkit.core.Entity>` class directly.
     Instead, use one or more of the the remaining data models.
 
+    Removing a child only deletes it from the ``child_dict`` and remembers it as removed. The
+    ``child_list`` is compacted in a single pass the next time it is accessed, so removing
+    many children one at a time is not quadratic. The set of removed children is only
+    created by the first removal, so entities without removals do not pay for it.
+
     """
-    __slots__ = ['_id', '_parent', '_child_list', '_child_dict']
+    __slots__ = ['_id', '_parent', '_child_list', '_child_dict', '_removed']
 
     def __init__(self, id):
         """Initialise a generic :obj:`Entity <conkit.core.Entity>`
@@ -84,6 +89,7 @@ class _Entity(object):
         self._parent = None
         self._child_list = []
         self._child_dict = {}
+        self._removed = None
         self.id = id
 
     def __contains__(self, id):
@@ -94,18 +100,15 @@ class _Entity(object):
         """Remove a child with given id"""
         child = self[id]
         child.parent = None
-        self.child_dict.pop(id)
-        self.child_list.remove(child)
+        self.child_dict.pop(child.id if isinstance(id, int) else id)
+        if self._removed is None:
+            self._removed = set()
+        self._removed.add(child)
 
     def __getitem__(self, id):
         """Return the child with the given id"""
         if isinstance(id, slice):
-            indexes_to_keep = set(range(*id.indices(len(self))))
-            copy_to_return = self.copy()
-            for i, child in enumerate(self):
-                if i not in indexes_to_keep:
-                    copy_to_return.remove(child.id)
-            return copy_to_return
+            return self._copy_with(self.child_list[id])
         elif isinstance(id, int):
             return self.child_list[id]
         else:
@@ -118,7 +121,7 @@ class _Entity(object):
 
     def __len__(self):
         """Return the number of children"""
-        return len(self.child_list)
+        return len(self._child_list) - (len(self._removed) if self._removed else 0)
 
     def __reversed__(self):
         """Reversed list of the children"""
@@ -144,6 +147,9 @@ class _Entity(object):
     @property
     def child_list(self):
         """A list storing the child entities"""
+        if self._removed:
+            self._child_list = [c for c in self._child_list if c not in self._removed]
+            self._removed = None
         return self._child_list
 
     @child_list.setter
@@ -152,10 +158,11 @@ class _Entity(object):
 
         Parameters
         ----------
-        child_list : dict
+        child_list : list
 
         """
         self._child_list = child_list
+        self._removed = None
 
     @property
     def full_id(self):
@@ -225,10 +232,14 @@ class _Entity(object):
     def top(self):
         """The first child in the :obj:`Entity <conkit.core.Entity>`"""
         if len(self) > 0:
-            return self._child_list[0]
+            return self.child_list[0]
         else:
             return None
 
+    def _child_modified(self):
+        """Hook called by a child that was modified in place"""
+        pass
+
     def _inplace(self, inplace):
         """Modify the current version using a copy
 
@@ -244,7 +255,7 @@ class _Entity(object):
 
     def _sort(self, kword, reverse):
         """Sort the :obj:`Entity <conkit.core.Entity>`"""
-        if any(not hasattr(e, kword) for e in self._child_list):
+        if any(not hasattr(e, kword) for e in self.child_list):
             raise ValueError('Attribute not defined')
         self.child_list.sort(key=operator.attrgetter(kword), reverse=reverse)
 
@@ -262,30 +273,63 @@ class _Entity(object):
         self.child_list.append(entity)
         self.child_dict[entity.id] = entity
 
-    def copy(self):
-        """Create a shallow copy of :obj:`Entity <conkit.core.Entity>`"""
+    def _copy_with(self, children):
+        """Create a shallow copy of :obj:`Entity <conkit.core.Entity>` holding copies of ``children`` only"""
         shallow = copy.copy(self)
 
         shallow.child_list = []
         shallow.child_dict = {}
         shallow.parent = None
 
-        for child in self:
+        for child in children:
             shallow.add(child.copy())
         return shallow
 
+    def copy(self):
+        """Create a shallow copy of :obj:`Entity <conkit.core.Entity>`"""
+        return self._copy_with(self)
+
     def deepcopy(self):
         """Create a deep copy of :obj:`Entity <conkit.core.Entity>`"""
-        deep = copy.deepcopy(self)
-
-        deep.child_list = []
-        deep.child_dict = {}
-        deep.parent = None
+        # Pre-seed the memo so that neither the parent nor the children are deep-copied only to be discarded
+        memo = {id(self._parent): None, id(self._child_list): [], id(self._child_dict): {}, id(self._removed): None}
+        deep = copy.deepcopy(self, memo)
 
         for child in self:
             deep.add(child.copy())
         return deep
 
+    def keep(self, mask):
+        """Keep only the children selected by ``mask``
+
+        All other children are removed in a single pass.
+
+        Parameters
+        ----------
+        mask : list, tuple, :obj:`numpy.ndarray`
+           A boolean for each child in ``child_list`` order
+
+        Raises
+        ------
+        ValueError
+           The mask does not match the number of children
+
+        """
+        children = self.child_list
+        if len(mask) != len(children):
+            raise ValueError("Mask of length {} does not match {} children".format(len(mask), len(children)))
+        kept = []
+        for child, keep in zip(children, mask):
+            if keep:
+                kept.append(child)
+            else:
+                child.parent = None
+        if len(kept) == len(children):
+            return
+        kept_set = set(kept)
+        self._child_dict = {k: v for k, v in self._child_dict.items() if v in kept_set}
+        self._child_list = kept
+
     def remove(self, id):
         """Remove a child
 
@@ -300,3 +344,23 @@ class _Entity(object):
 
         """
         del self[id]
+
+    def remove_many(self, ids):
+        """Remove several children
+
+        Parameters
+        ----------
+        ids : list, tuple, set
+           The ids of the children to remove
+
+        Raises
+        ------
+        KeyError
+           A child with one of the ids does not exist
+
+        """
+        ids = set(tuple(i) if isinstance(i, list) else i for i in ids)
+        for i in ids:
+            if i not in self.child_dict:
+                raise KeyError(i)
+        self.keep([c.id not in ids for c in self.child_list])
@@ -0,0 +1,431 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-18, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Vectorised kernels for the alignment statistics of a :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+__version__ = "1.0"
+
+import multiprocessing
+import numpy as np
+
+# The default memory budget in MB for the intermediate matrices of pairwise sequence comparisons
+MEMORY_LIMIT = 256
+
+
+def identity_threshold(seq_len, identity):
+    """The minimum number of identical positions for two sequences to be similar
+
+    Two sequences are similar if the fraction of differing positions is below ``1 - identity``.
+    The fraction is evaluated like a Hamming distance, so that the boundary cases match
+    :func:`scipy.spatial.distance.cdist`.
+
+    Parameters
+    ----------
+    seq_len : int
+       The length of the aligned sequences
+    identity : float
+       The sequence identity threshold
+
+    Returns
+    -------
+    int
+
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        similar = np.flatnonzero(np.arange(seq_len + 1) / seq_len < 1 - identity)
+    return int(seq_len - similar[-1]) if similar.size > 0 else seq_len + 1
+
+
+def one_hot(matrix, symbols):
+    """Encode a 2-D matrix in a one-hot :obj:`numpy.ndarray` with one block of columns per symbol
+
+    Parameters
+    ----------
+    matrix : :obj:`numpy.ndarray`
+       A 2-D matrix
+    symbols : :obj:`numpy.ndarray`
+       The symbols to encode
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       A ``float32`` matrix of shape ``(nrows, ncols * len(symbols))``
+
+    """
+    nrows, ncols = matrix.shape
+    encoded = np.empty((nrows, ncols * len(symbols)), dtype=np.float32)
+    for k, symbol in enumerate(symbols):
+        encoded[:, k * ncols:(k + 1) * ncols] = matrix == symbol
+    return encoded
+
+
+def neighbor_counts(matrix, identity, memory_limit=MEMORY_LIMIT, nproc=1):
+    """Count the similar sequences of each sequence in an alignment, including the sequence itself
+
+    The identical positions of all pairs of sequences are counted by multiplying one-hot
+    encoded tiles of the alignment, so the comparison runs in (multi-threaded) BLAS. Tiles
+    are sized such that two encoded tiles and their product fit in ``memory_limit`` MB, and
+    only tiles on or above the diagonal are compared.
+
+    Parameters
+    ----------
+    matrix : :obj:`numpy.ndarray`
+       The alignment as 2-D matrix of residue codes
+    identity : float
+       The sequence identity threshold
+    memory_limit : int, optional
+       The memory budget in MB [default: 256]
+    nproc : int, optional
+       The number of processes to distribute the tiles across [default: 1]
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The number of similar sequences for each sequence
+
+    """
+    nseq, seq_len = matrix.shape
+    if nseq == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    symbols = np.unique(matrix)
+    threshold = identity_threshold(seq_len, identity)
+    tile = tile_size(nseq, seq_len * symbols.shape[0], memory_limit)
+    starts = list(range(0, nseq, tile))
+
+    if nproc > 1 and len(starts) > 1:
+        pool = multiprocessing.Pool(min(nproc, len(starts)))
+        try:
+            # Tiles further down the alignment have fewer tiles right of the diagonal, so deal them out in turn
+            jobs = [
+                pool.apply_async(_count_tiles, (matrix, symbols, threshold, tile, starts[i::nproc]))
+                for i in range(min(nproc, len(starts)))
+            ]
+            counts = sum(job.get() for job in jobs)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        counts = _count_tiles(matrix, symbols, threshold, tile, starts)
+    return counts
+
+
+def extend_neighbor_counts(counts, matrix, identity, memory_limit=MEMORY_LIMIT):
+    """Update the similar sequence counts of an alignment after sequences were appended
+
+    Only the appended sequences are compared, against all sequences, so appending ``k`` to ``N``
+    sequences costs ``k * (N + k)`` rather than ``(N + k) ** 2`` comparisons.
+
+    Parameters
+    ----------
+    counts : :obj:`numpy.ndarray`
+       The number of similar sequences for each sequence before the sequences were appended
+    matrix : :obj:`numpy.ndarray`
+       The alignment including the appended sequences as 2-D matrix of residue codes
+    identity : float
+       The sequence identity threshold
+    memory_limit : int, optional
+       The memory budget in MB [default: 256]
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The number of similar sequences for each sequence
+
+    """
+    nold = counts.shape[0]
+    nseq, seq_len = matrix.shape
+    extended = np.zeros(nseq, dtype=np.int64)
+    extended[:nold] = counts
+    if nseq == nold:
+        return extended
+
+    # Symbols absent from the appended sequences do not add to any of their identities
+    symbols = np.unique(matrix[nold:])
+    threshold = identity_threshold(seq_len, identity)
+    tile = tile_size(nseq, seq_len * symbols.shape[0], memory_limit)
+    for i in range(nold, nseq, tile):
+        rows = one_hot(matrix[i:i + tile], symbols)
+        for j in range(0, i, tile):
+            end = min(j + tile, i)
+            similar = np.dot(rows, one_hot(matrix[j:end], symbols).T) >= threshold
+            extended[i:i + tile] += similar.sum(axis=1)
+            extended[j:end] += similar.sum(axis=0)
+        extended[i:i + tile] += (np.dot(rows, rows.T) >= threshold).sum(axis=1)
+    return extended
+
+
+def query_neighbor_counts(queries, matrix, identity, memory_limit=MEMORY_LIMIT):
+    """Count the similar sequences in an alignment for each of the ``queries``
+
+    Parameters
+    ----------
+    queries : :obj:`numpy.ndarray`
+       The query sequences as 2-D matrix of residue codes
+    matrix : :obj:`numpy.ndarray`
+       The alignment as 2-D matrix of residue codes
+    identity : float
+       The sequence identity threshold
+    memory_limit : int, optional
+       The memory budget in MB [default: 256]
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The number of similar sequences in ``matrix`` for each query
+
+    """
+    nqueries, seq_len = queries.shape
+    counts = np.zeros(nqueries, dtype=np.int64)
+    if nqueries == 0 or matrix.shape[0] == 0:
+        return counts
+
+    # Symbols absent from the queries do not add to any of their identities
+    symbols = np.unique(queries)
+    threshold = identity_threshold(seq_len, identity)
+    tile = tile_size(max(nqueries, matrix.shape[0]), seq_len * symbols.shape[0], memory_limit)
+    for i in range(0, nqueries, tile):
+        rows = one_hot(queries[i:i + tile], symbols)
+        for j in range(0, matrix.shape[0], tile):
+            columns = one_hot(matrix[j:j + tile], symbols)
+            counts[i:i + tile] += (np.dot(rows, columns.T) >= threshold).sum(axis=1)
+    return counts
+
+
+def greedy_filter(matrix, min_id, max_id, memory_limit=MEMORY_LIMIT, nproc=1):
+    """Select a non-redundant subset of an alignment by greedy clustering
+
+    Sequences are visited in order, and a sequence is kept if its identity to the first (query)
+    sequence is at least ``min_id`` and its identity to every previously kept sequence is at
+    most ``max_id``. This is the strategy of HHfilter and CD-HIT without k-mer heuristics.
+
+    The sequences are processed in blocks. Each block is compared to the kept sequences, and the
+    sequences of a block that survive are then resolved against each other. Rejected sequences
+    are never compared again.
+
+    Parameters
+    ----------
+    matrix : :obj:`numpy.ndarray`
+       The alignment as 2-D matrix of residue codes
+    min_id : float
+       The minimum sequence identity to the first sequence
+    max_id : float
+       The maximum sequence identity between kept sequences
+    memory_limit : int, optional
+       The memory budget in MB [default: 256]
+    nproc : int, optional
+       The number of processes to compare the blocks to the kept sequences [default: 1]
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       A boolean mask of the kept sequences
+
+    """
+    nseq, seq_len = matrix.shape
+    keep = np.zeros(nseq, dtype=bool)
+    if nseq == 0:
+        return keep
+
+    # The identity is evaluated like a Hamming distance so that the boundary cases match scipy.spatial.distance.cdist
+    with np.errstate(divide='ignore', invalid='ignore'):
+        identities = 1 - (seq_len - np.arange(seq_len + 1)) / seq_len
+    min_matches = _first_true(identities >= min_id, seq_len)
+    max_matches = _first_true(identities > max_id, seq_len)
+
+    symbols = np.unique(matrix)
+    tile = tile_size(nseq, seq_len * symbols.shape[0], memory_limit)
+
+    query = one_hot(matrix[:1], symbols)
+    candidates = np.zeros(nseq, dtype=bool)
+    for i in range(0, nseq, tile):
+        candidates[i:i + tile] = np.dot(one_hot(matrix[i:i + tile], symbols), query.T)[:, 0] >= min_matches
+    candidates[0] = True
+
+    pool = multiprocessing.Pool(nproc) if nproc > 1 else None
+    try:
+        kept = np.zeros(0, dtype=np.int64)
+        for i in range(0, nseq, tile):
+            block = i + np.flatnonzero(candidates[i:i + tile])
+            if block.size == 0:
+                continue
+            block = block[~_similar_to_any(matrix, block, kept, symbols, max_matches, tile, pool)]
+            if block.size == 0:
+                continue
+            rows = one_hot(matrix[block], symbols)
+            similar = np.dot(rows, rows.T) >= max_matches
+            rejected = np.zeros(block.size, dtype=bool)
+            for j in range(block.size):
+                if not rejected[j]:
+                    rejected[j + 1:] |= similar[j, j + 1:]
+            kept = np.concatenate((kept, block[~rejected]))
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    keep[kept] = True
+    return keep
+
+
+def profile(states, nstates, weights):
+    """Calculate the weighted frequencies of the states in each column of an alignment
+
+    Parameters
+    ----------
+    states : :obj:`numpy.ndarray`
+       The alignment as 2-D matrix of states between ``0`` and ``nstates - 1``
+    nstates : int
+       The number of states
+    weights : :obj:`numpy.ndarray`
+       The weight of each sequence
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The frequencies of shape ``(ncols, nstates)``
+
+    """
+    frequencies = np.empty((states.shape[1], nstates), dtype=np.float64)
+    for k in range(nstates):
+        frequencies[:, k] = np.dot(weights, states == k)
+    return frequencies / weights.sum()
+
+
+def pair_frequencies(states, nstates, weights, memory_limit=MEMORY_LIMIT):
+    """Calculate the weighted frequencies of the state pairs in each pair of columns of an alignment
+
+    Parameters
+    ----------
+    states : :obj:`numpy.ndarray`
+       The alignment as 2-D matrix of states between ``0`` and ``nstates - 1``
+    nstates : int
+       The number of states
+    weights : :obj:`numpy.ndarray`
+       The non-negative weight of each sequence
+    memory_limit : int, optional
+       The memory budget in MB for the encoded chunks, excluding the result [default: 256]
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The frequencies of shape ``(ncols, ncols, nstates, nstates)``
+
+    """
+    ncols = states.shape[1]
+    frequencies = pair_frequency_matrix(states, nstates, weights, memory_limit=memory_limit)
+    return frequencies.reshape(nstates, ncols, nstates, ncols).transpose(1, 3, 0, 2)
+
+
+def pair_frequency_matrix(states, nstates, weights, memory_limit=MEMORY_LIMIT):
+    """Calculate the weighted frequencies of the state pairs as a 2-D matrix
+
+    The sequences are one-hot encoded in chunks of rows that fit ``memory_limit``, and the
+    products of the chunks with themselves are accumulated. States outside ``0`` to
+    ``nstates - 1`` are not counted.
+
+    Parameters
+    ----------
+    states : :obj:`numpy.ndarray`
+       The alignment as 2-D matrix of states
+    nstates : int
+       The number of states
+    weights : :obj:`numpy.ndarray`
+       The non-negative weight of each sequence
+    memory_limit : int, optional
+       The memory budget in MB for the encoded chunks, excluding the result [default: 256]
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The frequencies of shape ``(nstates * ncols, nstates * ncols)``, where the state ``a``
+       in column ``i`` is indexed by ``a * ncols + i``
+
+    """
+    nseq, ncols = states.shape
+    width = ncols * nstates
+    symbols = np.arange(nstates)
+    chunk = max(1, min(nseq, int(memory_limit * 1024 ** 2 / (4 * width)))) if width > 0 else max(nseq, 1)
+    frequencies = np.zeros((width, width), dtype=np.float64)
+    for i in range(0, nseq, chunk):
+        # Scale by the square root of the weights so that the product with itself is symmetric
+        encoded = one_hot(states[i:i + chunk], symbols)
+        encoded *= np.sqrt(weights[i:i + chunk], dtype=np.float32)[:, np.newaxis]
+        frequencies += np.dot(encoded.T, encoded)
+    frequencies /= weights.sum()
+    return frequencies
+
+
+def tile_size(nrows, width, memory_limit):
+    """The number of rows per tile so that two ``float32`` tiles of ``width`` columns and their product fit the budget"""
+    budget = memory_limit * 1024 ** 2 / 4
+    # Solve tile ** 2 + 2 * width * tile <= budget for tile
+    tile = int(-width + np.sqrt(width ** 2 + budget))
+    return max(1, min(nrows, tile))
+
+
+def _count_tiles(matrix, symbols, threshold, tile, starts):
+    """Count the similar sequences from the comparisons of the tiles at ``starts`` and all tiles right of them"""
+    nseq = matrix.shape[0]
+    counts = np.zeros(nseq, dtype=np.int64)
+    for i in starts:
+        rows = one_hot(matrix[i:i + tile], symbols)
+        for j in range(i, nseq, tile):
+            columns = rows if j == i else one_hot(matrix[j:j + tile], symbols)
+            similar = np.dot(rows, columns.T) >= threshold
+            counts[i:i + tile] += similar.sum(axis=1)
+            if j != i:
+                counts[j:j + tile] += similar.sum(axis=0)
+    return counts
+
+
+def _first_true(array, default):
+    """The index of the first true element in ``array`` or ``default + 1`` if there is none"""
+    indices = np.flatnonzero(array)
+    return int(indices[0]) if indices.size > 0 else default + 1
+
+
+def _similar_to_any(matrix, rows, others, symbols, threshold, tile, pool):
+    """Flag the ``rows`` of ``matrix`` with at least ``threshold`` identical positions to any of the ``others``"""
+    args = [(matrix[rows], matrix[others[j:j + tile]], symbols, threshold) for j in range(0, others.shape[0], tile)]
+    if pool is None:
+        flags = [_similar_block(*a) for a in args]
+    else:
+        flags = [job.get() for job in [pool.apply_async(_similar_block, a) for a in args]]
+    return np.logical_or.reduce(flags, axis=0) if flags else np.zeros(rows.shape[0], dtype=bool)
+
+
+def _similar_block(rows, others, symbols, threshold):
+    """Flag the ``rows`` with at least ``threshold`` identical positions to any of the ``others``"""
+    return (np.dot(one_hot(rows, symbols), one_hot(others, symbols).T) >= threshold).any(axis=1)
@@ -39,15 +39,17 @@ __date__ = "03 Aug 2016"
 __version__ = "1.0"
 
 import collections
+import copy
 import numpy as np
 import sys
 
 if sys.version_info.major < 3:
     from itertools import izip as zip
 
+from conkit.core._columns import FIELD_NAMES, _ContactColumns
 from conkit.core._entity import _Entity
 from conkit.core._struct import _Gap, _Residue
-from conkit.core.contact import ContactMatchState
+from conkit.core.contact import Contact, ContactMatchState
 from conkit.core.sequence import Sequence
 from conkit.misc import normalize
 
@@ -61,6 +63,8 @@ class ContactMap(_Entity):
 
     Attributes
     ----------
+    columnar : bool
+       A boolean status for the column storage backend
     coverage : float
        The sequence coverage score
     id : str
@@ -92,17 +96,86 @@ class ContactMap(_Entity):
     >>> print(contact_map)
     ContactMap(id="example" ncontacts=2)
 
+    Notes
+    -----
+    A :obj:`ContactMap <conkit.core.contactmap.ContactMap>` can store its contacts in NumPy
+    columns instead of individual :obj:`Contact <conkit.core.contact.Contact>` instances (see
+    :func:`to_columnar`). Filtering, sorting, slicing and scoring then run as vectorised
+    operations. :obj:`Contact <conkit.core.contact.Contact>` instances are only created once
+    they are requested, e.g. by iterating over the map or by accessing a single contact, after
+    which the map falls back to storing them individually.
+
     """
-    __slots__ = ['_sequence']
+    __slots__ = ['_sequence', '_columns']
 
     def __init__(self, id):
         """Initialise a new contact map"""
         self._sequence = None
+        self._columns = None
         super(ContactMap, self).__init__(id)
 
+    def __contains__(self, id):
+        """True if there is a child element with the given id"""
+        if self.columnar:
+            return id in self._columns.index
+        return super(ContactMap, self).__contains__(id)
+
+    def __getitem__(self, id):
+        """Return the child with the given id"""
+        if self.columnar and isinstance(id, slice):
+            return self._from_columns(self._columns.take(id))
+        return super(ContactMap, self).__getitem__(id)
+
+    def __len__(self):
+        """Return the number of children"""
+        if self.columnar:
+            return len(self._columns)
+        return super(ContactMap, self).__len__()
+
     def __repr__(self):
         return "{0}(id=\"{1}\", ncontacts={2})".format(self.__class__.__name__, self.id, self.ncontacts)
 
+    @property
+    def child_dict(self):
+        """A dictionary storing the child entities"""
+        self._materialize()
+        return self._child_dict
+
+    @child_dict.setter
+    def child_dict(self, child_dict):
+        """Define a dictionary storing the child entities
+
+        Parameters
+        ----------
+        child_dict : dict
+
+        """
+        self._columns = None
+        self._child_dict = child_dict
+
+    @property
+    def child_list(self):
+        """A list storing the child entities"""
+        self._materialize()
+        return _Entity.child_list.fget(self)
+
+    @child_list.setter
+    def child_list(self, child_list):
+        """Define a list storing the child entities
+
+        Parameters
+        ----------
+        child_list : list
+
+        """
+        self._columns = None
+        _Entity.child_list.fset(self, child_list)
+
+    @property
+    def columnar(self):
+        """A boolean status for the column storage backend"""
+        return self._columns is not None
+
     @property
     def coverage(self):
         """The sequence coverage score
@@ -232,7 +305,10 @@ class ContactMap(_Entity):
 
         import warnings
 
-        s = np.array([c.status for c in self])
+        if self.columnar:
+            s = self._columns.status
+        else:
+            s = np.array([c.status for c in self])
         cdict = dict(zip(np.unique(s), np.array([s[s == i].shape[0] for i in np.unique(s)])))
         fp_count = cdict[ContactMatchState.mismatched.value] if ContactMatchState.mismatched.value in cdict else 0.0
         uk_count = cdict[ContactMatchState.unknown.value] if ContactMatchState.unknown.value in cdict else 0.0
@@ -316,20 +392,12 @@ class ContactMap(_Entity):
         -------
         :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
 
+        See Also
+        --------
+        cluster_labels, remove_isolated
+
         """
-        maxd = 2
-        contacts = np.asarray(self.as_list())
-        iterator = np.arange(self.ncontacts)
-        removables = set()
-        for i in iterator:
-            for j in iterator[i + 1:]:
-                dist = np.abs(contacts[i] - contacts[j])
-                if dist[0] <= maxd and dist[1] <= maxd:
-                    removables.add(tuple(contacts[i]))
-                    removables.add(tuple(contacts[j]))
-        singletons = self.deepcopy()
-        [singletons.remove(i) for i in removables]
-        return singletons
+        return self._select(~self._isolated_mask(2, 1, False))
 
     @property
     def sequence(self):
@@ -399,7 +467,10 @@ class ContactMap(_Entity):
            Use the res_altloc positions [default: False]
 
         """
-        if altloc:
+        if self.columnar:
+            res1_seqs, res2_seqs = self._get_register(altloc)
+            return np.column_stack((res1_seqs, res2_seqs)).tolist()
+        elif altloc:
             return [[c.res1_altseq, c.res2_altseq] for c in self]
         else:
             return [[c.res1_seq, c.res2_seq] for c in self]
@@ -413,6 +484,14 @@ class ContactMap(_Entity):
            Use the res_altloc positions [default: False]
 
         """
+        if self.columnar:
+            sequence = np.array(list(self.sequence.seq))
+            res1_seqs, res2_seqs = self._get_register(altloc)
+            res1s, res2s = sequence[res1_seqs - 1], sequence[res2_seqs - 1]
+            for amino_acid in np.unique(np.concatenate((res1s, res2s))):
+                Contact._set_residue(amino_acid)
+            self._columns = self._columns.replace(res1=res1s, res2=res2s)
+            return
         for c in self:
             if altloc:
                 res1_index = c.res1_altseq
@@ -553,11 +632,91 @@ class ContactMap(_Entity):
            *Elife* **4**, e09248.
 
         """
+        if self.columnar:
+            raw_scores = self._columns.raw_score
+            self._columns = self._columns.replace(scalar_score=raw_scores / np.mean(raw_scores))
+            return
         raw_scores = np.array([c.raw_score for c in self])
         sca_scores = raw_scores / np.mean(raw_scores)
         for contact, sca_score in zip(self, sca_scores):
             contact.scalar_score = sca_score
 
+    def cluster_labels(self, radius=2, altloc=False):
+        """Group the contact pairs into clusters of neighbors
+
+        Two contact pairs are neighbors if both their residues are at most ``radius``
+        residues apart. A cluster contains all contact pairs connected through neighbors.
+
+        Parameters
+        ----------
+        radius : int, optional
+           The maximum residue distance between neighboring contact pairs [default: 2]
+        altloc : bool, optional
+           Use the res_altloc positions [default: False]
+
+        Returns
+        -------
+        :obj:`numpy.ndarray`
+           The cluster label of each contact, numbered in order of first appearance
+
+        Raises
+        ------
+        ValueError
+           ``radius`` is negative
+
+        Notes
+        -----
+        Neighbors are found by looking up the ``(2 * radius + 1)^2`` surrounding residue pairs
+        of each contact in a sorted hash of all contact pairs, so this scales with ``N log N``
+        rather than comparing all pairs of contacts.
+
+        """
+        if radius < 0:
+            raise ValueError("Radius needs to be positive: {}".format(radius))
+        res1_seqs, res2_seqs = self._get_register(altloc=altloc)
+        if res1_seqs.shape[0] == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # Hash each residue pair to one integer, leaving a margin so that neighbors never wrap around
+        res1_seqs = res1_seqs - res1_seqs.min()
+        res2_seqs = res2_seqs - res2_seqs.min() + radius
+        width = int(res2_seqs.max()) + radius + 1
+        positions, inverse = np.unique(res1_seqs * width + res2_seqs, return_inverse=True)
+
+        # Connect each residue pair to its neighbors in the forward half of the neighborhood
+        edges1, edges2 = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        for i in range(radius + 1):
+            for j in range(-radius, radius + 1):
+                if i == 0 and j <= 0:
+                    continue
+                neighbors = positions + i * width + j
+                index = np.minimum(np.searchsorted(positions, neighbors), positions.shape[0] - 1)
+                found = np.flatnonzero(positions[index] == neighbors)
+                edges1.append(found)
+                edges2.append(index[found])
+        edges1 = np.concatenate(edges1)
+        edges2 = np.concatenate(edges2)
+
+        # Propagate the lowest index through each connected component
+        labels = np.arange(positions.shape[0])
+        while True:
+            lowest = np.minimum(labels[edges1], labels[edges2])
+            updated = labels.copy()
+            np.minimum.at(updated, edges1, lowest)
+            np.minimum.at(updated, edges2, lowest)
+            np.minimum.at(updated, labels[edges1], lowest)
+            np.minimum.at(updated, labels[edges2], lowest)
+            updated = updated[updated]
+            if np.array_equal(updated, labels):
+                break
+            labels = updated
+
+        # Number the clusters in the order of their first contact
+        roots, first, labels = np.unique(labels[inverse.ravel()], return_index=True, return_inverse=True)
+        ranks = np.empty_like(first)
+        ranks[np.argsort(first)] = np.arange(first.shape[0])
+        return ranks[labels.ravel()]
+
     def find(self, register, altloc=False, strict=False):
         """Find all contacts with one or both residues in ``register``
 
@@ -579,14 +738,173 @@ class ContactMap(_Entity):
         """
         if isinstance(register, int):
             register = [register]
-        register = set(register)
-        comparison_operator = _AND if strict else _OR
+        register = list(set(register))
+        res1_in, res2_in = (np.isin(r, register) for r in self._get_register(altloc))
         contact_map = self.deepcopy()
-        for contactid in self.as_list(altloc=altloc):
-            if not comparison_operator(contactid[0] in register, contactid[1] in register):
-                contact_map.remove(tuple(contactid))
+        contact_map.keep(res1_in & res2_in if strict else res1_in | res2_in)
         return contact_map
 
+    @classmethod
+    def from_arrays(cls, res1_seqs, res2_seqs, raw_scores, chains=None, bounds=None, id="map_1", **kwargs):
+        """Create a :obj:`ContactMap <conkit.core.contactmap.ContactMap>` from arrays of contact pairs
+
+        All values are validated at once and stored in NumPy columns, which avoids
+        creating and adding :obj:`Contact <conkit.core.contact.Contact>` instances one
+        at a time.
+
+        Parameters
+        ----------
+        res1_seqs : list, tuple, :obj:`numpy.ndarray`
+           The residue sequence numbers of residue 1
+        res2_seqs : list, tuple, :obj:`numpy.ndarray`
+           The residue sequence numbers of residue 2
+        raw_scores : list, tuple, :obj:`numpy.ndarray`
+           The covariance scores of the contact pairs
+        chains : tuple, optional
+           The chains of residue 1 and residue 2, each a :obj:`str` or one per contact
+        bounds : tuple, optional
+           The lower and upper distance bounds, each a :obj:`float` or one per contact
+        id : str, optional
+           The unique identifier [default: map_1]
+        **kwargs
+           Any other :obj:`Contact <conkit.core.contact.Contact>` attribute, e.g. ``res1``
+           or ``scalar_score``, as a single value or one per contact
+
+        Returns
+        -------
+        :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+
+        Raises
+        ------
+        TypeError
+           Residue sequence numbers are not integers
+        ValueError
+           A contact pair is defined twice
+        ValueError
+           Unknown amino acid
+        ValueError
+           Arrays differ in length
+
+        """
+        res1_seqs = np.asarray(res1_seqs)
+        res2_seqs = np.asarray(res2_seqs)
+        for res_seqs in (res1_seqs, res2_seqs):
+            if res_seqs.size > 0 and res_seqs.dtype.kind not in 'iu':
+                raise TypeError('Data type int required for res_seq')
+        if chains is not None:
+            kwargs['res1_chain'], kwargs['res2_chain'] = chains
+        if bounds is not None:
+            kwargs['lower_bound'], kwargs['upper_bound'] = bounds
+        for name in ('res1', 'res2'):
+            if name not in kwargs:
+                continue
+            amino_acids = np.asarray(kwargs[name], dtype=np.str_)
+            if amino_acids.ndim == 0:
+                kwargs[name] = Contact._set_residue(str(amino_acids))
+            else:
+                unique, inverse = np.unique(amino_acids, return_inverse=True)
+                converted = np.array([Contact._set_residue(a) for a in unique.tolist()], dtype='U1')
+                kwargs[name] = converted[inverse.ravel()]
+
+        columns = _ContactColumns.create(res1_seqs, res2_seqs, raw_scores, **kwargs)
+        order = np.lexsort((columns.res2_seq, columns.res1_seq))
+        res1_sorted, res2_sorted = columns.res1_seq[order], columns.res2_seq[order]
+        duplicates = np.flatnonzero((res1_sorted[1:] == res1_sorted[:-1]) & (res2_sorted[1:] == res2_sorted[:-1]))
+        if duplicates.size > 0:
+            raise ValueError("%s defined twice" % str((int(res1_sorted[duplicates[0]]), int(res2_sorted[duplicates[0]]))))
+
+        contact_map = cls(id)
+        contact_map._columns = columns
+        return contact_map
+
+    @classmethod
+    def from_matrix(cls, mat, min_separation=0, top=None, min_score=None, id="map_1"):
+        """Create a :obj:`ContactMap <conkit.core.contactmap.ContactMap>` from a square score matrix
+
+        Each cell ``mat[i, j]`` with ``i <= j`` in the upper triangle of the matrix
+        defines the score of the contact pair ``(i + 1, j + 1)``. The contacts are
+        ordered by decreasing score; ties remain in row-major order.
+
+        Parameters
+        ----------
+        mat : :obj:`numpy.ndarray`
+           A square matrix of contact scores
+        min_separation : int, optional
+           The minimum sequence separation ``j - i`` of a contact pair [default: 0]
+        top : int, optional
+           The maximum number of highest scoring contact pairs to include [default: all]
+        min_score : float, optional
+           The minimum score of a contact pair to include [default: all]
+        id : str, optional
+           The unique identifier [default: map_1]
+
+        Returns
+        -------
+        :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+
+        Raises
+        ------
+        ValueError
+           The matrix is not square
+
+        Notes
+        -----
+        Only the selected contact pairs are sorted. With ``top``, the matrix is scanned in
+        blocks of rows and only the candidates scoring at least as high as the running
+        N-th highest score are kept, so ``mat`` can be a :obj:`numpy.memmap` of which only
+        a few rows are held in memory at a time.
+
+        """
+        mat = np.asanyarray(mat)
+        if mat.ndim != 2 or mat.shape[0] != mat.shape[1]:
+            raise ValueError("Square matrix required, got shape {}".format(mat.shape))
+
+        if top is None:
+            mat = np.asarray(mat, dtype=np.float64)
+            res1_seqs, res2_seqs = np.triu_indices(mat.shape[0], k=max(min_separation, 0))
+            raw_scores = mat[res1_seqs, res2_seqs]
+            if min_score is not None:
+                selected = np.flatnonzero(raw_scores >= min_score)
+                res1_seqs, res2_seqs, raw_scores = res1_seqs[selected], res2_seqs[selected], raw_scores[selected]
+            order = np.argsort(-raw_scores, kind='mergesort')
+        else:
+            res1_seqs, res2_seqs, raw_scores = cls._top_candidates(mat, max(min_separation, 0), max(top, 0), min_score)
+            order = np.argsort(-raw_scores, kind='mergesort')[:top]
+
+        return cls.from_arrays(res1_seqs[order] + 1, res2_seqs[order] + 1, raw_scores[order], id=id)
+
+    @staticmethod
+    def _top_candidates(mat, min_separation, top, min_score, block_size=2 ** 20):
+        """The upper triangle cells of ``mat`` scoring at least as high as the ``top``-th highest score
+
+        The candidates are returned in row-major order, including all ties of the
+        ``top``-th highest score.
+
+        """
+        size = mat.shape[0]
+        cutoff = -np.inf if min_score is None else min_score
+        res1_seqs = np.zeros(0, dtype=np.int64)
+        res2_seqs = np.zeros(0, dtype=np.int64)
+        raw_scores = np.zeros(0, dtype=np.float64)
+        if top == 0:
+            return res1_seqs, res2_seqs, raw_scores
+
+        nrows = max(block_size // max(size, 1), 1)
+        columns = np.arange(size)
+        for start in range(0, max(size - min_separation, 0), nrows):
+            rows = np.arange(start, min(start + nrows, size))
+            block = np.asarray(mat[rows[0]:rows[-1] + 1], dtype=np.float64)
+            mask = (columns[np.newaxis, :] - rows[:, np.newaxis] >= min_separation) & (block >= cutoff)
+            block_rows, block_columns = np.nonzero(mask)
+            res1_seqs = np.concatenate([res1_seqs, block_rows + start])
+            res2_seqs = np.concatenate([res2_seqs, block_columns])
+            raw_scores = np.concatenate([raw_scores, block[block_rows, block_columns]])
+            if raw_scores.shape[0] > top:
+                cutoff = raw_scores[np.argpartition(-raw_scores, top - 1)[top - 1]]
+                selected = np.flatnonzero(raw_scores >= cutoff)
+                res1_seqs, res2_seqs, raw_scores = res1_seqs[selected], res2_seqs[selected], raw_scores[selected]
+        return res1_seqs, res2_seqs, raw_scores
+
     def match(self, other, match_other=False, remove_unmatched=False, renumber=False, inplace=False):
         """Modify both hierarchies so residue numbers match one another.
 
@@ -688,21 +1006,25 @@ class ContactMap(_Entity):
         # Adjust the res_altseq based on the insertions and deletions
         contact_map2 = ContactMap._adjust(contact_map2, contact_map2_keymap)
 
-        # Get the residue list for matching UNKNOWNs
-        residues_map2 = tuple(i + 1 for i, a in enumerate(aligned_sequences_full[1].seq) if a != '-')
+        # Get the residue set for matching UNKNOWNs
+        residues_map2 = set(i + 1 for i, a in enumerate(aligned_sequences_full[1].seq) if a != '-')
+
+        # Residue lookup table from the reindexed altseq positions to the residue numbers in contact map 2
+        altseq_to_seq_map2 = dict((r.res_altseq, r.res_seq) for r in contact_map2_keymap)
 
         # Adjust true and false positive statuses
         for contact in contact_map1:
             _id = (contact.res1_seq, contact.res2_seq)
-            _id_alt = tuple(r.res_seq for r in contact_map2_keymap for i in _id if i == r.res_altseq)
+            # The keymap is ordered by altseq position, so the lookup follows the sorted residue order
+            _id_alt = tuple(altseq_to_seq_map2[i] for i in sorted(_id) if i in altseq_to_seq_map2)
 
             if any(i == _Gap.IDENTIFIER for i in _id_alt) and any(j not in residues_map2 for j in _id):
-                contact_map1[_id].define_unknown()
+                contact.define_unknown()
             elif all(i in residues_map2 for i in _id):
                 if _id_alt in contact_map2:
-                    contact_map1[_id].define_match()
+                    contact.define_match()
                 else:
-                    contact_map1[_id].define_mismatch()
+                    contact.define_mismatch()
             else:
                 msg = "Error matching two contact maps - this should never happen"
                 raise RuntimeError(msg)
@@ -711,9 +1033,7 @@ class ContactMap(_Entity):
         # 3. Remove unmatched contacts
         # ================================================================
         if remove_unmatched:
-            for contactid in contact_map1.as_list():
-                if contact_map1[tuple(contactid)].is_unknown:
-                    contact_map1.remove(tuple(contactid))
+            contact_map1.keep([not contact.is_unknown for contact in contact_map1])
 
         # ================================================================
         # 4. Renumber the contact map 1 based on contact map 2
@@ -723,6 +1043,68 @@ class ContactMap(_Entity):
 
         return contact_map1
 
+    def precision_curve(self, factors=None, ncontacts=None):
+        """Calculate the precision scores of the top contacts at several cutoffs
+
+        The precision scores of all cutoffs are derived from a single cumulative
+        sum over the contact statuses, which is considerably faster than slicing
+        the :obj:`ContactMap <conkit.core.contactmap.ContactMap>` for each cutoff.
+
+        Parameters
+        ----------
+        factors : list, tuple, :obj:`numpy.ndarray`, optional
+           The cutoffs as factors of the sequence length
+        ncontacts : list, tuple, :obj:`numpy.ndarray`, optional
+           The cutoffs as numbers of contacts
+
+        Returns
+        -------
+        list
+           The precision score at each cutoff
+
+        Raises
+        ------
+        TypeError
+           Sequence undefined
+        ValueError
+           Provide either ``factors`` or ``ncontacts``
+
+        See Also
+        --------
+        match, precision
+
+        """
+        if (factors is None) == (ncontacts is None):
+            raise ValueError("Provide either factors or ncontacts")
+        elif factors is not None:
+            if not isinstance(self.sequence, Sequence):
+                raise TypeError('Define the sequence as Sequence() instance')
+            ncontacts = (np.asarray(factors, dtype=np.float64) * self.sequence.seq_len).astype(np.int64)
+        ncontacts = np.clip(np.asarray(ncontacts, dtype=np.int64), 0, len(self))
+        if ncontacts.size == 0:
+            return []
+
+        import warnings
+
+        if self.columnar:
+            s = self._columns.status
+        else:
+            s = np.array([c.status for c in self], dtype=np.int8)
+        tp_counts = np.concatenate(([0], np.cumsum(s == ContactMatchState.matched.value)))[ncontacts]
+        fp_counts = np.concatenate(([0], np.cumsum(s == ContactMatchState.mismatched.value)))[ncontacts]
+
+        nmax = ncontacts.max()
+        if nmax > 0 and tp_counts.max() == 0 and fp_counts.max() == 0:
+            warnings.warn("No matches or mismatches found in your contact map. " "Match two ContactMaps first.")
+        elif np.any(s[:nmax] == ContactMatchState.unknown.value):
+            warnings.warn("Some contacts between the ContactMaps are unmatched due to non-identical "
+                          "sequences. The precision value might be inaccurate.")
+
+        counts = tp_counts + fp_counts
+        precisions = np.zeros(counts.shape, dtype=np.float64)
+        np.divide(tp_counts, counts, out=precisions, where=counts > 0)
+        return precisions.tolist()
+
     def reindex(self, index, altloc=False, inplace=False):
         """Re-index the :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
 
@@ -751,6 +1133,15 @@ class ContactMap(_Entity):
         contact_map = self._inplace(inplace)
         if contact_map.empty:
             return contact_map
+        if contact_map.columnar:
+            res1s, res2s = contact_map._get_register(altloc)
+            offset = res1s.min() - index
+            if altloc:
+                contact_map._columns = contact_map._columns.replace(
+                    res1_altseq=res1s - offset, res2_altseq=res2s - offset)
+            else:
+                contact_map._columns = contact_map._columns.replace(res1_seq=res1s - offset, res2_seq=res2s - offset)
+            return contact_map
         res1s, res2s = zip(*contact_map.as_list(altloc=altloc))
         offset = min(res1s) - index
         for contact in contact_map:
@@ -787,11 +1178,37 @@ class ContactMap(_Entity):
 
         """
         contact_map = self._inplace(inplace)
-        for contactid in contact_map.as_list():
-            if min_distance <= abs(contactid[1] - contactid[0]) <= max_distance:
-                continue
-            else:
-                contact_map.remove(tuple(contactid))
+        res1_seqs, res2_seqs = contact_map._get_register()
+        distances = np.abs(res2_seqs - res1_seqs)
+        contact_map.keep((min_distance <= distances) & (distances <= max_distance))
+        return contact_map
+
+    def remove_isolated(self, radius=2, max_cluster_size=1, altloc=False, inplace=False):
+        """Remove contacts in small clusters of neighboring contact pairs
+
+        Parameters
+        ----------
+        radius : int, optional
+           The maximum residue distance between neighboring contact pairs [default: 2]
+        max_cluster_size : int, optional
+           Remove contacts in clusters of up to this many contacts [default: 1]
+        altloc : bool, optional
+           Use the res_altloc positions [default: False]
+        inplace : bool, optional
+           Replace the saved order of contacts [default: False]
+
+        Returns
+        -------
+        obj
+           The reference to the :obj:`ContactMap <conkit.core.contactmap.ContactMap>`, regardless of inplace
+
+        See Also
+        --------
+        cluster_labels, singletons
+
+        """
+        contact_map = self._inplace(inplace)
+        contact_map.keep(contact_map._isolated_mask(radius, max_cluster_size, altloc))
         return contact_map
 
     def rescale(self, inplace=False):
@@ -810,12 +1227,19 @@ class ContactMap(_Entity):
         """
         contact_map = self._inplace(inplace)
 
-        raw_scores = np.array([c.raw_score for c in contact_map])
+        if contact_map.columnar:
+            raw_scores = contact_map._columns.raw_score
+        else:
+            raw_scores = np.array([c.raw_score for c in contact_map])
         norm_raw_scores = normalize(raw_scores)
 
         if np.isnan(norm_raw_scores).all():
             norm_raw_scores = np.where(norm_raw_scores == np.isnan, 0, 1)
 
+        if contact_map.columnar:
+            contact_map._columns = contact_map._columns.replace(raw_score=norm_raw_scores)
+            return contact_map
+
         for contact, norm_raw_score in zip(contact_map, norm_raw_scores):
             contact.raw_score = norm_raw_score
 
@@ -845,9 +1269,182 @@ class ContactMap(_Entity):
 
         """
         contact_map = self._inplace(inplace)
-        contact_map._sort(kword, reverse)
+        if contact_map.columnar and kword in FIELD_NAMES:
+            contact_map._columns = contact_map._columns.take(contact_map._columns.order(kword, reverse=reverse))
+        else:
+            contact_map._sort(kword, reverse)
+        return contact_map
+
+    def view(self, start=None, stop=None):
+        """A lightweight view of the contacts between ``start`` and ``stop``
+
+        The view shares the :obj:`Contact <conkit.core.contact.Contact>` instances with
+        this :obj:`ContactMap <conkit.core.contactmap.ContactMap>` instead of copying them,
+        so selecting the top ``N`` contacts costs ``O(N)`` regardless of the map size.
+
+        Parameters
+        ----------
+        start : int, optional
+           The index of the first contact to include [default: 0]
+        stop : int, optional
+           The index of the first contact to exclude [default: all]
+
+        Returns
+        -------
+        obj
+           A :obj:`ContactMap <conkit.core.contactmap.ContactMap>` view
+
+        Warnings
+        --------
+        The view is meant for read-only consumers. Modifying a contact in the view
+        also modifies it in this :obj:`ContactMap <conkit.core.contactmap.ContactMap>`.
+
+        """
+        if self.columnar:
+            return self[start:stop]
+        contact_map = self._from_columns(None)
+        contact_map._child_list = self.child_list[start:stop]
+        contact_map._child_dict = {contact.id: contact for contact in contact_map._child_list}
+        return contact_map
+
+    def to_columnar(self, inplace=False):
+        """Store the :obj:`ContactMap <conkit.core.contactmap.ContactMap>` in NumPy columns
+
+        Parameters
+        ----------
+        inplace : bool, optional
+           Replace the storage of the current contact map [default: False]
+
+        Returns
+        -------
+        obj
+           The reference to the :obj:`ContactMap <conkit.core.contactmap.ContactMap>`, regardless of inplace
+
+        Notes
+        -----
+        The contact identifiers are re-derived from ``res1_seq`` and ``res2_seq`` once the
+        contacts are materialised again.
+
+        """
+        if self.columnar:
+            return self._inplace(inplace)
+        columns = _ContactColumns.from_contacts(self.child_list)
+        if inplace:
+            for contact in self.child_list:
+                contact.parent = None
+            self._child_list = []
+            self._child_dict = {}
+            self._removed = None
+            self._columns = columns
+            return self
+        contact_map = self._from_columns(columns)
+        contact_map._sequence = copy.deepcopy(self._sequence)
+        return contact_map
+
+    def keep(self, mask):
+        """Keep only the contacts selected by ``mask``
+
+        Parameters
+        ----------
+        mask : list, tuple, :obj:`numpy.ndarray`
+           A boolean for each contact in the current order
+
+        Raises
+        ------
+        ValueError
+           The mask does not match the number of contacts
+
+        """
+        if not self.columnar:
+            return super(ContactMap, self).keep(mask)
+        if len(mask) != len(self):
+            raise ValueError("Mask of length {} does not match {} children".format(len(mask), len(self)))
+        self._columns = self._columns.take(np.asarray(mask, dtype=np.bool_))
+
+    def remove_many(self, ids):
+        """Remove several contacts
+
+        Parameters
+        ----------
+        ids : list, tuple, set
+           The ids of the contacts to remove
+
+        Raises
+        ------
+        KeyError
+           A contact with one of the ids does not exist
+
+        """
+        if not self.columnar:
+            return super(ContactMap, self).remove_many(ids)
+        ids = set(tuple(i) for i in ids)
+        for i in ids:
+            if i not in self._columns.index:
+                raise KeyError(i)
+        res1_seqs, res2_seqs = self._get_register()
+        self.keep([i not in ids for i in zip(res1_seqs.tolist(), res2_seqs.tolist())])
+
+    def copy(self):
+        """Create a shallow copy of :obj:`ContactMap <conkit.core.contactmap.ContactMap>`"""
+        if self.columnar:
+            return self._from_columns(self._columns)
+        return super(ContactMap, self).copy()
+
+    def deepcopy(self):
+        """Create a deep copy of :obj:`ContactMap <conkit.core.contactmap.ContactMap>`"""
+        if self.columnar:
+            deep = self._from_columns(self._columns)
+            deep._sequence = copy.deepcopy(self._sequence)
+            return deep
+        return super(ContactMap, self).deepcopy()
+
+    def _from_columns(self, columns):
+        """Create a new :obj:`ContactMap <conkit.core.contactmap.ContactMap>` with the same metadata stored in ``columns``
+
+        The column storage is never modified in place, so ``columns`` can be shared
+        with other instances. If ``columns`` is :obj:`None`, the new instance is empty.
+
+        """
+        contact_map = copy.copy(self)
+        contact_map._parent = None
+        contact_map._child_list = []
+        contact_map._child_dict = {}
+        contact_map._removed = None
+        contact_map._columns = columns
         return contact_map
 
+    def _get_register(self, altloc=False):
+        """The residue register of all contacts as two :obj:`numpy.ndarray`"""
+        if self.columnar and altloc:
+            return self._columns.res1_altseq, self._columns.res2_altseq
+        elif self.columnar:
+            return self._columns.res1_seq, self._columns.res2_seq
+        register = np.array(self.as_list(altloc=altloc), dtype=np.int64).reshape(-1, 2)
+        return register[:, 0], register[:, 1]
+
+    def _isolated_mask(self, radius, max_cluster_size, altloc):
+        """A mask selecting all contacts in clusters of more than ``max_cluster_size`` contacts"""
+        labels = self.cluster_labels(radius=radius, altloc=altloc)
+        return np.bincount(labels)[labels] > max_cluster_size
+
+    def _materialize(self):
+        """Convert the column storage into :obj:`Contact <conkit.core.contact.Contact>` instances"""
+        if self._columns is None:
+            return
+        contacts = self._columns.to_contacts()
+        self._columns = None
+        for contact in contacts:
+            contact.parent = self
+        self._child_list = contacts
+        self._child_dict = {contact.id: contact for contact in contacts}
+        self._removed = None
+
+    def _select(self, mask):
+        """A shallow copy of :obj:`ContactMap <conkit.core.contactmap.ContactMap>` with the contacts selected by ``mask``"""
+        if self.columnar:
+            return self._from_columns(self._columns.take(np.asarray(mask, dtype=bool)))
+        return self._copy_with([contact for contact, keep in zip(self.child_list, mask) if keep])
+
     @staticmethod
     def _adjust(contact_map, keymap):
         """Adjust res_altseq entries to insertions and deletions"""
@@ -916,10 +1513,17 @@ class ContactMap(_Entity):
     @staticmethod
     def _renumber(contact_map, self_keymap, other_keymap):
         """Renumber the contact map based on the mapping of self and other keymaps"""
+        # Index the contacts by residue once rather than scanning all of them for every residue
+        contacts_by_residue = collections.defaultdict(list)
+        for contact in contact_map:
+            contacts_by_residue[contact.id[0]].append(contact)
+            if contact.id[1] != contact.id[0]:
+                contacts_by_residue[contact.id[1]].append(contact)
+
         for self_residue, other_residue in zip(self_keymap, other_keymap):
             if isinstance(self_residue, _Gap):
                 continue
-            for contact in ContactMap._find_single(contact_map, self_residue.res_seq):
+            for contact in contacts_by_residue.get(self_residue.res_seq, []):
                 # Make sure we check with the ID, which doesn't change
                 if contact.id[0] == self_residue.res_altseq:
                     contact.res1_seq = other_residue.res_seq
@@ -931,11 +1535,3 @@ class ContactMap(_Entity):
                     raise ValueError('Should never get here')
 
         return contact_map
-
-
-def _AND(a, b):
-    return a and b
-
-
-def _OR(a, b):
-    return a or b
@@ -38,6 +38,8 @@ __author__ = "Felix Simkovic"
 __date__ = "03 Aug 2016"
 __version__ = "1.0"
 
+import collections
+
 from Bio import pairwise2
 from conkit.core._entity import _Entity
 
@@ -54,6 +56,51 @@ THREE_TO_ONE = {'ALA': 'A', 'ARG': 'R', 'ASN': 'N', 'ASP': 'D', 'CME': 'C', 'CYS
                 'ASX': 'B', 'GLX': 'Z', 'XAA': 'X', 'UNK': 'X', 'XLE': 'J'}
 
 
+class _AlignmentCache(object):
+    """Bounded least-recently-used cache of pairwise alignments
+
+    Alignments are keyed by the alignment mode, both sequences and the
+    scoring parameters. Once ``maxsize`` alignments are stored, the least
+    recently used one is discarded. A ``maxsize`` of ``0`` disables caching.
+
+    """
+    __slots__ = ['_cache', 'maxsize']
+
+    def __init__(self, maxsize=128):
+        self._cache = collections.OrderedDict()
+        self.maxsize = maxsize
+
+    def __contains__(self, key):
+        return key in self._cache
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """Remove all cached alignments"""
+        self._cache.clear()
+
+    def get(self, key):
+        """Return the alignment stored under ``key`` or :obj:`None`"""
+        value = self._cache.pop(key, None)
+        if value is not None:
+            self._cache[key] = value
+        return value
+
+    def set(self, key, value):
+        """Store an alignment under ``key``, discarding the least recently used ones if full"""
+        if self.maxsize <= 0:
+            return
+        self._cache.pop(key, None)
+        self._cache[key] = value
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+
+# Alignments shared by all Sequence instances, e.g. for repeated ContactMap.match calls against one reference
+ALIGNMENT_CACHE = _AlignmentCache()
+
+
 class Sequence(_Entity):
     """A sequence template to store all associated information
 
@@ -91,8 +138,8 @@ class Sequence(_Entity):
         """
         self._remark = []
         self._seq = None
-        self.seq = seq
         super(Sequence, self).__init__(id)
+        self.seq = seq
 
     def __add__(self, other):
         """Concatenate two sequence instances to a new"""
@@ -152,6 +199,8 @@ class Sequence(_Entity):
         """
         if all(c in ONE_TO_THREE for c in seq.upper() if c != '-'):
             self._seq = seq
+            if self._parent is not None:
+                self._parent._child_modified()
         else:
             raise ValueError('Unrecognized amino acids in sequence')
 
@@ -165,6 +214,69 @@ class Sequence(_Entity):
         """The protein sequence length"""
         return len(self.seq)
 
+    @staticmethod
+    def _align(mode, seq1, seq2, id_chars, nonid_chars, gap_open_pen, gap_ext_pen):
+        """Align two sequence strings, re-using cached or trivially derived alignments
+
+        Parameters
+        ----------
+        mode : str
+           The ``pairwise2`` alignment mode, i.e. ``global`` or ``local``
+        seq1 : str
+        seq2 : str
+        id_chars : int
+        nonid_chars : int
+        gap_open_pen : float
+        gap_ext_pen : float
+
+        Returns
+        -------
+        tuple
+           The two aligned sequence strings
+
+        """
+        key = (mode, seq1, seq2, id_chars, nonid_chars, gap_open_pen, gap_ext_pen)
+        aligned = ALIGNMENT_CACHE.get(key)
+        if aligned is None:
+            aligned = Sequence._align_trivial(mode, seq1, seq2, id_chars, nonid_chars, gap_open_pen, gap_ext_pen)
+            if aligned is None:
+                alignment = getattr(pairwise2.align, mode + 'ms')(
+                    seq1, seq2, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
+                )
+                aligned = (alignment[-1][0], alignment[-1][1])
+            ALIGNMENT_CACHE.set(key, aligned)
+        return aligned
+
+    @staticmethod
+    def _align_trivial(mode, seq1, seq2, id_chars, nonid_chars, gap_open_pen, gap_ext_pen):
+        """Derive the alignment of identical or offset sequences without dynamic programming
+
+        If identities score highest and gaps are penalised, two identical
+        sequences align along the diagonal. In a local alignment, a sequence
+        found exactly once in the other aligns at that offset with gaps
+        padding either end. This is the alignment ``pairwise2`` returns.
+
+        Returns
+        -------
+        tuple, None
+           The two aligned sequence strings or :obj:`None` if there is no trivial alignment
+
+        """
+        if not seq1 or not seq2 or id_chars <= max(nonid_chars, 0) or gap_open_pen > 0 or gap_ext_pen > 0:
+            return None
+        elif seq1 == seq2:
+            return seq1, seq2
+        elif mode != 'local':
+            return None
+
+        swap = len(seq1) < len(seq2)
+        longer, shorter = (seq2, seq1) if swap else (seq1, seq2)
+        offset = longer.find(shorter)
+        if offset < 0 or offset != longer.rfind(shorter):
+            return None
+        padded = '-' * offset + shorter + '-' * (len(longer) - len(shorter) - offset)
+        return (padded, longer) if swap else (longer, padded)
+
     def align_global(self, other, id_chars=2, nonid_chars=1, gap_open_pen=-0.5, gap_ext_pen=-0.1, inplace=False):
         """Generate a global alignment between two :obj:`Sequence <conkit.core.sequence.Sequence>` instances
 
@@ -185,17 +297,19 @@ class Sequence(_Entity):
         obj
            The reference to the :obj:`Sequence <conkit.core.sequence.Sequence>`, regardless of inplace
 
+        Notes
+        -----
+        Alignments are stored in :obj:`ALIGNMENT_CACHE <conkit.core.sequence.ALIGNMENT_CACHE>`, and identical
+        sequences are not re-aligned.
+
         """
         sequence1 = self._inplace(inplace)
         sequence2 = other._inplace(inplace)
 
-        alignment = pairwise2.align.globalms(
-            sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
+        sequence1.seq, sequence2.seq = Sequence._align(
+            'global', sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
         )
 
-        sequence1.seq = alignment[-1][0]
-        sequence2.seq = alignment[-1][1]
-
         return sequence1, sequence2
 
     def align_local(self, other, id_chars=2, nonid_chars=1, gap_open_pen=-0.5, gap_ext_pen=-0.1, inplace=False):
@@ -218,15 +332,17 @@ class Sequence(_Entity):
         obj
            The reference to the :obj:`Sequence <conkit.core.sequence.Sequence>`, regardless of inplace
 
+        Notes
+        -----
+        Alignments are stored in :obj:`ALIGNMENT_CACHE <conkit.core.sequence.ALIGNMENT_CACHE>`, and identical
+        sequences are not re-aligned.
+
         """
         sequence1 = self._inplace(inplace)
         sequence2 = other._inplace(inplace)
 
-        alignment = pairwise2.align.localms(
-            sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
+        sequence1.seq, sequence2.seq = Sequence._align(
+            'local', sequence1.seq, sequence2.seq, id_chars, nonid_chars, gap_open_pen, gap_ext_pen
         )
 
-        sequence1.seq = alignment[-1][0]
-        sequence2.seq = alignment[-1][1]
-
         return sequence1, sequence2
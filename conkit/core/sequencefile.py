@@ -45,7 +45,20 @@ if sys.version_info.major < 3:
     from itertools import izip as zip
 
 from enum import Enum
+from conkit.core import _msa
 from conkit.core._entity import _Entity
+from conkit.core.sequence import ONE_TO_THREE, Sequence
+
+# The residue states of the reduced alphabet; all other characters map onto the final gap state
+AMINO_ACID_STATES = 'ARNDCQEGHILKMFPSTWYV-'
+
+# Lookup tables from ASCII code to residue state and to the validity of the character in a Sequence
+_ASCII_TO_STATE = np.full(256, len(AMINO_ACID_STATES) - 1, dtype=np.uint8)
+for _state, _amino_acid in enumerate(AMINO_ACID_STATES[:-1]):
+    _ASCII_TO_STATE[ord(_amino_acid)] = _ASCII_TO_STATE[ord(_amino_acid.lower())] = _state
+_ASCII_VALID = np.zeros(256, dtype=bool)
+for _amino_acid in list(ONE_TO_THREE) + ['-']:
+    _ASCII_VALID[ord(_amino_acid)] = _ASCII_VALID[ord(_amino_acid.lower())] = True
 
 
 class SequenceAlignmentState(Enum):
@@ -89,8 +102,20 @@ class SequenceFile(_Entity):
     >>> print(sequence_file)
     SequenceFile(id="example" nseq=2)
 
+    Notes
+    -----
+    The alignment statistics share an encoded copy of the alignment (see :attr:`encoded_matrix`),
+    which is only rebuilt once a sequence is added, removed, reordered or modified. A
+    :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` created with :func:`from_matrix`
+    only holds this matrix and creates the :obj:`Sequence <conkit.core.sequence.Sequence>`
+    instances once they are requested.
+
+    The number of similar sequences used for the sequence weights is kept for the last sequence
+    identity threshold. Appending sequences only compares the new sequences to the alignment,
+    and :attr:`neff` is not recalculated until the alignment changes.
+
     """
-    __slots__ = ['_remark', '_status']
+    __slots__ = ['_remark', '_status', '_matrix', '_matrix_key', '_matrix_ids', '_states', '_counts', '_version']
 
     def __init__(self, id):
         """Initialise a new :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
@@ -103,15 +128,126 @@ class SequenceFile(_Entity):
         """
         self._remark = []
         self._status = SequenceAlignmentState.unknown
+        self._matrix = None
+        self._matrix_key = None
+        self._matrix_ids = None
+        self._states = None
+        self._counts = None
+        self._version = 0
         super(SequenceFile, self).__init__(id)
 
+    def __delitem__(self, id):
+        """Remove a child with given id"""
+        super(SequenceFile, self).__delitem__(id)
+        self._child_modified()
+
+    def __len__(self):
+        """Return the number of children"""
+        if self._matrix_ids is not None:
+            return len(self._matrix_ids)
+        return super(SequenceFile, self).__len__()
+
     def __repr__(self):
         return "{0}(id=\"{1}\" nseq={2})".format(self.__class__.__name__, self.id, self.nseq)
 
     @property
     def ascii_matrix(self):
         """The alignment encoded in a 2-D ASCII matrix"""
-        return [list(seq.seq_ascii) for seq in self]
+        if self.empty or not self.is_alignment:
+            return [list(seq.seq_ascii) for seq in self]
+        return self.encoded_matrix.tolist()
+
+    @property
+    def child_dict(self):
+        """A dictionary storing the child entities"""
+        self._materialize()
+        return self._child_dict
+
+    @child_dict.setter
+    def child_dict(self, child_dict):
+        """Define a dictionary storing the child entities
+
+        Parameters
+        ----------
+        child_dict : dict
+
+        """
+        self._matrix_ids = None
+        self._child_dict = child_dict
+        self._child_modified()
+
+    @property
+    def child_list(self):
+        """A list storing the child entities"""
+        self._materialize()
+        return _Entity.child_list.fget(self)
+
+    @child_list.setter
+    def child_list(self, child_list):
+        """Define a list storing the child entities
+
+        Parameters
+        ----------
+        child_list : list
+
+        """
+        self._matrix_ids = None
+        _Entity.child_list.fset(self, child_list)
+        self._child_modified()
+
+    @property
+    def encoded_matrix(self):
+        """The alignment encoded in a read-only 2-D :obj:`numpy.ndarray` of ASCII codes
+
+        The matrix is built once and re-used until a sequence is added, removed,
+        reordered or modified. Only appended sequences are encoded when the matrix
+        is rebuilt. Changes are tracked by the :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+        and :obj:`Sequence <conkit.core.sequence.Sequence>` methods, so the ``child_list``
+        must not be reordered directly.
+
+        Raises
+        ------
+        ValueError
+           :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+
+        """
+        if self._matrix_ids is None:
+            key = (self._version, len(self))
+            if self._matrix is None or key != self._matrix_key:
+                version, nold = self._matrix_key if self._matrix is not None else (None, 0)
+                children = self.child_list
+                # Sequences are only added without a version change, so the matrix can be extended
+                if version == self._version and 0 < nold < key[1]:
+                    appended = SequenceFile._encode([sequence.seq for sequence in children[nold:]])
+                    if appended.shape[1] != self._matrix.shape[1]:
+                        raise ValueError('This is not an alignment')
+                    matrix = np.concatenate((self._matrix, appended))
+                    matrix.flags.writeable = False
+                else:
+                    matrix = SequenceFile._encode([sequence.seq for sequence in children])
+                self._matrix = matrix
+                self._matrix_key = key
+        return self._matrix
+
+    @property
+    def state_matrix(self):
+        """The alignment encoded in a read-only 2-D :obj:`numpy.ndarray` of residue states
+
+        Each residue is encoded by its index in :data:`AMINO_ACID_STATES <conkit.core.sequencefile.AMINO_ACID_STATES>`.
+        Gaps and non-standard residues share the final state.
+
+        Raises
+        ------
+        ValueError
+           :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+
+        """
+        matrix = self.encoded_matrix
+        if self._states is None or self._states[0] is not matrix:
+            states = _ASCII_TO_STATE[matrix]
+            states.flags.writeable = False
+            self._states = (matrix, states)
+        return self._states[1]
 
     @property
     def is_alignment(self):
@@ -123,6 +259,9 @@ class SequenceFile(_Entity):
            A boolean status for the alignment
 
         """
+        if self._matrix_ids is not None:
+            self._status = SequenceAlignmentState.aligned
+            return True
         seq_length = self.top_sequence.seq_len
         self._status = SequenceAlignmentState.aligned
         for sequence in self:
@@ -142,7 +281,7 @@ class SequenceFile(_Entity):
         if self.empty:
             return 0.0
         elif self.is_alignment:
-            return (np.sqrt(len(self)) / float(self.top.seq_len)).round(decimals=3).item()
+            return (np.sqrt(len(self)) / float(self.encoded_matrix.shape[1])).round(decimals=3).item()
         else:
             raise ValueError('This is not an alignment')
 
@@ -153,7 +292,13 @@ class SequenceFile(_Entity):
 
     @property
     def neff(self):
-        """The number of effective sequences"""
+        """The number of effective sequences
+
+        See Also
+        --------
+        calculate_neff_with_identity, estimate_neff
+
+        """
         return int(sum(self.calculate_weights()))
 
     @property
@@ -229,17 +374,36 @@ class SequenceFile(_Entity):
         warnings.warn("This function will be deprecated in a future release! Use calculate_neff_with_identity instead!")
         return self.calculate_neff_with_identity(identity)
 
-    def calculate_neff_with_identity(self, identity):
+    def calculate_neff_with_identity(self, identity, nproc=1, memory_limit=_msa.MEMORY_LIMIT, approximate=False,
+                                     sample_size=500, seed=None):
         """Calculate the number of effective sequences with specified sequence identity
+
+        Parameters
+        ----------
+        identity : float
+           The sequence identity to use for similarity decision
+        nproc : int, optional
+           The number of processes to use [default: 1]
+        memory_limit : int, optional
+           The memory budget in MB for the sequence comparisons [default: 256]
+        approximate : bool, optional
+           Estimate the number from a random sample of sequences [default: False]
+        sample_size : int, optional
+           The number of sequences to sample if ``approximate`` [default: 500]
+        seed : int, optional
+           The seed for the random sample if ``approximate``
         
         See Also
         --------
-        neff, calculate_weights
+        neff, calculate_weights, estimate_neff
 
         """
-        return int(sum(self.calculate_weights(identity=identity)))
+        if approximate:
+            neff, _ = self.estimate_neff(identity=identity, sample_size=sample_size, seed=seed, memory_limit=memory_limit)
+            return int(neff)
+        return int(sum(self.calculate_weights(identity=identity, nproc=nproc, memory_limit=memory_limit)))
 
-    def calculate_weights(self, identity=0.8):
+    def calculate_weights(self, identity=0.8, nproc=1, memory_limit=_msa.MEMORY_LIMIT):
         """Calculate the sequence weights
 
         This function calculates the sequence weights in the
@@ -255,6 +419,10 @@ class SequenceFile(_Entity):
         ----------
         identity : float, optional
            The sequence identity to use for similarity decision [default: 0.8]
+        nproc : int, optional
+           The number of processes to use [default: 1]
+        memory_limit : int, optional
+           The memory budget in MB for the sequence comparisons [default: 256]
 
         Returns
         -------
@@ -263,43 +431,30 @@ class SequenceFile(_Entity):
 
         Raises
         ------
-        MemoryError
-           Too many sequences in the alignment for Hamming distance calculation
-        RuntimeError
-           SciPy package not installed
         ValueError
            :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
         ValueError
            Sequence Identity needs to be between 0 and 1
 
-        """
-        try:
-            import scipy.spatial
-        except ImportError:
-            raise RuntimeError('Cannot find SciPy package')
+        Notes
+        -----
+        The identities of all sequence pairs are counted by multiplying one-hot encoded
+        blocks of the alignment, which runs in the (multi-threaded) BLAS library NumPy is
+        linked against. Set the number of BLAS threads through its environment variables,
+        e.g. ``OMP_NUM_THREADS``, or distribute the blocks across ``nproc`` processes.
 
+        The counts are kept until the alignment changes. If sequences were only appended
+        since the last call with the same ``identity``, only the appended sequences are compared.
+
+        """
         if not self.is_alignment:
             raise ValueError('This is not an alignment')
 
         if identity < 0 or identity > 1:
             raise ValueError("Sequence Identity needs to be between 0 and 1")
 
-        msa_mat = np.array(self.ascii_matrix)
-        n = msa_mat.shape[0]  # size of the data
-        batch_size = min(n, 250)  # size of the batches
-        hamming = np.zeros(n, dtype=np.int)  # storage for data
-        # Separate the distance calculations into batches to avoid MemoryError exceptions.
-        # This answer was provided by a StackOverflow user. The corresponding suggestion by
-        # user @WarrenWeckesser: http://stackoverflow.com/a/41090953/3046533
-        num_full_batches, last_batch = divmod(n, batch_size)
-        batches = [batch_size] * num_full_batches
-        if last_batch != 0:
-            batches.append(last_batch)
-        for k, batch in enumerate(batches):
-            i = batch_size * k
-            dists = scipy.spatial.distance.cdist(msa_mat[i:i + batch], msa_mat, metric='hamming')
-            hamming[i:i + batch] = (dists < (1 - identity)).sum(axis=1)
-        return (1. / hamming).tolist()
+        counts = self._neighbor_counts(identity, nproc, memory_limit)
+        return (1. / counts).tolist()
 
     def calculate_freq(self):
         """Calculate the gap frequency in each alignment column
@@ -322,25 +477,160 @@ class SequenceFile(_Entity):
 
         """
         if self.is_alignment:
-            msa_mat = np.array(self.ascii_matrix)
+            msa_mat = self.encoded_matrix
             aa_frequencies = np.where(msa_mat != 45, 1, 0)
             aa_counts = np.sum(aa_frequencies, axis=0)
             return (aa_counts / len(msa_mat[:, 0])).tolist()
         else:
             raise ValueError('This is not an alignment')
 
-    def filter(self, min_id=0.3, max_id=0.9, inplace=False):
+    def calculate_profile(self, weights=None):
+        """Calculate the weighted frequency of each residue state in each alignment column
+
+        Parameters
+        ----------
+        weights : list, tuple, :obj:`numpy.ndarray`, optional
+           The weight of each sequence, e.g. from :func:`calculate_weights` [default: equal weights]
+
+        Returns
+        -------
+        :obj:`numpy.ndarray`
+           The frequencies of shape ``(L, 21)``, with states ordered as in
+           :data:`AMINO_ACID_STATES <conkit.core.sequencefile.AMINO_ACID_STATES>`
+
+        Raises
+        ------
+        ValueError
+           :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+        ValueError
+           The weights do not match the sequences
+
+        """
+        if not self.is_alignment:
+            raise ValueError('This is not an alignment')
+        states = self.state_matrix
+        return _msa.profile(states, len(AMINO_ACID_STATES), self._weights_array(weights, states.shape[0]))
+
+    def calculate_pair_frequencies(self, weights=None, memory_limit=_msa.MEMORY_LIMIT):
+        """Calculate the weighted frequency of each pair of residue states in each pair of alignment columns
+
+        Parameters
+        ----------
+        weights : list, tuple, :obj:`numpy.ndarray`, optional
+           The weight of each sequence, e.g. from :func:`calculate_weights` [default: equal weights]
+        memory_limit : int, optional
+           The memory budget in MB for the encoded sequences, excluding the result [default: 256]
+
+        Returns
+        -------
+        :obj:`numpy.ndarray`
+           The frequencies of shape ``(L, L, 21, 21)``, with states ordered as in
+           :data:`AMINO_ACID_STATES <conkit.core.sequencefile.AMINO_ACID_STATES>`
+
+        Raises
+        ------
+        ValueError
+           :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+        ValueError
+           The weights do not match the sequences
+
+        Notes
+        -----
+        The frequencies are accumulated from products of one-hot encoded chunks of sequences.
+        The result alone takes :math:`(21L)^2` double-precision values.
+
+        """
+        if not self.is_alignment:
+            raise ValueError('This is not an alignment')
+        states = self.state_matrix
+        weights = self._weights_array(weights, states.shape[0])
+        return _msa.pair_frequencies(states, len(AMINO_ACID_STATES), weights, memory_limit=memory_limit)
+
+    def estimate_neff(self, identity=0.8, sample_size=500, seed=None, memory_limit=_msa.MEMORY_LIMIT):
+        """Estimate the number of effective sequences from a random sample of sequences
+
+        The weights of ``sample_size`` randomly selected sequences are calculated
+        exactly against the entire alignment, and their sum is scaled to the number
+        of sequences in the alignment.
+
+        The run time is proportional to the number of sequences ``N`` times ``sample_size``
+        rather than ``N`` squared.
+
+        The error bound is estimated from the variance of the sampled weights, so at
+        least two sequences need to be sampled. If ``sample_size`` is not smaller than
+        the number of sequences, the exact value is returned with an error of 0.
+
+        Parameters
+        ----------
+        identity : float, optional
+           The sequence identity to use for similarity decision [default: 0.8]
+        sample_size : int, optional
+           The number of sequences to sample, at least 2 [default: 500]
+        seed : int, optional
+           The seed for the random sample
+        memory_limit : int, optional
+           The memory budget in MB for the sequence comparisons [default: 256]
+
+        Returns
+        -------
+        float
+           The estimated number of effective sequences
+        float
+           The half-width of the 95% confidence interval of the estimate
+
+        Raises
+        ------
+        ValueError
+           :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+        ValueError
+           Sequence Identity needs to be between 0 and 1
+        ValueError
+           Sample size needs to be at least 2
+
+        See Also
+        --------
+        neff, calculate_neff_with_identity
+
+        """
+        if not self.is_alignment:
+            raise ValueError('This is not an alignment')
+
+        if identity < 0 or identity > 1:
+            raise ValueError("Sequence Identity needs to be between 0 and 1")
+
+        if sample_size < 2:
+            raise ValueError("Sample size needs to be at least 2")
+
+        msa_mat = self.encoded_matrix
+        nseq = msa_mat.shape[0]
+        if sample_size >= nseq:
+            return float(sum(self.calculate_weights(identity=identity, memory_limit=memory_limit))), 0.0
+
+        sample = np.random.RandomState(seed).choice(nseq, size=sample_size, replace=False)
+        weights = 1. / _msa.query_neighbor_counts(msa_mat[sample], msa_mat, identity, memory_limit=memory_limit)
+        # Standard error of a total estimated from a simple random sample, with finite population correction
+        error = nseq * np.sqrt((1. - sample_size / nseq) * weights.var(ddof=1) / sample_size)
+        return float(nseq * weights.mean()), float(1.96 * error)
+
+    def filter(self, min_id=0.3, max_id=0.9, inplace=False, nproc=1, memory_limit=_msa.MEMORY_LIMIT):
         """Filter an alignment
 
+        Sequences are visited in order, and a sequence is kept if its identity to the first
+        sequence is at least ``min_id`` and its identity to every sequence kept before it is
+        at most ``max_id``, similar to HHfilter.
+
         Parameters
         ----------
         min_id : float, optional
-
+           The minimum sequence identity to the first sequence [default: 0.3]
         max_id : float, optional
-
+           The maximum sequence identity between kept sequences [default: 0.9]
         inplace : bool, optional
            Replace the saved order of sequences [default: False]
-
+        nproc : int, optional
+           The number of processes to use [default: 1]
+        memory_limit : int, optional
+           The memory budget in MB for the sequence comparisons [default: 256]
 
         Returns
         -------
@@ -349,10 +639,6 @@ class SequenceFile(_Entity):
 
         Raises
         ------
-        MemoryError
-           Too many sequences in the alignment for Hamming distance calculation
-        RuntimeError
-           SciPy package not installed
         ValueError
            :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
         ValueError
@@ -360,34 +646,104 @@ class SequenceFile(_Entity):
         ValueError
            Maximum sequence Identity needs to be between 0 and 1
 
-        """
-        try:
-            import scipy.spatial
-        except ImportError:
-            raise RuntimeError('Cannot find SciPy package')
+        Notes
+        -----
+        The alignment is compared in blocks that fit ``memory_limit``, and sequences that
+        have been rejected are not compared any further. The comparison of each block to the
+        kept sequences can be distributed across ``nproc`` processes.
 
+        """
         if not self.is_alignment:
             raise ValueError('This is not an alignment')
 
-        if 0 > min_id > 1:
+        if min_id < 0 or min_id > 1:
             raise ValueError("Minimum sequence Identity needs to be between 0 and 1")
-        elif 0 > max_id > 1:
+        elif max_id < 0 or max_id > 1:
             raise ValueError("Maximum sequence Identity needs to be between 0 and 1")
 
-        # Alignment to ASCII matrix
-        msa_mat = np.array(self.ascii_matrix)
-        # Find all throwable sequences
-        throw = set()
-        for i in np.arange(len(self)):
-            ident = 1 - scipy.spatial.distance.cdist([msa_mat[i]], msa_mat[i + 1:], metric='hamming')[0]
-            throw.update((1 + i + np.argwhere((ident < min_id) | (ident > max_id)).flatten()).tolist())
-        # Throw the previously selected sequences
+        keep = _msa.greedy_filter(self.encoded_matrix, min_id, max_id, memory_limit=memory_limit, nproc=nproc)
         sequence_file = self._inplace(inplace)
-        for i in reversed(list(throw)):
-            sequence_file.remove(self[i].id)
+        sequence_file.keep(keep)
+        return sequence_file
+
+    @classmethod
+    def from_matrix(cls, matrix, ids=None, id="conkit"):
+        """Create an alignment from a 2-D matrix without creating individual sequences
+
+        The :obj:`Sequence <conkit.core.sequence.Sequence>` instances are only created
+        once they are requested, e.g. by iterating over the
+        :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`.
+
+        Parameters
+        ----------
+        matrix : :obj:`numpy.ndarray`
+           The alignment as 2-D matrix of ASCII codes or single characters
+        ids : list, tuple, optional
+           The identifier of each sequence [default: seq_0, seq_1, ...]
+        id : str, optional
+           The unique identifier [default: conkit]
+
+        Returns
+        -------
+        :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
 
+        Raises
+        ------
+        ValueError
+           The matrix is not 2-D
+        ValueError
+           The matrix holds strings longer than a single character
+        ValueError
+           One or more amino acids in the alignment are not recognised
+        ValueError
+           The number of identifiers does not match the number of sequences
+
+        """
+        matrix = np.asarray(matrix)
+        if matrix.ndim != 2:
+            raise ValueError("2-D matrix required, got shape {}".format(matrix.shape))
+        if matrix.dtype.kind in ('U', 'S'):
+            char = np.dtype(matrix.dtype.kind + '1')
+            if matrix.dtype.itemsize > char.itemsize:
+                raise ValueError("Single characters required, got {}".format(matrix.dtype))
+            matrix = matrix.view(np.uint32 if matrix.dtype.kind == 'U' else np.uint8)
+        if matrix.size > 0 and (matrix.min() < 0 or matrix.max() > 255):
+            raise ValueError('Unrecognized amino acids in sequence')
+        matrix = np.array(matrix, dtype=np.uint8)
+        if not _ASCII_VALID[matrix].all():
+            raise ValueError('Unrecognized amino acids in sequence')
+
+        if ids is None:
+            ids = ['seq_{}'.format(i) for i in range(matrix.shape[0])]
+        elif len(ids) != matrix.shape[0]:
+            raise ValueError("Got {} identifiers for {} sequences".format(len(ids), matrix.shape[0]))
+        elif len(set(ids)) != len(ids):
+            raise ValueError("Sequence identifiers need to be unique")
+
+        matrix.flags.writeable = False
+        sequence_file = cls(id)
+        sequence_file._matrix = matrix
+        sequence_file._matrix_ids = list(ids)
+        sequence_file._status = SequenceAlignmentState.aligned
         return sequence_file
 
+    def keep(self, mask):
+        """Keep only the sequences selected by ``mask``
+
+        Parameters
+        ----------
+        mask : list, tuple, :obj:`numpy.ndarray`
+           A boolean for each sequence in ``child_list`` order
+
+        Raises
+        ------
+        ValueError
+           The mask does not match the number of sequences
+
+        """
+        super(SequenceFile, self).keep(mask)
+        self._child_modified()
+
     def sort(self, kword, reverse=False, inplace=False):
         """Sort the :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
 
@@ -442,3 +798,79 @@ class SequenceFile(_Entity):
             return sequence_file
         else:
             raise ValueError("This is not an alignment")
+
+    def deepcopy(self):
+        """Create a deep copy of :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`"""
+        self._materialize()
+        return super(SequenceFile, self).deepcopy()
+
+    def _materialize(self):
+        """Create the :obj:`Sequence <conkit.core.sequence.Sequence>` instances of a matrix-only alignment"""
+        if self._matrix_ids is None:
+            return
+        seqs = tuple(row.tobytes().decode('ascii') for row in self._matrix)
+        sequences = []
+        for id, seq in zip(self._matrix_ids, seqs):
+            # Skip the per-character validation in Sequence.seq, the matrix has been validated as a whole
+            sequence = Sequence.__new__(Sequence)
+            sequence._id = id
+            sequence._parent = self
+            sequence._child_list = []
+            sequence._child_dict = {}
+            sequence._removed = None
+            sequence._remark = []
+            sequence._seq = seq
+            sequences.append(sequence)
+        self._matrix_ids = None
+        self._matrix_key = (self._version, len(sequences))
+        self._child_list = sequences
+        self._child_dict = {sequence.id: sequence for sequence in sequences}
+        self._removed = None
+
+    def _child_modified(self):
+        """Invalidate the cached alignment matrix after a sequence was removed, reordered or modified"""
+        self._version += 1
+
+    def _sort(self, kword, reverse):
+        """Sort the :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`"""
+        super(SequenceFile, self)._sort(kword, reverse)
+        self._child_modified()
+
+    def _neighbor_counts(self, identity, nproc, memory_limit):
+        """The number of similar sequences of each sequence, updated incrementally if sequences were appended"""
+        matrix = self.encoded_matrix
+        if self._counts is not None and self._counts[0] == identity:
+            _, cached_matrix, cached_counts = self._counts
+            if cached_matrix is matrix:
+                return cached_counts
+            nold = cached_matrix.shape[0]
+            if nold <= matrix.shape[0] and cached_matrix.shape[1] == matrix.shape[1] \
+                    and np.array_equal(cached_matrix, matrix[:nold]):
+                counts = _msa.extend_neighbor_counts(cached_counts, matrix, identity, memory_limit=memory_limit)
+                self._counts = (identity, matrix, counts)
+                return counts
+        counts = _msa.neighbor_counts(matrix, identity, memory_limit=memory_limit, nproc=nproc)
+        self._counts = (identity, matrix, counts)
+        return counts
+
+    @staticmethod
+    def _weights_array(weights, nseq):
+        """Convert sequence weights to a :obj:`numpy.ndarray`, defaulting to equal weights"""
+        if weights is None:
+            return np.ones(nseq, dtype=np.float64)
+        weights = np.asarray(weights, dtype=np.float64)
+        if weights.shape != (nseq, ):
+            raise ValueError("Got {} weights for {} sequences".format(weights.size, nseq))
+        elif (weights < 0).any() or weights.sum() <= 0:
+            raise ValueError("Weights need to be non-negative and not all zero")
+        return weights
+
+    @staticmethod
+    def _encode(seqs):
+        """Encode equally long sequences in a read-only 2-D :obj:`numpy.ndarray` of ASCII codes"""
+        seq_len = len(seqs[0]) if seqs else 0
+        if any(len(seq) != seq_len for seq in seqs):
+            raise ValueError('This is not an alignment')
+        matrix = np.frombuffer(''.join(seqs).encode('ascii'), dtype=np.uint8).reshape(len(seqs), seq_len)
+        matrix.flags.writeable = False
+        return matrix
@@ -0,0 +1,96 @@
+"""Testing facility for conkit.core._columns"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import numpy as np
+import pickle
+import unittest
+
+from conkit.core._columns import _ContactColumns
+from conkit.core.contact import Contact
+
+
+class Test_ContactColumns(unittest.TestCase):
+    def test_create_1(self):
+        columns = _ContactColumns.create([1, 2], [5, 8], [0.5, 1.0])
+        self.assertEqual(2, len(columns))
+        self.assertEqual([1, 2], columns.res1_seq.tolist())
+        self.assertEqual(['X', 'X'], columns.res1.tolist())
+        self.assertEqual([8.0, 8.0], columns.upper_bound.tolist())
+
+    def test_create_2(self):
+        columns = _ContactColumns.create([1, 2], [5, 8], [0.5, 1.0], res1_chain=['A', 'B'], status=1)
+        self.assertEqual(['A', 'B'], columns.res1_chain.tolist())
+        self.assertEqual([1, 1], columns.status.tolist())
+
+    def test_create_3(self):
+        with self.assertRaises(ValueError):
+            _ContactColumns.create([1, 2], [5, 8], [0.5])
+
+    def test_create_4(self):
+        with self.assertRaises(ValueError):
+            _ContactColumns.create([1], [5], [0.5], foo=[1])
+
+    def test_create_5(self):
+        columns = _ContactColumns.create([1, 2], [5, 8], [0.5, 1.0])
+        with self.assertRaises(ValueError):
+            columns.raw_score[0] = 2.0
+
+    def test_from_contacts_1(self):
+        contact = Contact(1, 5, 0.5, distance_bound=(1, 6))
+        contact.res1 = 'A'
+        contact.res2_chain = 'B'
+        contact.define_match()
+        columns = _ContactColumns.from_contacts([contact, Contact(2, 8, 1.0)])
+        self.assertEqual([1, 2], columns.res1_seq.tolist())
+        self.assertEqual(['A', 'X'], columns.res1.tolist())
+        self.assertEqual(['B', ''], columns.res2_chain.tolist())
+        self.assertEqual([1, 0], columns.status.tolist())
+        self.assertEqual([1.0, 0.0], columns.lower_bound.tolist())
+
+    def test_to_contacts_1(self):
+        contact = Contact(1, 5, 0.5, distance_bound=(1, 6))
+        contact.res1_altseq = 3
+        contact.define_mismatch()
+        contacts = _ContactColumns.from_contacts([contact]).to_contacts()
+        self.assertEqual(contact._to_dict(), contacts[0]._to_dict())
+        self.assertIsNone(contacts[0].parent)
+
+    def test_index_1(self):
+        columns = _ContactColumns.create([1, 2], [5, 8], [0.5, 1.0])
+        self.assertEqual({(1, 5): 0, (2, 8): 1}, columns.index)
+
+    def test_take_1(self):
+        columns = _ContactColumns.create([1, 2, 3], [5, 8, 9], [0.5, 1.0, 0.2])
+        sliced = columns.take(slice(1, None))
+        self.assertEqual([2, 3], sliced.res1_seq.tolist())
+        self.assertTrue(np.shares_memory(columns.raw_score, sliced.raw_score))
+
+    def test_take_2(self):
+        columns = _ContactColumns.create([1, 2, 3], [5, 8, 9], [0.5, 1.0, 0.2])
+        masked = columns.take(np.array([True, False, True]))
+        self.assertEqual([1, 3], masked.res1_seq.tolist())
+        self.assertEqual(['X', 'X'], masked.res1.tolist())
+
+    def test_replace_1(self):
+        columns = _ContactColumns.create([1, 2], [5, 8], [0.5, 1.0])
+        replaced = columns.replace(raw_score=np.array([0.0, 0.1]))
+        self.assertEqual([0.5, 1.0], columns.raw_score.tolist())
+        self.assertEqual([0.0, 0.1], replaced.raw_score.tolist())
+
+    def test_order_1(self):
+        columns = _ContactColumns.create([1, 2, 3], [5, 8, 9], [0.5, 1.0, 0.5])
+        self.assertEqual([0, 2, 1], columns.order('raw_score').tolist())
+        self.assertEqual([1, 0, 2], columns.order('raw_score', reverse=True).tolist())
+
+    def test_pickle_1(self):
+        columns = _ContactColumns.create([1, 2], [5, 8], [0.5, 1.0], res1_chain=['A', 'B'])
+        unpickled = pickle.loads(pickle.dumps(columns))
+        self.assertEqual([0.5, 1.0], unpickled.raw_score.tolist())
+        self.assertEqual(['A', 'B'], unpickled.res1_chain.tolist())
+        self.assertEqual(['X', 'X'], unpickled.res1.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -44,6 +44,17 @@ class Test_Entity(unittest.TestCase):
         with self.assertRaises(KeyError):
             del entity['foo']
 
+    def test_delitem_4(self):
+        entity = _Entity('test')
+        entity.add(_Entity('foo'))
+        entity.add(_Entity('bar'))
+        self.assertIsNone(entity._removed)
+        del entity['foo']
+        self.assertEqual(1, len(entity))
+        self.assertEqual(['bar'], [child.id for child in entity])
+        self.assertIsNone(entity._removed)
+        self.assertEqual(['bar'], [child.id for child in entity.deepcopy()])
+
     def test_getitem_1(self):
         entity = _Entity('test')
         child_entity = _Entity('foo')
@@ -105,6 +116,17 @@ class Test_Entity(unittest.TestCase):
         self.assertEqual(5, len(new_entity))
         self.assertEqual(['foo_1', 'foo_3', 'foo_5', 'foo_7', 'foo_9'], [e.id for e in new_entity])
 
+    def test_getitem_8(self):
+        entity = _Entity('test')
+        for i in ['foo', 'bar', 'cho', 'baz']:
+            entity.add(_Entity(i))
+        sliced = entity[1:3]
+        self.assertEqual(['bar', 'cho'], [e.id for e in sliced])
+        self.assertEqual(['bar', 'cho'], sorted(sliced.child_dict.keys()))
+        self.assertIsNot(entity['bar'], sliced['bar'])
+        self.assertIs(sliced, sliced['bar'].parent)
+        self.assertEqual(4, len(entity))
+
     def test_iter_1(self):
         entity = _Entity('test')
         for i in range(10):
@@ -317,6 +339,54 @@ class Test_Entity(unittest.TestCase):
         with self.assertRaises(KeyError):
             entity.remove('foo')
 
+    def test_remove_4(self):
+        entity = _Entity('test')
+        for i in ['foo', 'bar', 'cho']:
+            entity.add(_Entity(i))
+        entity.remove(1)
+        self.assertEqual(2, len(entity))
+        self.assertEqual(['foo', 'cho'], [e.id for e in entity])
+
+    def test_remove_5(self):
+        entity = _Entity('test')
+        for i in ['foo', 'bar', 'cho']:
+            entity.add(_Entity(i))
+        entity.remove('foo')
+        self.assertEqual(2, len(entity))
+        entity.add(_Entity('foo'))
+        self.assertEqual(['bar', 'cho', 'foo'], [e.id for e in entity.child_list])
+
+    def test_keep_1(self):
+        entity = _Entity('test')
+        children = [_Entity(i) for i in ['foo', 'bar', 'cho']]
+        for child in children:
+            entity.add(child)
+        entity.keep([True, False, True])
+        self.assertEqual(['foo', 'cho'], [e.id for e in entity])
+        self.assertEqual(['cho', 'foo'], sorted(entity.child_dict.keys()))
+        self.assertIsNone(children[1].parent)
+
+    def test_keep_2(self):
+        entity = _Entity('test')
+        entity.add(_Entity('foo'))
+        with self.assertRaises(ValueError):
+            entity.keep([True, False])
+
+    def test_remove_many_1(self):
+        entity = _Entity('test')
+        for i in ['foo', 'bar', 'cho', 'baz']:
+            entity.add(_Entity(i))
+        entity.remove_many(['bar', 'baz'])
+        self.assertEqual(['foo', 'cho'], [e.id for e in entity])
+        self.assertFalse('bar' in entity)
+
+    def test_remove_many_2(self):
+        entity = _Entity('test')
+        entity.add(_Entity('foo'))
+        with self.assertRaises(KeyError):
+            entity.remove_many(['foo', 'bar'])
+        self.assertTrue('foo' in entity)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
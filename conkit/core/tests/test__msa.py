@@ -0,0 +1,108 @@
+"""Testing facility for conkit.core._msa"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import numpy as np
+import unittest
+
+from conkit.core import _msa
+
+
+class TestMsa(unittest.TestCase):
+
+    def test_identity_threshold_1(self):
+        self.assertEqual(9, _msa.identity_threshold(10, 0.8))
+        self.assertEqual(7, _msa.identity_threshold(10, 0.7))
+        self.assertEqual(1, _msa.identity_threshold(10, 0.0))
+        self.assertEqual(11, _msa.identity_threshold(10, 1.0))
+
+    def test_one_hot_1(self):
+        matrix = np.array([[65, 67], [67, 67]], dtype=np.uint8)
+        encoded = _msa.one_hot(matrix, np.array([65, 67]))
+        self.assertEqual(np.float32, encoded.dtype)
+        self.assertEqual([[1, 0, 0, 1], [0, 0, 1, 1]], encoded.tolist())
+
+    def test_neighbor_counts_1(self):
+        matrix = np.array([list(b'AAAAAAA'), list(b'AAAABA-'), list(b'B-BAA--'), list(b'BBBBBBB')], dtype=np.uint8)
+        self.assertEqual([2, 2, 1, 1], _msa.neighbor_counts(matrix, 0.7).tolist())
+
+    def test_neighbor_counts_2(self):
+        matrix = np.random.RandomState(0).randint(65, 68, size=(50, 12)).astype(np.uint8)
+        expected = _msa.neighbor_counts(matrix, 0.5)
+        self.assertEqual(expected.tolist(), _msa.neighbor_counts(matrix, 0.5, memory_limit=0.001).tolist())
+        self.assertEqual(expected.tolist(), _msa.neighbor_counts(matrix, 0.5, memory_limit=0.001, nproc=2).tolist())
+
+    def test_neighbor_counts_3(self):
+        self.assertEqual([], _msa.neighbor_counts(np.zeros((0, 5), dtype=np.uint8), 0.8).tolist())
+
+    def test_extend_neighbor_counts_1(self):
+        matrix = np.random.RandomState(0).randint(65, 68, size=(50, 12)).astype(np.uint8)
+        expected = _msa.neighbor_counts(matrix, 0.5)
+        counts = _msa.neighbor_counts(matrix[:20], 0.5)
+        self.assertEqual(expected.tolist(), _msa.extend_neighbor_counts(counts, matrix, 0.5).tolist())
+        self.assertEqual(expected.tolist(),
+                         _msa.extend_neighbor_counts(counts, matrix, 0.5, memory_limit=0.001).tolist())
+
+    def test_extend_neighbor_counts_2(self):
+        matrix = np.random.RandomState(0).randint(65, 68, size=(10, 12)).astype(np.uint8)
+        counts = _msa.neighbor_counts(matrix, 0.5)
+        self.assertEqual(counts.tolist(), _msa.extend_neighbor_counts(counts, matrix, 0.5).tolist())
+        self.assertEqual(counts.tolist(), _msa.extend_neighbor_counts(np.zeros(0, dtype=np.int64), matrix, 0.5).tolist())
+
+    def test_query_neighbor_counts_1(self):
+        matrix = np.random.RandomState(0).randint(65, 68, size=(50, 12)).astype(np.uint8)
+        expected = _msa.neighbor_counts(matrix, 0.5)[[3, 7, 11]]
+        self.assertEqual(expected.tolist(), _msa.query_neighbor_counts(matrix[[3, 7, 11]], matrix, 0.5).tolist())
+        self.assertEqual(expected.tolist(),
+                         _msa.query_neighbor_counts(matrix[[3, 7, 11]], matrix, 0.5, memory_limit=0.001).tolist())
+
+    def test_query_neighbor_counts_2(self):
+        matrix = np.zeros((4, 5), dtype=np.uint8)
+        self.assertEqual([], _msa.query_neighbor_counts(matrix[:0], matrix, 0.8).tolist())
+
+    def test_greedy_filter_1(self):
+        matrix = np.array([list(b'AAAAAA'), list(b'AAAAAB'), list(b'AAAABB'), list(b'BBBBBB')], dtype=np.uint8)
+        self.assertEqual([True, False, True, True], _msa.greedy_filter(matrix, 0.0, 0.8).tolist())
+        self.assertEqual([True, False, True, False], _msa.greedy_filter(matrix, 0.5, 0.8).tolist())
+        self.assertEqual([True, True, True, True], _msa.greedy_filter(matrix, 0.0, 1.0).tolist())
+
+    def test_greedy_filter_2(self):
+        matrix = np.random.RandomState(0).randint(65, 68, size=(60, 8)).astype(np.uint8)
+        expected = _msa.greedy_filter(matrix, 0.2, 0.6)
+        self.assertEqual(expected.tolist(), _msa.greedy_filter(matrix, 0.2, 0.6, memory_limit=0.0005).tolist())
+        self.assertEqual(expected.tolist(),
+                         _msa.greedy_filter(matrix, 0.2, 0.6, memory_limit=0.0005, nproc=2).tolist())
+
+    def test_greedy_filter_3(self):
+        self.assertEqual([], _msa.greedy_filter(np.zeros((0, 5), dtype=np.uint8), 0.3, 0.9).tolist())
+
+    def test_profile_1(self):
+        states = np.array([[0, 1], [0, 2], [1, 2]])
+        frequencies = _msa.profile(states, 3, np.array([1., 1., 2.]))
+        self.assertEqual([[0.5, 0.5, 0.0], [0.0, 0.25, 0.75]], frequencies.tolist())
+
+    def test_pair_frequencies_1(self):
+        states = np.array([[0, 1], [0, 2], [1, 2]])
+        frequencies = _msa.pair_frequencies(states, 3, np.array([1., 1., 2.]))
+        self.assertEqual((2, 2, 3, 3), frequencies.shape)
+        np.testing.assert_allclose([[0.0, 0.25, 0.25], [0.0, 0.0, 0.5], [0.0, 0.0, 0.0]], frequencies[0, 1], atol=1e-7)
+        np.testing.assert_allclose(frequencies[0, 1].T, frequencies[1, 0])
+        np.testing.assert_allclose([[0.5, 0.0, 0.0], [0.0, 0.5, 0.0], [0.0, 0.0, 0.0]], frequencies[0, 0], atol=1e-7)
+
+    def test_pair_frequencies_2(self):
+        states = np.random.RandomState(0).randint(0, 4, size=(30, 5))
+        weights = np.random.RandomState(1).rand(30)
+        expected = _msa.pair_frequencies(states, 4, weights)
+        np.testing.assert_allclose(expected, _msa.pair_frequencies(states, 4, weights, memory_limit=0.0001))
+        np.testing.assert_allclose(_msa.profile(states, 4, weights), np.einsum('iiaa->ia', expected), atol=1e-7)
+
+    def test_tile_size_1(self):
+        self.assertEqual(100, _msa.tile_size(100, 1000, 256))
+        tile = _msa.tile_size(10 ** 6, 1000, 256)
+        self.assertLessEqual(4 * (tile ** 2 + 2 * 1000 * tile), 256 * 1024 ** 2)
+        self.assertEqual(1, _msa.tile_size(10 ** 6, 10 ** 9, 1))
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
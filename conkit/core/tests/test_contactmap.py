@@ -3,6 +3,7 @@
 __author__ = "Felix Simkovic"
 __date__ = "12 Aug 2016"
 
+import numpy as np
 import unittest
 
 try:
@@ -82,6 +83,40 @@ class TestContactMap(unittest.TestCase):
                 contact.define_mismatch()
         self.assertEqual(0.5, contact_map.precision)
 
+    def test_precision_curve_1(self):
+        contact_map = ContactMap('test')
+        for i, c in enumerate([Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1), Contact(5, 1, 0.2)]):
+            if i == 1:
+                c.define_mismatch()
+            else:
+                c.define_match()
+            contact_map.add(c)
+        self.assertEqual([0.0, 1.0, 0.5, 2 / 3., 0.75], contact_map.precision_curve(ncontacts=[0, 1, 2, 3, 4]))
+        self.assertEqual([0.75], contact_map.precision_curve(ncontacts=[10]))
+
+    def test_precision_curve_2(self):
+        contact_map = ContactMap('test')
+        for i, c in enumerate([Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1), Contact(5, 1, 0.2)]):
+            if i % 2 == 0:
+                c.define_match()
+            else:
+                c.define_mismatch()
+            contact_map.add(c)
+        contact_map.sequence = Sequence('TEST', 'AAAA')
+        self.assertEqual([1.0, 0.5, 0.5], contact_map.precision_curve(factors=[0.25, 0.5, 1.0]))
+        contact_map.to_columnar(inplace=True)
+        self.assertEqual([1.0, 0.5, 0.5], contact_map.precision_curve(factors=[0.25, 0.5, 1.0]))
+
+    def test_precision_curve_3(self):
+        contact_map = ContactMap('test')
+        contact_map.add(Contact(1, 5, 1.0))
+        with self.assertRaises(ValueError):
+            contact_map.precision_curve()
+        with self.assertRaises(ValueError):
+            contact_map.precision_curve(factors=[1.0], ncontacts=[1])
+        with self.assertRaises(TypeError):
+            contact_map.precision_curve(factors=[1.0])
+
     def test_repr_sequence_1(self):
         contact_map = ContactMap('test')
         for contact in [Contact(1, 5, 1.0), Contact(2, 4, 0.1), Contact(5, 1, 0.2)]:
@@ -350,6 +385,80 @@ class TestContactMap(unittest.TestCase):
         self.assertEqual([('A', 'E'), ('B', 'F'), ('A', 'D'), ('C', 'F'), ('B', 'E')],
                          [(c.res1, c.res2) for c in contact_map1])
 
+    def test_from_arrays_1(self):
+        contact_map = ContactMap.from_arrays([1, 2, 3], [5, 6, 7], [0.1, 0.5, 0.2])
+        self.assertEqual("map_1", contact_map.id)
+        self.assertTrue(contact_map.columnar)
+        self.assertListEqual([[1, 5], [2, 6], [3, 7]], contact_map.as_list())
+        self.assertListEqual([0.1, 0.5, 0.2], [c.raw_score for c in contact_map])
+        self.assertTrue(all(c.parent is contact_map for c in contact_map))
+
+    def test_from_arrays_2(self):
+        contact_map = ContactMap.from_arrays(
+            [1, 2], [5, 6], [0.1, 0.5], chains=('A', ['B', 'C']), bounds=(0, [6, 7]), res1=['ALA', 'G'], res2='T', id="1"
+        )
+        self.assertEqual("1", contact_map.id)
+        self.assertListEqual(['A', 'G'], [c.res1 for c in contact_map])
+        self.assertListEqual(['T', 'T'], [c.res2 for c in contact_map])
+        self.assertListEqual(['A', 'A'], [c.res1_chain for c in contact_map])
+        self.assertListEqual(['B', 'C'], [c.res2_chain for c in contact_map])
+        self.assertListEqual([(0.0, 6.0), (0.0, 7.0)], [c.distance_bound for c in contact_map])
+
+    def test_from_arrays_3(self):
+        with self.assertRaises(ValueError):
+            ContactMap.from_arrays([1, 2, 1], [5, 6, 5], [0.1, 0.5, 0.2])
+        with self.assertRaises(ValueError):
+            ContactMap.from_arrays([1, 2], [5, 6, 7], [0.1, 0.5])
+        with self.assertRaises(ValueError):
+            ContactMap.from_arrays([1], [5], [0.1], res1='B2')
+        with self.assertRaises(TypeError):
+            ContactMap.from_arrays([1.5], [5], [0.1])
+
+    def test_from_arrays_4(self):
+        contact_map = ContactMap.from_arrays([], [], [])
+        self.assertEqual(0, contact_map.ncontacts)
+
+    def test_from_matrix_1(self):
+        mat = np.array([[0.0, 0.5, 0.2], [0.5, 0.0, 0.9], [0.2, 0.9, 0.1]])
+        contact_map = ContactMap.from_matrix(mat)
+        self.assertListEqual([[2, 3], [1, 2], [1, 3], [3, 3], [1, 1], [2, 2]], contact_map.as_list())
+        self.assertListEqual([0.9, 0.5, 0.2, 0.1, 0.0, 0.0], [c.raw_score for c in contact_map])
+
+    def test_from_matrix_2(self):
+        mat = np.array([[0.0, 0.5, 0.2], [0.5, 0.0, 0.9], [0.2, 0.9, 0.1]])
+        contact_map = ContactMap.from_matrix(mat, min_separation=1, top=2)
+        self.assertListEqual([[2, 3], [1, 2]], contact_map.as_list())
+        contact_map = ContactMap.from_matrix(mat, min_separation=2)
+        self.assertListEqual([[1, 3]], contact_map.as_list())
+
+    def test_from_matrix_3(self):
+        mat = np.array([[1.0, 1.0, 1.0], [1.0, 1.0, 1.0], [1.0, 1.0, 1.0]])
+        contact_map = ContactMap.from_matrix(mat, min_separation=1, top=2)
+        self.assertListEqual([[1, 2], [1, 3]], contact_map.as_list())
+        self.assertEqual(0, ContactMap.from_matrix(mat, top=0).ncontacts)
+
+    def test_from_matrix_4(self):
+        with self.assertRaises(ValueError):
+            ContactMap.from_matrix(np.zeros((2, 3)))
+
+    def test_from_matrix_5(self):
+        mat = np.array([[0.0, 0.4, 0.9, 0.2], [0.4, 0.0, 0.1, 0.7], [0.9, 0.1, 0.0, 0.3], [0.2, 0.7, 0.3, 0.0]])
+        contact_map = ContactMap.from_matrix(mat, min_separation=1, min_score=0.3)
+        self.assertEqual([(1, 3), (2, 4), (1, 2), (3, 4)], [c.id for c in contact_map])
+        contact_map = ContactMap.from_matrix(mat, min_separation=2, top=1, min_score=0.3)
+        self.assertEqual([(1, 3)], [c.id for c in contact_map])
+        self.assertEqual(0, len(ContactMap.from_matrix(mat, min_score=1.0)))
+
+    def test_from_matrix_6(self):
+        mat = np.random.RandomState(0).randint(0, 4, size=(20, 20)).astype(np.float32)
+        expected = [(c.id, c.raw_score) for c in ContactMap.from_matrix(mat, min_separation=3)][:15]
+        self.assertEqual(expected, [(c.id, c.raw_score) for c in ContactMap.from_matrix(mat, min_separation=3, top=15)])
+        res1_seqs, res2_seqs, raw_scores = ContactMap._top_candidates(mat, 3, 15, None, block_size=25)
+        order = np.argsort(-raw_scores, kind='mergesort')[:15]
+        self.assertEqual(expected, list(zip(zip((res1_seqs[order] + 1).tolist(), (res2_seqs[order] + 1).tolist()),
+                                            raw_scores[order].tolist())))
+        self.assertEqual(0, len(ContactMap.from_matrix(mat, min_separation=20, top=5)))
+
     def test_match_1(self):
         contact_map1 = ContactMap('foo')
         for params in [(1, 5, 1.0), (1, 6, 1.0), (2, 7, 1.0), (3, 5, 1.0), (2, 8, 1.0)]:
@@ -1111,6 +1220,175 @@ class TestContactMap(unittest.TestCase):
             contact_map.add(c)
         self.assertListEqual([[4, 5], [7, 8]], contact_map.singletons.as_list())
 
+    def test_singletons_8(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(4, 5, 1.0), Contact(7, 8, 0.4)]:
+            contact_map.add(c)
+        contact_map.to_columnar(inplace=True)
+        singletons = contact_map.singletons
+        self.assertTrue(singletons.columnar)
+        self.assertListEqual([[4, 5], [7, 8]], singletons.as_list())
+
+    def test_cluster_labels_1(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(4, 5, 1.0), Contact(20, 30, 0.4), Contact(6, 7, 0.4), Contact(8, 9, 0.1)]:
+            contact_map.add(c)
+        self.assertListEqual([0, 1, 0, 0], contact_map.cluster_labels().tolist())
+
+    def test_cluster_labels_2(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(4, 5, 1.0), Contact(20, 30, 0.4), Contact(6, 7, 0.4), Contact(8, 9, 0.1)]:
+            contact_map.add(c)
+        self.assertListEqual([0, 1, 2, 3], contact_map.cluster_labels(radius=1).tolist())
+        self.assertListEqual([0, 1, 0, 0], contact_map.to_columnar().cluster_labels().tolist())
+
+    def test_cluster_labels_3(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(1, 10, 1.0), Contact(5, 20, 0.4), Contact(1, 14, 0.4)]:
+            contact_map.add(c)
+        self.assertListEqual([0, 1, 2], contact_map.cluster_labels().tolist())
+        self.assertListEqual([0, 1, 0], contact_map.cluster_labels(radius=4).tolist())
+
+    def test_cluster_labels_4(self):
+        contact_map = ContactMap("test")
+        self.assertListEqual([], contact_map.cluster_labels().tolist())
+        with self.assertRaises(ValueError):
+            contact_map.cluster_labels(radius=-1)
+
+    def test_remove_isolated_1(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(4, 5, 1.0), Contact(20, 30, 0.4), Contact(6, 7, 0.4), Contact(8, 9, 0.1)]:
+            contact_map.add(c)
+        filtered = contact_map.remove_isolated()
+        self.assertListEqual([[4, 5], [6, 7], [8, 9]], filtered.as_list())
+        self.assertEqual(4, contact_map.ncontacts)
+
+    def test_remove_isolated_2(self):
+        contact_map = ContactMap("test")
+        for c in [Contact(4, 5, 1.0), Contact(20, 30, 0.4), Contact(6, 7, 0.4), Contact(21, 30, 0.1)]:
+            contact_map.add(c)
+        contact_map.remove_isolated(max_cluster_size=2, inplace=True)
+        self.assertListEqual([], contact_map.as_list())
+
+    def test_to_columnar_1(self):
+        contact_map = ContactMap('test')
+        for c in [Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1)]:
+            contact_map.add(c)
+        columnar = contact_map.to_columnar()
+        self.assertTrue(columnar.columnar)
+        self.assertFalse(contact_map.columnar)
+        self.assertEqual(3, len(columnar))
+        self.assertTrue((3, 3) in columnar)
+        self.assertFalse((3, 4) in columnar)
+        self.assertTrue(columnar.columnar)
+
+    def test_to_columnar_2(self):
+        contact_map = ContactMap('test')
+        for c in [Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1)]:
+            contact_map.add(c)
+        contact_map.to_columnar(inplace=True)
+        self.assertTrue(contact_map.columnar)
+        self.assertEqual([[1, 5], [3, 3], [2, 4]], contact_map.as_list())
+        self.assertEqual([1.0, 0.4, 0.1], [c.raw_score for c in contact_map])
+        self.assertFalse(contact_map.columnar)
+        self.assertTrue(all(c.parent is contact_map for c in contact_map))
+
+    def test_to_columnar_3(self):
+        contact_map = ContactMap('test')
+        for c in [Contact(1, 5, 1.0), Contact(3, 3, 0.4), Contact(2, 4, 0.1)]:
+            contact_map.add(c)
+        contact_map.to_columnar(inplace=True)
+        contact = contact_map[(3, 3)]
+        contact.define_match()
+        self.assertFalse(contact_map.columnar)
+        self.assertTrue(contact_map[(3, 3)].is_match)
+
+    def test_to_columnar_4(self):
+        contact_map = ContactMap('test')
+        for c in [Contact(1, 5, 1.0), Contact(3, 8, 0.4), Contact(2, 9, 0.1), Contact(1, 2, 0.6), Contact(4, 20, 0.05)]:
+            contact_map.add(c)
+        contact_map.to_columnar(inplace=True)
+        contact_map.remove_neighbors(min_distance=5, inplace=True)
+        contact_map.sort('raw_score', reverse=True, inplace=True)
+        sliced = contact_map[:2]
+        self.assertTrue(sliced.columnar)
+        self.assertEqual([[3, 8], [2, 9]], sliced.as_list())
+        self.assertEqual(3, len(contact_map))
+
+    def test_to_columnar_5(self):
+        contact_map = ContactMap('test')
+        for c in [Contact(1, 5, 1.0), Contact(3, 8, 0.5), Contact(2, 9, 0.0)]:
+            contact_map.add(c)
+        contact_map.to_columnar(inplace=True)
+        rescaled = contact_map.rescale()
+        rescaled.calculate_scalar_score()
+        self.assertTrue(rescaled.columnar)
+        self.assertEqual([1.0, 0.5, 0.0], [c.raw_score for c in rescaled])
+        self.assertEqual([2.0, 1.0, 0.0], [c.scalar_score for c in rescaled])
+        self.assertEqual([1.0, 0.5, 0.0], [c.raw_score for c in contact_map])
+
+    def test_to_columnar_6(self):
+        contact_map = ContactMap('test')
+        for c in [Contact(1, 5, 1.0), Contact(3, 8, 0.5), Contact(2, 9, 0.0)]:
+            contact_map.add(c)
+        contact_map.sequence = Sequence('foo', 'ACDEFGHIKL')
+        contact_map.to_columnar(inplace=True)
+        contact_map.assign_sequence_register()
+        found = contact_map.find([3, 9])
+        self.assertTrue(found.columnar)
+        self.assertEqual([[3, 8], [2, 9]], found.as_list())
+        self.assertEqual(['D', 'C'], [c.res1 for c in found])
+        self.assertEqual(['I', 'K'], [c.res2 for c in found])
+
+    def test_find_8(self):
+        contact_map = ContactMap('1')
+        for comb, alt in [((1, 5), (11, 15)), ((2, 6), (12, 16)), ((3, 7), (13, 17))]:
+            contact = Contact(comb[0], comb[1], 1.0)
+            contact.res1_altseq, contact.res2_altseq = alt
+            contact_map.add(contact)
+        found = contact_map.find([12, 17], altloc=True)
+        self.assertEqual([[2, 6], [3, 7]], found.as_list())
+
+    def test_remove_many_1(self):
+        contact_map = ContactMap('1')
+        for comb in [(1, 5), (2, 6), (3, 7), (4, 8)]:
+            contact_map.add(Contact(comb[0], comb[1], 1.0))
+        contact_map.remove_many([(2, 6), (4, 8)])
+        self.assertEqual([[1, 5], [3, 7]], contact_map.as_list())
+
+    def test_remove_many_2(self):
+        contact_map = ContactMap('1')
+        for comb in [(1, 5), (2, 6), (3, 7), (4, 8)]:
+            contact_map.add(Contact(comb[0], comb[1], 1.0))
+        contact_map.to_columnar(inplace=True)
+        contact_map.remove_many([(2, 6), (4, 8)])
+        self.assertTrue(contact_map.columnar)
+        self.assertEqual([[1, 5], [3, 7]], contact_map.as_list())
+        with self.assertRaises(KeyError):
+            contact_map.remove_many([(2, 6)])
+
+    def test_view_1(self):
+        contact_map = ContactMap('1')
+        for comb in [(1, 5), (2, 6), (3, 7), (4, 8)]:
+            contact_map.add(Contact(comb[0], comb[1], 1.0))
+        view = contact_map.view(stop=2)
+        self.assertEqual([[1, 5], [2, 6]], view.as_list())
+        self.assertIs(contact_map[(1, 5)], view[(1, 5)])
+        self.assertTrue((2, 6) in view)
+        self.assertFalse((3, 7) in view)
+        self.assertEqual(4, len(contact_map))
+
+    def test_view_2(self):
+        contact_map = ContactMap('1')
+        for comb in [(1, 5), (2, 6), (3, 7), (4, 8)]:
+            contact_map.add(Contact(comb[0], comb[1], 1.0))
+        contact_map.sequence = Sequence('foo', 'ACDEFGHI')
+        contact_map.to_columnar(inplace=True)
+        view = contact_map.view(1, 3)
+        self.assertTrue(view.columnar)
+        self.assertEqual([[2, 6], [3, 7]], view.as_list())
+        self.assertIs(contact_map.sequence, view.sequence)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
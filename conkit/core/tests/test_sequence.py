@@ -5,7 +5,7 @@ __date__ = "12 Aug 2016"
 
 import unittest
 
-from conkit.core.sequence import Sequence
+from conkit.core.sequence import ALIGNMENT_CACHE, Sequence, _AlignmentCache
 
 
 class TestSequence(unittest.TestCase):
@@ -132,6 +132,88 @@ class TestSequence(unittest.TestCase):
         self.assertEqual(aligned1, sequence1.seq)
         self.assertEqual(aligned2, sequence2.seq)
 
+    def test_align_local_4(self):
+        sequence1 = Sequence('foo', 'GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI')
+        sequence2 = Sequence('bar', 'GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI')
+        sequence1.align_local(sequence2, inplace=True)
+        self.assertEqual('GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI', sequence1.seq)
+        self.assertEqual('GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI', sequence2.seq)
+
+    def test_align_local_5(self):
+        sequence1 = Sequence('foo', 'GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI')
+        sequence2 = Sequence('bar', 'DSAVIKAGYCVKQG')
+        sequence1.align_local(sequence2, inplace=True)
+        self.assertEqual('GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI', sequence1.seq)
+        self.assertEqual('----------DSAVIKAGYCVKQG------------------', sequence2.seq)
+
+    def test_align_local_6(self):
+        sequence1 = Sequence('foo', 'DSAVIKAGYCVKQG')
+        sequence2 = Sequence('bar', 'GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI')
+        aligned1, aligned2 = sequence1.align_local(sequence2)
+        self.assertEqual('----------DSAVIKAGYCVKQG------------------', aligned1.seq)
+        self.assertEqual('GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI', aligned2.seq)
+        self.assertEqual('DSAVIKAGYCVKQG', sequence1.seq)
+
+    def test_align_local_7(self):
+        ALIGNMENT_CACHE.clear()
+        sequence1 = Sequence('foo', 'GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTI')
+        sequence2 = Sequence('bar', 'Q-------YF-------P------')
+        aligned1, aligned2 = sequence1.align_local(sequence2)
+        self.assertEqual(1, len(ALIGNMENT_CACHE))
+        self.assertIn(('local', sequence1.seq, sequence2.seq, 2, 1, -0.5, -0.1), ALIGNMENT_CACHE)
+        aligned3, aligned4 = sequence1.align_local(sequence2)
+        self.assertEqual(1, len(ALIGNMENT_CACHE))
+        self.assertEqual(aligned1.seq, aligned3.seq)
+        self.assertEqual(aligned2.seq, aligned4.seq)
+        sequence1.align_local(sequence2, gap_ext_pen=-0.2)
+        self.assertEqual(2, len(ALIGNMENT_CACHE))
+
+    def test_align_global_1(self):
+        sequence1 = Sequence('foo', 'GSMFTPKPPQDSAVIKAG')
+        sequence2 = Sequence('bar', 'GSMFTPKPPQDSAVIKAG')
+        aligned1, aligned2 = sequence1.align_global(sequence2)
+        self.assertEqual('GSMFTPKPPQDSAVIKAG', aligned1.seq)
+        self.assertEqual('GSMFTPKPPQDSAVIKAG', aligned2.seq)
+
+
+class TestAlignmentCache(unittest.TestCase):
+
+    def test_get_1(self):
+        cache = _AlignmentCache(maxsize=2)
+        cache.set('a', ('A', 'A'))
+        self.assertEqual(('A', 'A'), cache.get('a'))
+        self.assertIsNone(cache.get('b'))
+
+    def test_set_1(self):
+        cache = _AlignmentCache(maxsize=2)
+        cache.set('a', ('A', 'A'))
+        cache.set('b', ('B', 'B'))
+        cache.set('c', ('C', 'C'))
+        self.assertEqual(2, len(cache))
+        self.assertNotIn('a', cache)
+        self.assertIn('b', cache)
+        self.assertIn('c', cache)
+
+    def test_set_2(self):
+        cache = _AlignmentCache(maxsize=2)
+        cache.set('a', ('A', 'A'))
+        cache.set('b', ('B', 'B'))
+        cache.get('a')
+        cache.set('c', ('C', 'C'))
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+
+    def test_set_3(self):
+        cache = _AlignmentCache(maxsize=0)
+        cache.set('a', ('A', 'A'))
+        self.assertEqual(0, len(cache))
+
+    def test_clear_1(self):
+        cache = _AlignmentCache()
+        cache.set('a', ('A', 'A'))
+        cache.clear()
+        self.assertEqual(0, len(cache))
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -3,6 +3,7 @@
 __author__ = "Felix Simkovic"
 __date__ = "12 Aug 2016"
 
+import numpy as np
 import unittest
 
 try:
@@ -32,6 +33,112 @@ class TestSequenceFile(unittest.TestCase):
         self.assertEqual([45, 67, 67, 45, 67, 45], list(matrix)[1])
         self.assertEqual([66, 66, 66, 66, 66, 66], list(matrix)[2])
 
+    def test_ascii_matrix_2(self):
+        sequence_file = SequenceFile('test')
+        for seq in [Sequence('foo', 'AAAAAA'), Sequence('bar', '-CC-')]:
+            sequence_file.add(seq)
+        self.assertEqual([[65, 65, 65, 65, 65, 65], [45, 67, 67, 45]], sequence_file.ascii_matrix)
+
+    def test_encoded_matrix_1(self):
+        sequence_file = SequenceFile('test')
+        for seq in [Sequence('foo', 'AAAAAA'), Sequence('bar', '-CC-C-')]:
+            sequence_file.add(seq)
+        matrix = sequence_file.encoded_matrix
+        self.assertEqual((2, 6), matrix.shape)
+        self.assertEqual(np.uint8, matrix.dtype)
+        self.assertEqual([45, 67, 67, 45, 67, 45], matrix[1].tolist())
+        self.assertFalse(matrix.flags.writeable)
+        self.assertIs(matrix, sequence_file.encoded_matrix)
+
+    def test_encoded_matrix_2(self):
+        sequence_file = SequenceFile('test')
+        for seq in [Sequence('foo', 'AAAAAA'), Sequence('bar', '-CC-C-')]:
+            sequence_file.add(seq)
+        matrix = sequence_file.encoded_matrix
+        sequence_file['bar'].seq = 'DDDDDD'
+        self.assertIsNot(matrix, sequence_file.encoded_matrix)
+        self.assertEqual([68] * 6, sequence_file.encoded_matrix[1].tolist())
+        sequence_file.add(Sequence('doe', 'EEEEEE'))
+        self.assertEqual((3, 6), sequence_file.encoded_matrix.shape)
+        sequence_file.remove('foo')
+        self.assertEqual([[68] * 6, [69] * 6], sequence_file.encoded_matrix.tolist())
+        sequence_file.sort('id', inplace=True)
+        self.assertEqual([[68] * 6, [69] * 6], sequence_file.encoded_matrix.tolist())
+        sequence_file.sort('id', reverse=True, inplace=True)
+        self.assertEqual([[69] * 6, [68] * 6], sequence_file.encoded_matrix.tolist())
+
+    def test_encoded_matrix_3(self):
+        sequence_file = SequenceFile('test')
+        for seq in [Sequence('foo', 'AAAAAA'), Sequence('bar', '-CC-')]:
+            sequence_file.add(seq)
+        with self.assertRaises(ValueError):
+            sequence_file.encoded_matrix
+
+    def test_encoded_matrix_4(self):
+        sequence_file = SequenceFile('test')
+        for seq in [Sequence('foo', 'AAAAAA'), Sequence('bar', '-CC-C-')]:
+            sequence_file.add(seq)
+        matrix = sequence_file.encoded_matrix
+        sequence_file.add(Sequence('doe', 'DDDDDD'))
+        extended = sequence_file.encoded_matrix
+        self.assertEqual(matrix.tolist(), extended[:2].tolist())
+        self.assertEqual([68] * 6, extended[2].tolist())
+        sequence_file.keep([True, False, True])
+        self.assertEqual([[65] * 6, [68] * 6], sequence_file.encoded_matrix.tolist())
+        del sequence_file['foo']
+        self.assertEqual([[68] * 6], sequence_file.encoded_matrix.tolist())
+
+    def test_state_matrix_1(self):
+        sequence_file = SequenceFile('test')
+        for seq in [Sequence('foo', 'ARNDCQ'), Sequence('bar', '-VWBX-')]:
+            sequence_file.add(seq)
+        states = sequence_file.state_matrix
+        self.assertEqual([[0, 1, 2, 3, 4, 5], [20, 19, 17, 20, 20, 20]], states.tolist())
+        self.assertIs(states, sequence_file.state_matrix)
+
+    def test_from_matrix_1(self):
+        matrix = np.array([[65, 65, 65], [45, 67, 67]], dtype=np.uint8)
+        sequence_file = SequenceFile.from_matrix(matrix, ids=['foo', 'bar'], id='test')
+        self.assertEqual('test', sequence_file.id)
+        self.assertEqual(2, sequence_file.nseq)
+        self.assertTrue(sequence_file.is_alignment)
+        self.assertEqual(matrix.tolist(), sequence_file.encoded_matrix.tolist())
+        self.assertEqual([0.5, 1.0, 1.0], sequence_file.calculate_freq())
+        self.assertEqual([], sequence_file._child_list)
+
+    def test_from_matrix_2(self):
+        sequence_file = SequenceFile.from_matrix(np.array([list('AAA'), list('-CC')]))
+        self.assertEqual(['seq_0', 'seq_1'], [s.id for s in sequence_file])
+        self.assertEqual(['AAA', '-CC'], [s.seq for s in sequence_file])
+        self.assertTrue(all(s.parent is sequence_file for s in sequence_file))
+        matrix = sequence_file.encoded_matrix
+        sequence_file.add(Sequence('foo', 'DDD'))
+        self.assertEqual(['AAA', '-CC', 'DDD'], [s.seq for s in sequence_file])
+        self.assertEqual((3, 3), sequence_file.encoded_matrix.shape)
+        self.assertEqual((2, 3), matrix.shape)
+
+    def test_from_matrix_3(self):
+        sequence_file = SequenceFile.from_matrix(np.array([list('AAA'), list('-CC')]))
+        copied = sequence_file.deepcopy()
+        self.assertEqual(['AAA', '-CC'], [s.seq for s in copied])
+        self.assertEqual(['AAA', '-CC'], [s.seq for s in sequence_file])
+
+    def test_from_matrix_4(self):
+        with self.assertRaises(ValueError):
+            SequenceFile.from_matrix(np.array([list('AA2'), list('-CC')]))
+        with self.assertRaises(ValueError):
+            SequenceFile.from_matrix(np.array([list('AAA'), list('-CC')]), ids=['foo'])
+        with self.assertRaises(ValueError):
+            SequenceFile.from_matrix(np.array(list('AAA')))
+
+    def test_from_matrix_5(self):
+        with self.assertRaises(ValueError):
+            SequenceFile.from_matrix(np.array([['AB', 'C'], ['D', 'E']]))
+        with self.assertRaises(ValueError):
+            SequenceFile.from_matrix(np.array([[b'AB', b'C'], [b'D', b'E']]))
+        sequence_file = SequenceFile.from_matrix(np.array([[b'A', b'C'], [b'D', b'E']]))
+        self.assertEqual(['AC', 'DE'], [s.seq for s in sequence_file])
+
     def test_is_alignment_1(self):
         sequence_file = SequenceFile('test')
         sequence_file.add(Sequence('foo', 'AAAAA'))
@@ -212,6 +319,102 @@ class TestSequenceFile(unittest.TestCase):
             sequence_file.add(s)
         self.assertEqual(5, sequence_file.neff)
 
+    def test_calculate_weights_7(self):
+        sequence_file = SequenceFile('test')
+        for s in [Sequence('foo', 'AAAAAAA'), Sequence('bar', 'AA-ABA-'), Sequence('cho', 'AAACBAA')]:
+            sequence_file.add(s)
+        self.assertEqual([0.5, 1.0, 0.5], sequence_file.calculate_weights(identity=0.6))
+        for s in [Sequence('doo', 'B-BAA--'), Sequence('miu', 'BBBBBBB'), Sequence('nop', 'AAAAAAB')]:
+            sequence_file.add(s)
+        weights = sequence_file.calculate_weights(identity=0.6)
+        self.assertEqual(weights, [0.3333333333333333, 1.0, 0.5, 1.0, 1.0, 0.5])
+        sequence_file['nop'].seq = 'BBBBBBB'
+        self.assertEqual([0.5, 1.0, 0.5, 1.0, 0.5, 0.5], sequence_file.calculate_weights(identity=0.6))
+        sequence_file.add(Sequence('new', 'BBBBBB'))
+        with self.assertRaises(ValueError):
+            sequence_file.calculate_weights(identity=0.6)
+
+    def test_calculate_profile_1(self):
+        sequence_file = SequenceFile('test')
+        for s in [Sequence('foo', 'AR'), Sequence('bar', 'A-'), Sequence('cho', 'RX')]:
+            sequence_file.add(s)
+        profile = sequence_file.calculate_profile()
+        self.assertEqual((2, 21), profile.shape)
+        self.assertEqual([0.666667, 0.333333], profile[0, :2].round(6).tolist())
+        self.assertEqual([0.333333, 0.666667], profile[1, [1, 20]].round(6).tolist())
+        profile = sequence_file.calculate_profile(weights=[0.5, 0.5, 1.0])
+        self.assertEqual([0.5, 0.5], profile[0, :2].tolist())
+
+    def test_calculate_profile_2(self):
+        sequence_file = SequenceFile('test')
+        for s in [Sequence('foo', 'AR'), Sequence('bar', 'A-')]:
+            sequence_file.add(s)
+        with self.assertRaises(ValueError):
+            sequence_file.calculate_profile(weights=[1.0])
+        with self.assertRaises(ValueError):
+            sequence_file.calculate_profile(weights=[1.0, -1.0])
+
+    def test_calculate_pair_frequencies_1(self):
+        sequence_file = SequenceFile('test')
+        for s in [Sequence('foo', 'AR'), Sequence('bar', 'A-'), Sequence('cho', 'RX')]:
+            sequence_file.add(s)
+        frequencies = sequence_file.calculate_pair_frequencies(weights=[0.5, 0.5, 1.0])
+        self.assertEqual((2, 2, 21, 21), frequencies.shape)
+        np.testing.assert_allclose([0.25, 0.25, 0.5], frequencies[0, 1, [0, 0, 1], [1, 20, 20]], atol=1e-7)
+        self.assertAlmostEqual(1.0, frequencies[0, 1].sum())
+
+    def test_estimate_neff_1(self):
+        sequence_file = SequenceFile('test')
+        for s in [
+                Sequence('foo', 'AAAAAAA'),
+                Sequence('bar', 'AA-ABA-'),
+                Sequence('cho', 'AAACBAA'),
+                Sequence('doo', 'B-BAA--'),
+                Sequence('miu', 'BBBBBBB'),
+                Sequence('nop', 'AAAAAAB')
+        ]:
+            sequence_file.add(s)
+        neff, error = sequence_file.estimate_neff(identity=0.6, sample_size=6)
+        self.assertAlmostEqual(4.333333, neff, places=5)
+        self.assertEqual(0.0, error)
+
+    def test_estimate_neff_2(self):
+        matrix = np.random.RandomState(1).randint(65, 69, size=(400, 20)).astype(np.uint8)
+        matrix[300:] = matrix[:100]
+        sequence_file = SequenceFile.from_matrix(matrix)
+        exact = sum(sequence_file.calculate_weights(identity=0.8))
+        neff, error = sequence_file.estimate_neff(identity=0.8, sample_size=100, seed=0)
+        self.assertGreater(error, 0.0)
+        self.assertLessEqual(abs(neff - exact), error)
+        self.assertEqual((neff, error), sequence_file.estimate_neff(identity=0.8, sample_size=100, seed=0))
+        self.assertEqual(int(neff), sequence_file.calculate_neff_with_identity(0.8, approximate=True, sample_size=100,
+                                                                               seed=0))
+
+    def test_estimate_neff_3(self):
+        sequence_file = SequenceFile('test')
+        sequence_file.add(Sequence('foo', 'AAAAAAA'))
+        sequence_file.add(Sequence('bar', 'AAAAAA'))
+        with self.assertRaises(ValueError):
+            sequence_file.estimate_neff()
+
+    def test_estimate_neff_4(self):
+        sequence_file = SequenceFile('test')
+        sequence_file.add(Sequence('foo', 'AAAAAAA'))
+        with self.assertRaises(ValueError):
+            sequence_file.estimate_neff(sample_size=0)
+        with self.assertRaises(ValueError):
+            sequence_file.estimate_neff(identity=1.5)
+
+    def test_estimate_neff_5(self):
+        matrix = np.random.RandomState(1).randint(65, 69, size=(10, 20)).astype(np.uint8)
+        sequence_file = SequenceFile.from_matrix(matrix)
+        with self.assertRaises(ValueError):
+            sequence_file.estimate_neff(sample_size=1)
+        with self.assertRaises(ValueError):
+            sequence_file.calculate_neff_with_identity(0.8, approximate=True, sample_size=1)
+        neff, error = sequence_file.estimate_neff(sample_size=2, seed=0)
+        self.assertFalse(np.isnan(error))
+
     def test_calculate_freq_1(self):
         sequence_file = SequenceFile('test')
         for s in [Sequence('foo', 'AAAAAAA'), Sequence('bar', 'A-AAAA-'), Sequence('cho', '--AAA--')]:
@@ -345,6 +548,24 @@ class TestSequenceFile(unittest.TestCase):
         filtered = sequence_file.filter(min_id=0.1, max_id=0.9)
         self.assertEqual(['foo'], [s.id for s in filtered])
 
+    def test_filter_6(self):
+        sequence_file = SequenceFile('test')
+        for seq in [Sequence('foo', 'AAAAAA'), Sequence('bar', 'AAAAAB'), Sequence('doe', 'AAAABB')]:
+            sequence_file.add(seq)
+        filtered = sequence_file.filter(min_id=0.0, max_id=0.8)
+        self.assertEqual(['foo', 'doe'], [s.id for s in filtered])
+        self.assertEqual(['foo', 'bar', 'doe'], [s.id for s in sequence_file])
+        sequence_file.filter(min_id=0.0, max_id=0.8, inplace=True)
+        self.assertEqual(['foo', 'doe'], [s.id for s in sequence_file])
+
+    def test_filter_7(self):
+        sequence_file = SequenceFile('test')
+        sequence_file.add(Sequence('foo', 'AAAAAA'))
+        with self.assertRaises(ValueError):
+            sequence_file.filter(min_id=-0.1)
+        with self.assertRaises(ValueError):
+            sequence_file.filter(max_id=1.1)
+
     def test_diversity_1(self):
         sequence_file = SequenceFile('test')
         for seq in [Sequence('foo', 'AAAAAA'), Sequence('bar', 'CCCCCC'), Sequence('doe', 'BBBBBB')]:
@@ -33,16 +33,23 @@ __author__ = 'Felix Simkovic'
 __date__ = '13 Sep 2016'
 __version__ = "0.1"
 
+import collections
 import importlib
+import multiprocessing
 import os
+import pickle
 
 from conkit.io._cache import PARSER_CACHE
-from conkit.io._iotools import open_f_handle
+from conkit.io._iotools import detect_compression, is_str_like, open_f_handle
+from conkit.io._parser import ContactFileParser, SequenceFileParser
 
 # Accessed by some modules - might be deprecated in the future
 CONTACT_FILE_PARSERS = PARSER_CACHE.contact_file_parsers
 SEQUENCE_FILE_PARSERS = PARSER_CACHE.sequence_file_parsers
 
+# The outcome of reading a single file with read_many
+ReadResult = collections.namedtuple('ReadResult', ['fname', 'hierarchy', 'error'])
+
 
 def convert(fname_in, format_in, fname_out, format_out):
     """Convert a file in format x to file in format y
@@ -75,17 +82,81 @@ def convert(fname_in, format_in, fname_out, format_out):
     >>> with open('example.out', 'r') as f_in, open('example.rr', 'w') as f_out:
     ...     io.convert(f_in, 'pconsc3', f_out, 'casprr'))
 
+    If both formats support streaming, records are piped from one file to the other
+    without reading the entire file. This applies to conversions between the A3M,
+    FASTA and Jones sequence formats, and from single-map line-based contact formats,
+    such as PSICOV or EVfold, to the CASP RR, PSICOV, EVfold, FreeContact, plmDCA,
+    COMSAT, MemBrain, EPC-Map and Pcons formats. Raw scores outside [0, 1] are rescaled
+    for the CASP RR format in a first pass over the input file, if it is seekable.
+
     """
     if format_in in CONTACT_FILE_PARSERS and format_out in SEQUENCE_FILE_PARSERS:
         raise ValueError("Cannot convert contact file to sequence file")
     elif format_in in SEQUENCE_FILE_PARSERS and format_out in CONTACT_FILE_PARSERS:
         raise ValueError("Cannot convert sequence file to contact file")
-    else:
+
+    for format in (format_in, format_out):
+        if format not in PARSER_CACHE:
+            raise ValueError("Unrecognised format: '{}'".format(format))
+    parser_in = PARSER_CACHE.import_class(format_in)()
+    parser_out = PARSER_CACHE.import_class(format_out)()
+
+    # Insert states are only kept by reading the entire alignment
+    streaming = format_in != "a3m-inserts" and _supports_streaming(parser_in, parser_out)
+    # Raw scores are rescaled for the CASP RR format, which requires a second pass over the input
+    if format_out == "casprr":
+        streaming = streaming and _seekable(fname_in)
+
+    if not streaming:
         hierarchy = read(fname_in, format_in)
         write(fname_out, format_out, hierarchy)
+        return
 
+    kwargs = {}
+    if format_out in ["flib", "pconsc", "pconsc2"]:
+        kwargs["write_header_footer"] = False
 
-def read(fname, format, f_id='conkit'):
+    with open_f_handle(fname_in, "read", binary=parser_in.binary) as f_in:
+        if format_out == "casprr":
+            kwargs["score_range"] = _score_range(parser_in, f_in)
+        hierarchy, records = parser_in.read_stream(f_in)
+        with open_f_handle(fname_out, "write", binary=parser_out.binary) as f_out:
+            parser_out.write_stream(f_out, hierarchy, records, **kwargs)
+
+
+def _supports_streaming(parser_in, parser_out):
+    """Check whether records can be piped from one parser to the other"""
+    for parent in (ContactFileParser, SequenceFileParser):
+        if isinstance(parser_in, parent) and isinstance(parser_out, parent):
+            return parser_in._streams('read') and parser_out._streams('write')
+    return False
+
+
+def _seekable(fname):
+    """Check whether a file can be read more than once"""
+    if is_str_like(fname):
+        return detect_compression(fname) is None
+    try:
+        fname.tell()
+    except (AttributeError, IOError, OSError):
+        return False
+    return True
+
+
+def _score_range(parser, f_handle):
+    """Scan the minimum and maximum raw score in a contact file and rewind the file handle"""
+    position = f_handle.tell()
+    score_min = score_max = None
+    for record in parser.read_stream(f_handle)[1]:
+        if score_min is None or record.raw_score < score_min:
+            score_min = record.raw_score
+        if score_max is None or record.raw_score > score_max:
+            score_max = record.raw_score
+    f_handle.seek(position)
+    return None if score_min is None else (score_min, score_max)
+
+
+def read(fname, format, f_id='conkit', min_separation=0, top=None, min_score=None):
     """Parse a file handle to read into structure
 
     Parameters
@@ -95,12 +166,23 @@ def read(fname, format, f_id='conkit'):
        File format of handle
     f_id : str
        Identifier for the returned file
+    min_separation : int, optional
+       The minimum sequence separation of the contacts to read [default: 0]
+    top : int, optional
+       The maximum number of highest scoring contacts to read per contact map [default: all]
+    min_score : float, optional
+       The minimum raw score of the contacts to read [default: all]
 
     Returns
     -------
     hierarchy
        The hierarchy instance of the requested file
 
+    Raises
+    ------
+    ValueError
+       Contacts are selected from a file that is not a contact file
+
     Examples
     --------
     1) Read a Multiple Sequence Alignment file into a ConKit hierarchy:
@@ -115,22 +197,225 @@ def read(fname, format, f_id='conkit'):
     >>> with open('example.mat', 'r') as f_in:
     ...     hierarchy = io.read(f_in, 'ccmpred')
 
+    3) Read the top-50 contacts with a minimum sequence separation of 5 residues:
+
+    >>> from conkit import io
+    >>> hierarchy = io.read('example.txt', 'psicov', top=50, min_separation=5)
+
+    Notes
+    -----
+    Selecting contacts while reading is equivalent to calling :meth:`remove_neighbors
+    <conkit.core.contactmap.ContactMap.remove_neighbors>`, sorting by ``raw_score`` in
+    descending order and slicing the top contacts of each contact map, but line-based
+    formats and CCMpred matrices only ever store the selected contacts.
+
+    Files compressed with ``gzip``, ``bzip2`` or ``xz`` are decompressed while they
+    are read, see :func:`open_f_handle <conkit.io._iotools.open_f_handle>`.
+
     """
     if format in PARSER_CACHE:
         parser_in = PARSER_CACHE.import_class(format)()
     else:
         raise ValueError("Unrecognised format: '{}'".format(format))
 
+    selected = min_separation > 0 or top is not None or min_score is not None
+    if selected and format not in CONTACT_FILE_PARSERS:
+        raise ValueError("Contacts can only be selected in contact files")
+
     kwargs = {"f_id": f_id}
     if format == "a3m-inserts":
-        kwargs["remove_inserts"] = False
+        kwargs["remove_insert"] = False
 
-    with open_f_handle(fname, "read") as f_in:
-        hierarchy = parser_in.read(f_in, **kwargs)
+    with open_f_handle(fname, "read", binary=parser_in.binary) as f_in:
+        if selected:
+            hierarchy = parser_in.read_selected(
+                f_in, min_separation=min_separation, top=top, min_score=min_score, **kwargs)
+        else:
+            hierarchy = parser_in.read(f_in, **kwargs)
 
     return hierarchy
 
 
+def read_many(fnames, format, workers=None, ordered=True, **kwargs):
+    """Parse many files in parallel into structures
+
+    Parameters
+    ----------
+    fnames : list, tuple
+       The names of the files to read
+    format : str
+       File format of all files
+    workers : int, optional
+       The number of processes reading files [default: number of CPUs]
+    ordered : bool, optional
+       Yield the files in the order of ``fnames`` instead of as they are read [default: True]
+    **kwargs
+       Any keyword argument of :func:`read`, e.g. ``f_id`` or ``top``
+
+    Returns
+    -------
+    generator
+       A :obj:`ReadResult <conkit.io.ReadResult>` for each file, with the fields ``fname``,
+       ``hierarchy`` and ``error``. If a file cannot be read, ``hierarchy`` is :obj:`None`
+       and ``error`` is the exception raised.
+
+    Raises
+    ------
+    ValueError
+       Unrecognised format
+
+    Examples
+    --------
+    1) Read the top-50 contacts of many PSICOV predictions on four processes:
+
+    >>> from conkit import io
+    >>> for result in io.read_many(['1.psicov', '2.psicov'], 'psicov', workers=4, top=50):
+    ...     if result.error is None:
+    ...         print(result.fname, result.hierarchy.top_map.ncontacts)
+
+    Notes
+    -----
+    Contact maps are always returned in column storage, regardless of ``workers``. This lets
+    the worker processes send the contacts back as NumPy arrays.
+
+    """
+    if format not in PARSER_CACHE:
+        raise ValueError("Unrecognised format: '{}'".format(format))
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+
+    fnames = list(fnames)
+    if workers <= 1 or len(fnames) <= 1:
+        return (_read_one((fname, format, kwargs)) for fname in fnames)
+    return _read_many([(fname, format, kwargs) for fname in fnames], min(workers, len(fnames)), ordered)
+
+
+def _read_many(jobs, workers, ordered):
+    """Read the files of :func:`read_many` in a process pool"""
+    chunksize = max(1, len(jobs) // (4 * workers))
+    pool = multiprocessing.Pool(workers)
+    try:
+        imap = pool.imap if ordered else pool.imap_unordered
+        for result in imap(_read_one, jobs, chunksize):
+            yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _read_one(job):
+    """Read a single file of :func:`read_many` and capture any error"""
+    fname, format, kwargs = job
+    try:
+        hierarchy = read(fname, format, **kwargs)
+    except Exception as e:
+        try:
+            pickle.dumps(e)
+        except Exception:
+            e = RuntimeError("{}: {}".format(e.__class__.__name__, e))
+        return ReadResult(fname, None, e)
+
+    if format in CONTACT_FILE_PARSERS:
+        # Pickle the contacts as arrays rather than one Contact instance at a time
+        for contact_map in hierarchy:
+            contact_map.to_columnar(inplace=True)
+    return ReadResult(fname, hierarchy, None)
+
+
+def iter_contacts(fname, format, **kwargs):
+    """Iterate over the contacts in a contact file without reading the entire file
+
+    Parameters
+    ----------
+    fname : filehandle, filename
+    format : str
+       File format of handle
+    **kwargs
+       Any keyword argument accepted by the ``iter_contacts`` method of the parser
+
+    Returns
+    -------
+    generator
+       A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact, with the
+       fields ``map_id``, ``res1_seq``, ``res2_seq``, ``raw_score``, ``res1``, ``res2``, ``res1_chain``,
+       ``res2_chain``, ``lower_bound``, ``upper_bound`` and ``scalar_score``
+
+    Raises
+    ------
+    ValueError
+       The format is not a contact file format
+
+    Examples
+    --------
+    1) Count the long-range contacts scoring above 0.5 in a CASP RR file:
+
+    >>> from conkit import io
+    >>> sum(1 for c in io.iter_contacts('example.rr', 'casprr')
+    ...     if c.raw_score > 0.5 and c.res2_seq - c.res1_seq >= 24)
+
+    Notes
+    -----
+    Line-based formats yield each contact as it is read, so the file is processed in constant
+    memory. The remaining formats read the entire file first.
+
+    """
+    if format not in CONTACT_FILE_PARSERS:
+        raise ValueError("Unrecognised contact file format: '{}'".format(format))
+    parser_in = PARSER_CACHE.import_class(format)()
+
+    with open_f_handle(fname, "read", binary=parser_in.binary) as f_in:
+        for record in parser_in.iter_contacts(f_in, **kwargs):
+            yield record
+
+
+def iter_sequences(fname, format):
+    """Iterate over the sequences in a sequence file without reading the entire file
+
+    Parameters
+    ----------
+    fname : filehandle, filename
+    format : str
+       File format of handle
+
+    Returns
+    -------
+    generator
+       A :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>` for each sequence, with the
+       fields ``id``, ``seq`` and ``remark``
+
+    Raises
+    ------
+    ValueError
+       The format is not a sequence file format
+
+    Examples
+    --------
+    1) Count the sequences in an A3M alignment covering more than half of the alignment:
+
+    >>> from conkit import io
+    >>> sum(1 for s in io.iter_sequences('example.a3m', 'a3m')
+    ...     if len(s.seq) - s.seq.count('-') > 0.5 * len(s.seq))
+
+    Notes
+    -----
+    The A3M, FASTA and Jones formats yield each sequence as it is read, so the file is processed
+    in constant memory. The remaining formats read the entire file first.
+
+    """
+    if format not in SEQUENCE_FILE_PARSERS:
+        raise ValueError("Unrecognised sequence file format: '{}'".format(format))
+    parser_in = PARSER_CACHE.import_class(format)()
+
+    kwargs = {}
+    if format == "a3m-inserts":
+        kwargs["remove_insert"] = False
+
+    with open_f_handle(fname, "read", binary=parser_in.binary) as f_in:
+        for record in parser_in.iter_sequences(f_in, **kwargs):
+            yield record
+
+
 def write(fname, format, hierarchy):
     """Parse a file handle to read into structure
 
@@ -168,5 +453,5 @@ def write(fname, format, hierarchy):
     if format in ["flib", "pconsc", "pconsc2"]:
         kwargs["write_header_footer"] = False
 
-    with open_f_handle(fname, 'write') as f_out:
+    with open_f_handle(fname, 'write', binary=parser_out.binary) as f_out:
         parser_out.write(f_out, hierarchy, **kwargs)
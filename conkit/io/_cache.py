@@ -76,6 +76,8 @@ class _ParserCache(object):
     MASKS = {
         "a3m": ["a3m", "a3m-inserts"],
         "casp": ["casp", "casprr"],
+        "ccmprednpz": ["ccmpred-npz"],
+        "conkitnpz": ["conkit-npz"],
         "pcons": ["flib", "pconsc", "pconsc2", "pconsc3"],
         "psicov": ["psicov", "metapsicov"]
     }
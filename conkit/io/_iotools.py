@@ -33,9 +33,311 @@ __author__ = "Felix Simkovic"
 __date__ = "20 Nov 2016"
 __version__ = "0.1"
 
+import bz2
+import gzip
 import io
+import numpy as np
+import os
+import shutil
+import struct
 import sys
 import tempfile
+import threading
+import zipfile
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+# The default number of characters collected by a LineWriter before writing them to file
+BUFFER_SIZE = 2 ** 16
+
+# The file extension and magic bytes of each supported compression
+COMPRESSIONS = (
+    ('gz', b'\x1f\x8b'),
+    ('bz2', b'BZh'),
+    ('xz', b'\xfd7zXZ\x00'),
+)
+
+
+class LineWriter(object):
+    """Buffered writer for line-based file formats
+
+    Lines are collected in a list and written to the file handle in a single call
+    once the buffer holds more than ``buffer_size`` characters, so the memory used
+    is independent of the size of the file and the time linear in it.
+
+    Examples
+    --------
+    >>> import sys
+    >>> from conkit.io._iotools import LineWriter
+    >>> with LineWriter(sys.stdout) as writer:
+    ...     writer.write_line("PFRMAT RR")
+    ...     writer.write_lines(["MODEL  1", "END"])
+    PFRMAT RR
+    MODEL  1
+    END
+
+    """
+    __slots__ = ['f_handle', 'buffer_size', '_buffer', '_size']
+
+    def __init__(self, f_handle, buffer_size=None):
+        """Initialise a new writer
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions]
+        buffer_size : int, optional
+           The number of characters to collect before writing to ``f_handle`` [default: :data:`BUFFER_SIZE`]
+
+        """
+        self.f_handle = f_handle
+        self.buffer_size = BUFFER_SIZE if buffer_size is None else buffer_size
+        self._buffer = []
+        self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def flush(self):
+        """Write all collected text to the file handle"""
+        if self._buffer:
+            self.f_handle.write("".join(self._buffer))
+        self._buffer = []
+        self._size = 0
+
+    def write(self, text):
+        """Write text without a line separator
+
+        Parameters
+        ----------
+        text : str
+
+        """
+        self._buffer.append(text)
+        self._size += len(text)
+        if self._size > self.buffer_size:
+            self.flush()
+
+    def write_line(self, line):
+        """Write a single line
+
+        Parameters
+        ----------
+        line : str
+           The line without line separator
+
+        """
+        self.write(line + os.linesep)
+
+    def write_lines(self, lines):
+        """Write many lines
+
+        Parameters
+        ----------
+        lines : list, tuple, generator
+           The lines without line separator
+
+        """
+        for line in lines:
+            self.write(line + os.linesep)
+
+
+class ReadAheadReader(io.RawIOBase):
+    """Raw reader that reads a file handle ahead on a background thread
+
+    Chunks are read from the wrapped file handle into a bounded queue while the
+    caller consumes earlier ones, so decompression, which releases the GIL, overlaps
+    with parsing. Wrap it in a :obj:`io.BufferedReader` for line-based access.
+
+    Examples
+    --------
+    >>> import gzip, io
+    >>> from conkit.io._iotools import ReadAheadReader
+    >>> with io.BufferedReader(ReadAheadReader(gzip.open('test.fasta.gz', 'rb'))) as f_in:
+    ...     header = f_in.readline()
+
+    """
+
+    def __init__(self, f_handle, chunk_size=None, depth=8):
+        """Initialise a new reader and start reading ahead
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [binary read permissions]
+        chunk_size : int, optional
+           The number of bytes per read from ``f_handle`` [default: :data:`BUFFER_SIZE`]
+        depth : int, optional
+           The maximum number of chunks read ahead [default: 8]
+
+        """
+        super(ReadAheadReader, self).__init__()
+        self.f_handle = f_handle
+        self.mode = 'rb'
+        self._chunks = queue.Queue(depth)
+        self._stop = threading.Event()
+        self._chunk = b''
+        self._offset = 0
+        self._eof = False
+        self._thread = threading.Thread(target=self._fill, args=(chunk_size or BUFFER_SIZE, ))
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def name(self):
+        """The name of the wrapped file handle"""
+        return getattr(self.f_handle, 'name', None)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        """Read bytes into a pre-allocated buffer
+
+        Parameters
+        ----------
+        b : bytearray, memoryview
+
+        Returns
+        -------
+        int
+           The number of bytes read, 0 at the end of the file
+
+        """
+        if self._offset >= len(self._chunk):
+            if self._eof:
+                return 0
+            chunk = self._chunks.get()
+            if isinstance(chunk, Exception):
+                self._eof = True
+                raise chunk
+            elif not chunk:
+                self._eof = True
+                return 0
+            self._chunk, self._offset = chunk, 0
+        n = min(len(b), len(self._chunk) - self._offset)
+        b[:n] = self._chunk[self._offset:self._offset + n]
+        self._offset += n
+        return n
+
+    def close(self):
+        """Stop reading ahead and close the wrapped file handle"""
+        if not self.closed:
+            self._stop.set()
+            self._thread.join()
+            self.f_handle.close()
+        super(ReadAheadReader, self).close()
+
+    def _fill(self, chunk_size):
+        """Read chunks into the queue until the end of the file or until closed"""
+        try:
+            while not self._stop.is_set():
+                chunk = self.f_handle.read(chunk_size)
+                self._put(chunk)
+                if not chunk:
+                    return
+        except Exception as e:
+            self._put(e)
+
+    def _put(self, item):
+        """Put an item into the queue unless the reader is closed in the meantime"""
+        while not self._stop.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+
+class CompressingWriter(object):
+    """Seekable binary writer that compresses its content into a file when closed
+
+    Compressed streams cannot seek in write mode, but :obj:`zipfile.ZipFile`, and
+    with it :func:`numpy.savez`, rewrites the headers of an archive. The content is
+    therefore collected in a temporary file, held in memory up to a few megabytes,
+    and compressed in a single pass on :meth:`close`. If the writer is left through
+    an exception, the content is discarded and ``fname`` is never created.
+
+    Examples
+    --------
+    >>> import gzip, numpy as np
+    >>> from conkit.io._iotools import CompressingWriter
+    >>> with CompressingWriter('matrix.npz.gz', gzip.GzipFile) as f_out:
+    ...     np.savez(f_out, matrix=np.eye(3))
+
+    """
+
+    def __init__(self, fname, opener, mode='wb'):
+        """Initialise a new writer
+
+        Parameters
+        ----------
+        fname : str
+           The path to the compressed file
+        opener : callable
+           Opens the compressed file given ``fname`` and ``mode``, e.g. :obj:`gzip.GzipFile`
+        mode : str, optional
+           The mode to open the compressed file in [default: 'wb']
+
+        """
+        self.name = fname
+        self.mode = mode
+        self._opener = opener
+        self._buffer = tempfile.SpooledTemporaryFile(max_size=BUFFER_SIZE * 64)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self._buffer.close()
+
+    @property
+    def closed(self):
+        return self._buffer.closed
+
+    def flush(self):
+        self._buffer.flush()
+
+    def read(self, size=-1):
+        return self._buffer.read(size)
+
+    def seek(self, offset, whence=0):
+        return self._buffer.seek(offset, whence)
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self._buffer.tell()
+
+    def write(self, data):
+        return self._buffer.write(data)
+
+    def close(self):
+        """Compress the content into the file"""
+        if self.closed:
+            return
+        try:
+            self._buffer.seek(0)
+            with self._opener(self.name, self.mode) as f_out:
+                shutil.copyfileobj(self._buffer, f_out, BUFFER_SIZE)
+        finally:
+            self._buffer.close()
 
 
 def create_tmp_f(content=None, mode='w'):
@@ -63,6 +365,42 @@ def create_tmp_f(content=None, mode='w'):
     return f_in.name
 
 
+def detect_compression(fname, mode='read'):
+    """Detect the compression of a file
+
+    Parameters
+    ----------
+    fname : str
+       The path to the file
+    mode : str, optional
+       read, write or append [default: 'read']
+
+    Returns
+    -------
+    str
+       The compression, i.e. ``gz``, ``bz2`` or ``xz``, or :obj:`None` if the file is not compressed
+
+    Notes
+    -----
+    Files are read by their magic bytes if they exist, so compressed files without
+    the matching extension are read correctly. Otherwise, and in ``write`` mode, the
+    compression is derived from the file extension.
+
+    """
+    if mode != 'write' and os.path.isfile(fname):
+        with open(fname, 'rb') as f_in:
+            magic = f_in.read(max(len(m) for _, m in COMPRESSIONS))
+        for compression, compression_magic in COMPRESSIONS:
+            if magic.startswith(compression_magic):
+                return compression
+        if mode == 'read' or magic:
+            return None
+    for compression, _ in COMPRESSIONS:
+        if fname.lower().endswith('.' + compression):
+            return compression
+    return None
+
+
 def is_str_like(content):
     """Check if an instance is string-like
 
@@ -88,7 +426,7 @@ def is_str_like(content):
     return True
 
 
-def open_f_handle(f_handle, mode):
+def open_f_handle(f_handle, mode, binary=False):
     """Open a filehandle
 
     Parameters
@@ -97,6 +435,8 @@ def open_f_handle(f_handle, mode):
        A file handle or a file name
     mode : str
        read, write or append
+    binary : bool, optional
+       Open the file in binary mode [default: False]
 
     Returns
     -------
@@ -110,20 +450,107 @@ def open_f_handle(f_handle, mode):
     ValueError
        Mode needs to be one of: append, read, write
 
+    Notes
+    -----
+    File names of ``gz``, ``bz2`` and ``xz`` compressed files are decompressed on
+    read and compressed on write, see :func:`detect_compression`. Text is read ahead
+    on a background thread. Binary files are returned seekable, and binary writes are
+    compressed once the file handle is closed, see :class:`CompressingWriter`.
+
     """
     # Check the mode of opening the file
     if mode not in ['append', 'read', 'write']:
         raise ValueError('Mode needs to be one of: append, read, write')
-    
+
     try:
-        if is_str_like(f_handle) and sys.version_info.major >= 3:
+        compression = detect_compression(f_handle, mode) if is_str_like(f_handle) else None
+        if compression:
+            return _open_compressed(f_handle, mode, binary, compression)
+        elif is_str_like(f_handle) and binary:
+            return open(f_handle, mode[0] + 'b')
+        elif is_str_like(f_handle) and sys.version_info.major >= 3:
             return io.open(f_handle, mode[0], encoding="utf-8")
         elif is_str_like(f_handle):
             return open(f_handle, mode[0])
-        elif f_handle.mode == mode[0]:
+        elif f_handle.mode == mode[0] + ('b' if binary else ''):
             return f_handle
         else:
             raise TypeError("f_handle must be str or filehandle")
     except AttributeError:
         raise TypeError("f_handle must be str or filehandle")
 
+
+def _open_compressed(fname, mode, binary, compression):
+    """Open a compressed file for streamed (de-)compression"""
+    if compression == 'gz':
+        opener = gzip.GzipFile
+    elif compression == 'bz2':
+        opener = bz2.BZ2File
+    elif lzma is None:
+        raise ImportError("The lzma module is required for xz compressed files")
+    else:
+        opener = lzma.LZMAFile
+
+    if binary and mode == 'read':
+        return opener(fname, 'rb')
+    elif binary:
+        return CompressingWriter(fname, opener, mode[0] + 'b')
+    elif mode == 'read':
+        f_handle = io.BufferedReader(ReadAheadReader(opener(fname, 'rb')), BUFFER_SIZE)
+    else:
+        f_handle = io.BufferedWriter(opener(fname, mode[0] + 'b'), BUFFER_SIZE)
+
+    if sys.version_info.major >= 3:
+        f_handle = io.TextIOWrapper(f_handle, encoding="utf-8")
+        f_handle.mode = mode[0]
+    return f_handle
+
+
+def memmap_npz_member(fname, name, mode='r'):
+    """Memory-map an array stored in a NumPy ``.npz`` archive
+
+    Parameters
+    ----------
+    fname : str
+       The path to the archive
+    name : str
+       The name of the array in the archive
+    mode : str, optional
+       The :obj:`numpy.memmap` mode [default: 'r']
+
+    Returns
+    -------
+    :obj:`numpy.memmap`
+       The memory-mapped array, or :obj:`None` if the array is compressed, empty or holds Python objects
+
+    Raises
+    ------
+    KeyError
+       The array is not in the archive
+
+    Notes
+    -----
+    :func:`numpy.load` ignores ``mmap_mode`` for ``.npz`` archives. Arrays written with
+    :func:`numpy.savez` are stored uncompressed though, so the ``.npy`` data of each
+    member can be mapped directly from its offset in the archive.
+
+    """
+    with zipfile.ZipFile(fname) as archive:
+        info = archive.getinfo(name + '.npy')
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(fname, 'rb') as f_in:
+        # The local file header has its own file name and extra field lengths
+        f_in.seek(info.header_offset)
+        header = f_in.read(30)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        f_in.seek(info.header_offset + 30 + name_length + extra_length)
+        version = np.lib.format.read_magic(f_in)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f_in)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f_in)
+        offset = f_in.tell()
+    if dtype.hasobject or 0 in shape:
+        return None
+    return np.memmap(fname, dtype=dtype, mode=mode, offset=offset, shape=shape, order='F' if fortran_order else 'C')
@@ -36,6 +36,11 @@ __date__ = "04 Oct 2016"
 __version__ = "0.1"
 
 import abc
+import collections
+import heapq
+import itertools
+import numpy as np
+import operator
 
 ABC = abc.ABCMeta('ABC', (object,), {})
 
@@ -44,12 +49,28 @@ from conkit.core.contactmap import ContactMap
 from conkit.core.contactfile import ContactFile
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
+from conkit.io._iotools import LineWriter
+
+# Lightweight records yielded by the streaming parser interfaces
+ContactRecord = collections.namedtuple(
+    'ContactRecord', ['map_id', 'res1_seq', 'res2_seq', 'raw_score', 'res1', 'res2', 'res1_chain', 'res2_chain',
+                      'lower_bound', 'upper_bound', 'scalar_score']
+)
+ContactRecord.__new__.__defaults__ = ('X', 'X', '', '', 0.0, 8.0, 0.0)
+SequenceRecord = collections.namedtuple('SequenceRecord', ['id', 'seq', 'remark'])
+SequenceRecord.__new__.__defaults__ = ((), )
+
+# The number of records transposed into columns at once, small enough for the records to be short-lived
+RECORD_CHUNK_SIZE = 2 ** 10
 
 
 class Parser(ABC):
     """Abstract class for all parsers
 
     """
+    # Parsers of binary formats require file handles opened in binary mode
+    binary = False
+
     @abc.abstractmethod
     def read(self):
         pass
@@ -80,10 +101,334 @@ class Parser(ABC):
     
 
 class ContactFileParser(Parser):
-    """General purpose class for all contact file parsers"""
-    pass
-    
+    """General purpose class for all contact file parsers
+
+    Parsers of line-based formats storing a single contact map support streaming by
+    setting :attr:`method` and implementing :meth:`_format_line`, and optionally the
+    :meth:`_write_header` and :meth:`_write_footer` hooks.
+
+    """
+    # The method of the contact files of formats holding a single contact map without metadata
+    method = None
+
+    def iter_contacts(self, f_handle, **kwargs):
+        """Iterate over the contacts in a contact file
+
+        Parsers of line-based formats override this method to yield each contact
+        as it is read. By default, the entire file is read first.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        **kwargs
+           Any keyword argument of :meth:`read`
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord` for each contact
+
+        """
+        for contact_map in self.read(f_handle, **kwargs):
+            for contact in contact_map:
+                yield ContactRecord(
+                    contact_map.id, contact.res1_seq, contact.res2_seq, contact.raw_score, contact.res1, contact.res2,
+                    contact.res1_chain, contact.res2_chain, contact.lower_bound, contact.upper_bound,
+                    contact.scalar_score
+                )
+
+    def read_selected(self, f_handle, f_id="conkit", min_separation=0, top=None, min_score=None):
+        """Read only the selected contacts of a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        f_id : str, optional
+           Unique contact file identifier
+        min_separation : int, optional
+           The minimum sequence separation of the contacts to read [default: 0]
+        top : int, optional
+           The maximum number of highest scoring contacts to read per contact map [default: all]
+        min_score : float, optional
+           The minimum raw score of the contacts to read [default: all]
+
+        Returns
+        -------
+        :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
+
+        Notes
+        -----
+        If ``top`` is provided, the contacts are sorted by raw score in descending order.
+        Contacts with the same raw score remain in the order of the file.
+
+        Formats supporting :meth:`read_stream` select the contacts while reading and keep the
+        ``top`` contacts in a bounded heap, so only the selected contacts are ever stored.
+        All other formats are read entirely before the contacts are selected.
+
+        """
+        try:
+            contact_file, records = self.read_stream(f_handle, f_id=f_id)
+        except NotImplementedError:
+            contact_file = self.read(f_handle, f_id=f_id)
+            for contact_map in contact_file:
+                self._select_contacts(contact_map, min_separation, top, min_score)
+            return contact_file
+
+        if min_separation > 0:
+            records = (r for r in records if abs(r.res2_seq - r.res1_seq) >= min_separation)
+        if min_score is not None:
+            records = (r for r in records if r.raw_score >= min_score)
+        if top is not None:
+            # Equivalent to a stable sort in descending order followed by slicing
+            records = heapq.nlargest(max(top, 0), records, key=operator.attrgetter('raw_score'))
+
+        contact_file.add(self._contact_map_from_records(records))
+        return contact_file
+
+    @staticmethod
+    def _select_contacts(contact_map, min_separation, top, min_score):
+        """Select the contacts of a contact map in place"""
+        if min_separation > 0:
+            contact_map.remove_neighbors(min_distance=min_separation, inplace=True)
+        if min_score is not None:
+            if contact_map.columnar:
+                raw_scores = contact_map._columns.raw_score
+            else:
+                raw_scores = np.array([c.raw_score for c in contact_map])
+            contact_map.keep(raw_scores >= min_score)
+        if top is not None:
+            contact_map.sort('raw_score', reverse=True, inplace=True)
+            contact_map.keep(np.arange(len(contact_map)) < top)
+
+    @staticmethod
+    def _contact_map_from_records(records, map_id="map_1", altloc=False):
+        """Create a column-stored contact map from contact records of a single map
+
+        Parameters
+        ----------
+        records
+           An iterable of :obj:`ContactRecord`
+        map_id : str, optional
+           The identifier of the contact map if there are no records [default: map_1]
+        altloc : bool, optional
+           Set the alternative residue sequence numbers to the residue sequence numbers [default: False]
+
+        Returns
+        -------
+        :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+
+        """
+        # Records are transposed into NumPy columns in chunks, so only the records of one chunk
+        # exist at once. Columns holding only the default value use the column storage defaults.
+        records = iter(records)
+        fields = ContactRecord._fields[1:]
+        defaults = dict(zip(ContactRecord._fields[-len(ContactRecord.__new__.__defaults__):],
+                            ContactRecord.__new__.__defaults__))
+        chunks = []
+        while True:
+            chunk = list(itertools.islice(records, RECORD_CHUNK_SIZE))
+            if not chunk:
+                break
+            map_id = chunk[-1].map_id
+            columns = list(zip(*chunk))[1:]
+            chunks.append([None if field in defaults and column.count(defaults[field]) == len(column)
+                           else np.asarray(column) for field, column in zip(fields, columns)])
+
+        if not chunks:
+            return ContactMap(map_id)
+        columns = {}
+        for i, field in enumerate(fields):
+            column = [chunk[i] for chunk in chunks]
+            if any(c is not None for c in column):
+                sizes = [len(chunk[0]) for chunk in chunks]
+                column = [np.full(n, defaults[field]) if c is None else c for c, n in zip(column, sizes)]
+                columns[field] = np.concatenate(column)
+        if altloc:
+            columns['res1_altseq'], columns['res2_altseq'] = columns['res1_seq'], columns['res2_seq']
+        return ContactMap.from_arrays(
+            columns.pop('res1_seq').astype(np.int64), columns.pop('res2_seq').astype(np.int64),
+            columns.pop('raw_score'), id=map_id, **columns
+        )
+
+    def _contact_file_from_records(self, contact_file, records):
+        """Add a column-stored contact map to ``contact_file`` for the records of each map"""
+        contact_maps = collections.OrderedDict()
+        for record in records:
+            contact_maps.setdefault(record.map_id, []).append(record)
+        for map_id, map_records in contact_maps.items():
+            contact_file.add(self._contact_map_from_records(map_records, map_id=map_id))
+        return contact_file
+
+    def read_stream(self, f_handle, f_id="conkit"):
+        """Read the metadata of a contact file and iterate over its contacts
+
+        Formats holding a single contact map, whose contacts :meth:`iter_contacts` yields in
+        the order of :meth:`read`, set :attr:`method` so that files can be converted without
+        reading the entire file.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        f_id : str, optional
+           Unique contact file identifier
+
+        Returns
+        -------
+        tuple
+           The :obj:`ContactFile <conkit.core.contactfile.ContactFile>` without any contact map
+           and a generator of :obj:`ContactRecord` for each contact
+
+        Raises
+        ------
+        NotImplementedError
+           The format does not support streaming
+
+        """
+        if not self._streams('read'):
+            raise NotImplementedError("{} does not support streaming".format(self.__class__.__name__))
+        contact_file = ContactFile(f_id)
+        contact_file.method = self.method
+        return contact_file, self.iter_contacts(f_handle)
+
+    def write_stream(self, f_handle, hierarchy, records, **kwargs):
+        """Write a contact file from its metadata and an iterable of contacts
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions]
+        hierarchy : :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
+           The contact file metadata, as returned by :meth:`read_stream`
+        records
+           An iterable of :obj:`ContactRecord`
+        **kwargs
+           Any keyword argument of :meth:`write`
+
+        Raises
+        ------
+        NotImplementedError
+           The format does not support streaming
+
+        """
+        if not self._streams('write'):
+            raise NotImplementedError("{} does not support streaming".format(self.__class__.__name__))
+        self._write_lines(f_handle, hierarchy, None, records, **kwargs)
+
+    @classmethod
+    def _streams(cls, mode):
+        """Check whether the format supports :meth:`read_stream` or :meth:`write_stream`"""
+        if mode == 'read':
+            return cls.method is not None or cls.read_stream != ContactFileParser.read_stream
+        return cls._format_line != ContactFileParser._format_line or cls.write_stream != ContactFileParser.write_stream
+
+    def _write_single_map(self, f_handle, hierarchy, **kwargs):
+        """Write a contact file holding at most one contact map line by line"""
+        contact_file = self._reconstruct(hierarchy)
+
+        if len(contact_file) > 1:
+            raise RuntimeError('More than one contact map provided')
+
+        for contact_map in contact_file:
+            self._write_lines(f_handle, contact_file, contact_map.sequence, contact_map, **kwargs)
+
+    def _write_lines(self, f_handle, hierarchy, sequence, contacts, **kwargs):
+        """Write the header, a line for each contact and the footer"""
+        with LineWriter(f_handle) as writer:
+            self._write_header(writer, hierarchy, sequence, **kwargs)
+            writer.write_lines(self._format_line(contact) for contact in contacts)
+            self._write_footer(writer, hierarchy, **kwargs)
+
+    def _write_header(self, writer, hierarchy, sequence, **kwargs):
+        """Write the lines preceding the contacts, if any"""
+        pass
+
+    def _write_footer(self, writer, hierarchy, **kwargs):
+        """Write the lines following the contacts, if any"""
+        pass
+
+    def _format_line(self, contact):
+        """Format a :obj:`Contact <conkit.core.contact.Contact>` or :obj:`ContactRecord` as a line"""
+        raise NotImplementedError("{} does not support streaming".format(self.__class__.__name__))
+
 
 class SequenceFileParser(Parser):
     """General purpose class for all sequence file parsers"""
-    pass
+
+    def iter_sequences(self, f_handle, **kwargs):
+        """Iterate over the sequences in a sequence file
+
+        Parsers of formats storing each sequence in one block override this method
+        to yield each sequence as it is read. By default, the entire file is read first.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        **kwargs
+           Any keyword argument of :meth:`read`
+
+        Returns
+        -------
+        generator
+           A :obj:`SequenceRecord` for each sequence
+
+        """
+        for sequence in self.read(f_handle, **kwargs):
+            yield SequenceRecord(sequence.id, sequence.seq, tuple(sequence.remark))
+
+    def read_stream(self, f_handle, f_id="conkit"):
+        """Read the metadata of a sequence file and iterate over its sequences
+
+        Parsers of formats whose sequences :meth:`iter_sequences` yields as they are read
+        override this method so that files can be converted without reading the entire file.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        f_id : str, optional
+           Unique sequence file identifier
+
+        Returns
+        -------
+        tuple
+           The :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` without any sequence
+           and a generator of :obj:`SequenceRecord` for each sequence
+
+        Raises
+        ------
+        NotImplementedError
+           The format does not support streaming
+
+        """
+        raise NotImplementedError("{} does not support streaming".format(self.__class__.__name__))
+
+    @classmethod
+    def _streams(cls, mode):
+        """Check whether the format supports :meth:`read_stream` or :meth:`write_stream`"""
+        if mode == 'read':
+            return cls.read_stream != SequenceFileParser.read_stream
+        return cls.write_stream != SequenceFileParser.write_stream
+
+    def write_stream(self, f_handle, hierarchy, records):
+        """Write a sequence file from its metadata and an iterable of sequences
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions]
+        hierarchy : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+           The sequence file metadata, as returned by :meth:`read_stream`
+        records
+           An iterable of :obj:`SequenceRecord`
+
+        Raises
+        ------
+        NotImplementedError
+           The format does not support streaming
+
+        """
+        raise NotImplementedError("{} does not support streaming".format(self.__class__.__name__))
@@ -40,11 +40,12 @@ __credits__ = "Stefan Seemayer"
 __date__ = "11 Sep 2016"
 __version__ = "0.1"
 
+import itertools
 import numpy as np
-import os
 import re
 
-from conkit.io._parser import SequenceFileParser
+from conkit.io._iotools import LineWriter
+from conkit.io._parser import SequenceFileParser, SequenceRecord
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
 
@@ -178,6 +179,89 @@ class A3mParser(SequenceFileParser):
         return "".join([char for char in seq if not char.islower()])
 
 
+    def iter_sequences(self, f_handle, remove_insert=True):
+        """Iterate over the sequences in a sequence file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        remove_insert : bool, optional
+           Remove insert states [default: True]
+
+        Returns
+        -------
+        generator
+           A :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>` for each sequence
+
+        Notes
+        -----
+        Insert states can only be kept by aligning all sequences to one another, so the entire
+        file is read first if ``remove_insert`` is :obj:`False`. Unlike :meth:`read`, duplicate
+        identifiers are not renamed.
+
+        """
+        if not remove_insert:
+            for record in super(A3mParser, self).iter_sequences(f_handle, remove_insert=False):
+                yield record
+            return
+
+        id, chunks = None, []
+        for line in f_handle:
+            line = line.rstrip()
+
+            if id is None:
+                # Skip any comments before the first record
+                if line.startswith('>'):
+                    id = line[1:]
+                continue
+
+            elif line.startswith('>'):
+                yield SequenceRecord(id, self._remove_insert("".join(chunks)))
+                id, chunks = line[1:], []
+
+            elif not line:
+                break
+
+            else:
+                chunks.append(line)
+
+        if id is not None:
+            yield SequenceRecord(id, self._remove_insert("".join(chunks)))
+
+    def read_stream(self, f_handle, f_id='a3m'):
+        """Read the metadata of a sequence file and iterate over its sequences
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        f_id : str, optional
+           Unique sequence file identifier
+
+        Returns
+        -------
+        tuple
+           The :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` without any sequence
+           and a generator of :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>` for each sequence
+
+        Notes
+        -----
+        Insert states are removed, as in :meth:`iter_sequences`.
+
+        """
+        hierarchy = SequenceFile(f_id)
+
+        # Read any possible comments and store in file remarks
+        line = f_handle.readline()
+        while line and not line.startswith('>'):
+            line = line.rstrip()
+            if line.startswith('#'):
+                hierarchy.remark = line[1:]
+            line = f_handle.readline()
+
+        return hierarchy, self.iter_sequences(itertools.chain([line], f_handle))
+
     def write(self, f_handle, hierarchy):
         """Write a sequence file instance to to file
 
@@ -191,18 +275,35 @@ class A3mParser(SequenceFileParser):
         # Double check the type of hierarchy and reconstruct if necessary
         sequence_file = self._reconstruct(hierarchy)
 
-        content = ""
+        with LineWriter(f_handle) as writer:
+            self._write_sequences(writer, sequence_file.remark, sequence_file)
+
+    def write_stream(self, f_handle, hierarchy, records):
+        """Write a sequence file from its metadata and an iterable of sequences
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions]
+        hierarchy : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+           The sequence file metadata
+        records
+           An iterable of :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>`
+
+        """
+        with LineWriter(f_handle) as writer:
+            self._write_sequences(writer, hierarchy.remark, records)
 
+    @staticmethod
+    def _write_sequences(writer, remarks, sequences):
+        """Write the remarks and a record for each sequence"""
         # Write remarks
-        for remark in sequence_file.remark:
-            content += '#{remark}'.format(remark=remark) + os.linesep
+        for remark in remarks:
+            writer.write_line('#{remark}'.format(remark=remark))
 
-        for sequence_entry in sequence_file:
+        for sequence_entry in sequences:
             header = '>{id}'.format(id=sequence_entry.id)
             if len(sequence_entry.remark) > 0:
-                header = '|'.join([header] + sequence_entry.remark)
-            content += header + os.linesep
-            content += sequence_entry.seq + os.linesep
-
-        f_handle.write(content)
-
+                header = '|'.join([header] + list(sequence_entry.remark))
+            writer.write_line(header)
+            writer.write_line(sequence_entry.seq)
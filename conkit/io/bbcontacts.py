@@ -37,10 +37,7 @@ __version__ = "0.1"
 
 import re
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
-from conkit.core.contactfile import ContactFile
+from conkit.io._parser import ContactFileParser, ContactRecord
 
 RE_COMMENT = re.compile(r'^#+.*$')
 
@@ -48,6 +45,7 @@ RE_COMMENT = re.compile(r'^#+.*$')
 class BbcontactsParser(ContactFileParser):
     """Class to parse a Bbcontacts contact file
     """
+    method = 'Contact map predicted using Bbcontacts'
 
     def __init__(self):
         super(BbcontactsParser, self).__init__()
@@ -68,10 +66,24 @@ class BbcontactsParser(ContactFileParser):
 
         """
 
-        contact_file = ContactFile(f_id)
-        contact_map = ContactMap("map_1")
-        contact_file.add(contact_map)
+        contact_file, records = self.read_stream(f_handle, f_id=f_id)
+        contact_file.add(self._contact_map_from_records(records))
+        return contact_file
+
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
 
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
+
+        """
         for line in f_handle:
             line = line.rstrip()
 
@@ -86,12 +98,7 @@ class BbcontactsParser(ContactFileParser):
                 _, _, _, raw_score, _, _, res2_seq, res1_seq = line.split()
                 if any(value == "NA" for value in [raw_score, res2_seq, res1_seq]):
                     continue
-                contact = Contact(int(res1_seq), int(res2_seq), float(raw_score))
-                contact_map.add(contact)
-
-        contact_file.method = 'Contact map predicted using Bbcontacts'
-
-        return contact_file
+                yield ContactRecord("map_1", int(res1_seq), int(res2_seq), float(raw_score))
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -37,10 +37,7 @@ __version__ = "0.1"
 
 import re
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
-from conkit.core.contactfile import ContactFile
+from conkit.io._parser import ContactFileParser, ContactRecord
 
 RE_SPLIT = re.compile(r'\s+')
 
@@ -48,6 +45,8 @@ RE_SPLIT = re.compile(r'\s+')
 class BCLContactParser(ContactFileParser):
     """Class to parse a BCL::Contact contact file
     """
+    method = 'Contact map predicted using BCL::Contact'
+
     def __init__(self):
         super(BCLContactParser, self).__init__()
 
@@ -67,21 +66,29 @@ class BCLContactParser(ContactFileParser):
 
         """
 
-        hierarchy = ContactFile(f_id)
-        contact_map = ContactMap("map_1")
-        hierarchy.add(contact_map)
+        contact_file, records = self.read_stream(f_handle, f_id=f_id)
+        contact_file.add(self._contact_map_from_records(records))
+        return contact_file
+
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
 
+        """
         for line in f_handle:
             line = line.rstrip()
             if line:
                 res1_seq, res1, res2_seq, res2, _, _, _, _, _, raw_score = RE_SPLIT.split(line)
-                contact = Contact(int(res1_seq), int(res2_seq), float(raw_score))
-                contact.res1 = res1
-                contact.res2 = res2
-                contact_map.add(contact)
-
-        hierarchy.method = 'Contact map predicted using BCL::Contact'
-        return hierarchy
+                yield ContactRecord("map_1", int(res1_seq), int(res2_seq), float(raw_score), res1=res1, res2=res2)
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -36,12 +36,10 @@ __date__ = "03 Aug 2016"
 __version__ = "1.0"
 
 import collections
-import os
 import re
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
+from conkit.io._iotools import LineWriter
+from conkit.io._parser import ContactFileParser, ContactRecord
 from conkit.core.contactfile import ContactFile
 from conkit.core.sequence import Sequence
 
@@ -85,95 +83,106 @@ class CaspParser(ContactFileParser):
         :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
 
         """
-        lines = [l.strip() for l in f_handle.readlines()]
-
         contact_file = ContactFile(f_id)
+        sequences = collections.OrderedDict()
+        records = collections.defaultdict(list)
+        for record in self._iter_records(f_handle, contact_file, sequences):
+            records[record.map_id].append(record)
 
-        it = iter(lines)
-        while True:
-
-            try:
-                line = next(it)
-            except StopIteration:
-                break
-
-            if RE_PRFMAT.match(line):
-                continue
-
-            elif RE_TARGET.match(line):
-                contact_file.remark = RE_TARGET.match(line).group(1)
-
-            elif RE_AUTHOR.match(line):
-                contact_file.author = RE_AUTHOR.match(line).group(1)
-
-            elif RE_REMARK.match(line):
-                contact_file.remark = RE_REMARK.match(line).group(1)
-
-            elif RE_METHOD.match(line):
-                contact_file.method = RE_METHOD.match(line).group(1)
-
-            elif RE_MODEL.match(line):
-                contact_map = ContactMap(RE_MODEL.match(line).group(1))
-
-                seq_chunks = []
+        for map_id, seq_chunks in sequences.items():
+            contact_map = self._contact_map_from_records(records[map_id], map_id=map_id, altloc=True)
+            if seq_chunks:
+                contact_map.sequence = Sequence('seq_{0}'.format(map_id), "".join(seq_chunks))
+            contact_file.add(contact_map)
 
-                while True:
-
-                    try:
-                        line = next(it)
-                    except StopIteration:
-                        break
+        return contact_file
 
-                    if not line:
-                        break
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
 
-                    if RE_ENDMDL.match(line):
-                        break
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
 
-                    elif RE_END.match(line):
-                        break
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
 
-                    elif RE_SEQ.match(line):
-                        seq_chunks.append(line)
+        Notes
+        -----
+        The residue names are taken from the sequence of each model, which precedes its contacts.
 
-                    else:
-                        res1_entry, res2_entry, lb, ub, raw_score = RE_SPLIT.split(line)
+        """
+        return self._iter_records(f_handle, ContactFile("casp"), {})
 
-                        # Split in case we have chain in inter-molecular scenarios
-                        res1_split = RE_RES.split(res1_entry)
-                        if len(res1_split) == 1:
-                            res1_chain, res1_seq = '', res1_split[0]
-                        elif len(res1_split) == 4:
-                            res1_chain, res1_seq = res1_split[1], res1_split[2]
-                        res2_split = RE_RES.split(res2_entry)
+    def _iter_records(self, f_handle, contact_file, sequences):
+        """Iterate over the contacts in a contact file and store its header and sequences
 
-                        if len(res2_split) == 1:
-                            res2_chain, res2_seq = '', res2_split[0]
-                        elif len(res2_split) == 4:
-                            res2_chain, res2_seq = res2_split[1], res2_split[2]
+        The header lines are added to ``contact_file``, and the list of sequence lines of
+        each model, including models without contacts, to the ``sequences`` dictionary.
 
-                        contact = Contact(int(res1_seq), int(res2_seq), float(raw_score),
-                                          distance_bound=(float(lb), float(ub)))
-                        contact.res1_chain = res1_chain
-                        contact.res2_chain = res2_chain
-                        contact.res1_altseq = int(res1_seq)
-                        contact.res2_altseq = int(res2_seq)
-                        contact_map.add(contact)
+        """
+        map_id = None
+        for line in f_handle:
+            line = line.strip()
+
+            if map_id is None:
+                if RE_PRFMAT.match(line):
+                    continue
+                elif RE_TARGET.match(line):
+                    contact_file.remark = RE_TARGET.match(line).group(1)
+                elif RE_AUTHOR.match(line):
+                    contact_file.author = RE_AUTHOR.match(line).group(1)
+                elif RE_REMARK.match(line):
+                    contact_file.remark = RE_REMARK.match(line).group(1)
+                elif RE_METHOD.match(line):
+                    contact_file.method = RE_METHOD.match(line).group(1)
+                elif RE_MODEL.match(line):
+                    map_id = RE_MODEL.match(line).group(1)
+                    if map_id in sequences:
+                        raise ValueError("%s defined twice" % map_id)
+                    seq_chunks = sequences[map_id] = []
+                    sequence = None
+                elif RE_END.match(line):
+                    break
+                else:
+                    raise ValueError('Unrecognized line type. Please report this issue')
 
-                if seq_chunks:
-                    seq = "".join(seq_chunks)
-                    sequence = Sequence('seq_{0}'.format(contact_map.id), seq)
-                    contact_map.sequence = sequence
-                    contact_map.assign_sequence_register()
-                contact_file.add(contact_map)
+            elif not line or RE_ENDMDL.match(line) or RE_END.match(line):
+                map_id = None
 
-            elif RE_END.match(line):
-                break
+            elif RE_SEQ.match(line):
+                seq_chunks.append(line)
 
             else:
-                raise ValueError('Unrecognized line type. Please report this issue')
-
-        return contact_file
+                if sequence is None:
+                    sequence = "".join(seq_chunks)
+                res1_chain, res1_seq, res2_chain, res2_seq, lb, ub, raw_score = self._split_contact(line)
+                res1 = sequence[res1_seq - 1] if sequence else 'X'
+                res2 = sequence[res2_seq - 1] if sequence else 'X'
+                yield ContactRecord(map_id, res1_seq, res2_seq, raw_score, res1, res2, res1_chain, res2_chain, lb, ub)
+
+    @staticmethod
+    def _split_contact(line):
+        """Split a contact line into chains, residue numbers, distance bounds and score"""
+        res1_entry, res2_entry, lb, ub, raw_score = RE_SPLIT.split(line)
+
+        # Split in case we have chain in inter-molecular scenarios
+        res1_split = RE_RES.split(res1_entry)
+        if len(res1_split) == 1:
+            res1_chain, res1_seq = '', res1_split[0]
+        elif len(res1_split) == 4:
+            res1_chain, res1_seq = res1_split[1], res1_split[2]
+
+        res2_split = RE_RES.split(res2_entry)
+        if len(res2_split) == 1:
+            res2_chain, res2_seq = '', res2_split[0]
+        elif len(res2_split) == 4:
+            res2_chain, res2_seq = res2_split[1], res2_split[2]
+
+        return res1_chain, int(res1_seq), res2_chain, int(res2_seq), float(lb), float(ub), float(raw_score)
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -190,42 +199,93 @@ class CaspParser(ContactFileParser):
         # Double check the type of hierarchy and reconstruct if necessary
         contact_file = self._reconstruct(hierarchy)
 
-        content = "PFRMAT RR" + os.linesep
+        with LineWriter(f_handle) as writer:
+            self._write_header(writer, contact_file)
+
+            for contact_map in contact_file:
+
+                writer.write_line("MODEL  {0}".format(contact_map.id))
+                if isinstance(contact_map.sequence, Sequence):
+                    sequence = contact_map.sequence
+                    for i in range(0, sequence.seq_len, 50):
+                        writer.write_line(sequence.seq[i:i+50])
+                # Casp Roll format specifies raw scores to be in [0, 1]
+                if any(c.raw_score > 1.0 or c.raw_score < 0.0 for c in contact_map):
+                    contact_map.rescale(inplace=True)
+                for contact in contact_map:
+                    writer.write_line(self._format_contact(contact, contact.raw_score))
+                writer.write_line("ENDMDL")
+
+            writer.write_line("END")
+
+    def write_stream(self, f_handle, hierarchy, records, score_range=None):
+        """Write a contact file from its metadata and an iterable of contacts
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions]
+        hierarchy : :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
+           The contact file metadata
+        records
+           An iterable of :obj:`ContactRecord <conkit.io._parser.ContactRecord>`
+        score_range : tuple, optional
+           The minimum and maximum raw score of all records, required to rescale
+           the raw scores as in :meth:`write`
+
+        Notes
+        -----
+        A new model is started whenever the ``map_id`` of the records changes.
+
+        """
+        rescale = score_range is not None and (score_range[0] < 0.0 or score_range[1] > 1.0)
+        if rescale:
+            score_min, score_delta = score_range[0], score_range[1] - score_range[0]
+
+        with LineWriter(f_handle) as writer:
+            self._write_header(writer, hierarchy)
+
+            map_id = None
+            for record in records:
+                if map_id is None or record.map_id != map_id:
+                    if map_id is not None:
+                        writer.write_line("ENDMDL")
+                    map_id = record.map_id
+                    writer.write_line("MODEL  {0}".format(map_id))
+                raw_score = record.raw_score
+                if rescale:
+                    # Same as ContactMap.rescale, which sets all scores to 1 if they are identical
+                    raw_score = (raw_score - score_min) / score_delta if score_delta else 1.0
+                writer.write_line(self._format_contact(record, raw_score))
+            if map_id is not None:
+                writer.write_line("ENDMDL")
+
+            writer.write_line("END")
+
+    def _write_header(self, writer, contact_file, sequence=None, **kwargs):
+        """Write the format, target, author, remark and method lines"""
+        writer.write_line("PFRMAT RR")
         if contact_file.target:
-            content += "TARGET {0}".format(contact_file.target) + os.linesep
+            writer.write_line("TARGET {0}".format(contact_file.target))
         if contact_file.author:
-            content += "AUTHOR {0}".format(contact_file.author) + os.linesep
+            writer.write_line("AUTHOR {0}".format(contact_file.author))
         if contact_file.remark:
             for remark in contact_file.remark:
-                content += "REMARK {0}".format(remark) + os.linesep
+                writer.write_line("REMARK {0}".format(remark))
         if contact_file.method:
             for method in contact_file.method:
-                content += "METHOD {0}".format(method) + os.linesep
-
-        for contact_map in contact_file:
-
-            content += "MODEL  {0}".format(contact_map.id) + os.linesep
-            if isinstance(contact_map.sequence, Sequence):
-                sequence = contact_map.sequence
-                for i in range(0, sequence.seq_len, 50):
-                    content += sequence.seq[i:i+50] + os.linesep
-            # Casp Roll format specifies raw scores to be in [0, 1]
-            if any(c.raw_score > 1.0 or c.raw_score < 0.0 for c in contact_map):
-                contact_map.rescale(inplace=True)
-            for contact in contact_map:
-                s = '{res1_chain: <}{res1_seq: <4} {res2_chain: <}{res2_seq:<4} {lb: <3} {ub: <3} {raw_score: <.6f}'
-                if contact.res1_chain == contact.res2_chain:
-                    res1_chain = res2_chain = ""
-                else:
-                    res1_chain = contact.res1_chain
-                    res2_chain = contact.res2_chain
-                lb = int(contact.lower_bound) if float(contact.lower_bound).is_integer() else contact.lower_bound
-                ub = int(contact.upper_bound) if float(contact.upper_bound).is_integer() else contact.upper_bound
-                s = s.format(res1_chain=res1_chain, res1_seq=contact.res1_seq, res2_chain=res2_chain,
-                             res2_seq=contact.res2_seq, lb=lb, ub=ub, raw_score=contact.raw_score)
-                content += s + os.linesep
-            content += "ENDMDL" + os.linesep
-
-        content += "END" + os.linesep
-
-        f_handle.write(content)
+                writer.write_line("METHOD {0}".format(method))
+
+    @staticmethod
+    def _format_contact(contact, raw_score):
+        """Format the line of a contact"""
+        s = '{res1_chain: <}{res1_seq: <4} {res2_chain: <}{res2_seq:<4} {lb: <3} {ub: <3} {raw_score: <.6f}'
+        if contact.res1_chain == contact.res2_chain:
+            res1_chain = res2_chain = ""
+        else:
+            res1_chain = contact.res1_chain
+            res2_chain = contact.res2_chain
+        lb = int(contact.lower_bound) if float(contact.lower_bound).is_integer() else contact.lower_bound
+        ub = int(contact.upper_bound) if float(contact.upper_bound).is_integer() else contact.upper_bound
+        return s.format(res1_chain=res1_chain, res1_seq=contact.res1_seq, res2_chain=res2_chain,
+                        res2_seq=contact.res2_seq, lb=lb, ub=ub, raw_score=raw_score)
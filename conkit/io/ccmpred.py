@@ -37,13 +37,17 @@ __author__ = "Felix Simkovic"
 __date__ = "03 Aug 2016"
 __version__ = "0.1"
 
+import json
 import numpy as np
+import os
 import sys
+import warnings
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
+from conkit.io._iotools import detect_compression, is_str_like, memmap_npz_member
+from conkit.io._parser import ContactFileParser, ContactRecord
 from conkit.core.contactmap import ContactMap
 from conkit.core.contactfile import ContactFile
+from conkit.core.sequence import Sequence
 
 
 class CCMpredParser(ContactFileParser):
@@ -55,7 +59,7 @@ class CCMpredParser(ContactFileParser):
     def __init__(self):
         super(CCMpredParser, self).__init__()
 
-    def read(self, f_handle, f_id="ccmpred"):
+    def read(self, f_handle, f_id="ccmpred", min_separation=0, top=None, min_score=None):
         """Read a contact file
 
         Parameters
@@ -64,48 +68,129 @@ class CCMpredParser(ContactFileParser):
            Open file handle [read permissions]
         f_id : str, optional
            Unique contact file identifier
+        min_separation : int, optional
+           The minimum sequence separation of the contacts to read [default: 0]
+        top : int, optional
+           The maximum number of highest scoring contacts to read [default: all]
+        min_score : float, optional
+           The minimum score of the contacts to read [default: all]
 
         Returns
         -------
         :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
 
+        Raises
+        ------
+        ValueError
+           The matrix is not square
+
         """
         contact_file = ContactFile(f_id)
         contact_file.method = 'Contact map predicted using CCMpred'
-        contact_map = ContactMap("map_1")
-        contact_file.add(contact_map)
 
-        # Bits ripped from Stefan Seemayer's script shipped with CCMpred
-        mat = np.loadtxt(f_handle)
+        mat = self._read_matrix(f_handle)
         if mat.size > 0:
-            raw_contacts = self._get_contact_pairs(mat)
-            for res1_seq, res2_seq, raw_score in zip(raw_contacts[0], raw_contacts[1], mat[raw_contacts]):
-                if res1_seq > res2_seq:
-                    continue
-                # Matrix starts count at 0 so increment numbers by one straight away
-                contact = Contact(int(res1_seq + 1), int(res2_seq + 1), float(raw_score))
-                contact_map.add(contact)
+            contact_map = ContactMap.from_matrix(
+                mat, min_separation=min_separation, top=top, min_score=min_score, id="map_1")
+        else:
+            contact_map = ContactMap("map_1")
+        contact_file.add(contact_map)
 
         return contact_file
 
-    def _get_contact_pairs(self, mat):
-        """Get all contact pairs in the matrix
+    def read_selected(self, f_handle, f_id="ccmpred", min_separation=0, top=None, min_score=None):
+        """Read only the selected contacts of a contact file
+
+        The contacts are selected from the matrix as in :meth:`read`.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        f_id : str, optional
+           Unique contact file identifier
+        min_separation : int, optional
+           The minimum sequence separation of the contacts to read [default: 0]
+        top : int, optional
+           The maximum number of highest scoring contacts to read [default: all]
+        min_score : float, optional
+           The minimum score of the contacts to read [default: all]
+
+        Returns
+        -------
+        :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
+
+        """
+        return self.read(f_handle, f_id=f_id, min_separation=min_separation, top=top, min_score=min_score)
+
+    def iter_contacts(self, f_handle, min_separation=0, min_score=None):
+        """Iterate over the contacts in a contact file
+
+        The matrix is read one row at a time and the contacts of each row are yielded
+        in the order of the residues.
 
         Parameters
         ----------
-        mat : np.ndarray
-           A np arranged matrix
+        f_handle
+           Open file handle [read permissions]
+        min_separation : int, optional
+           The minimum sequence separation of the contacts to yield [default: 0]
+        min_score : float, optional
+           The minimum score of the contacts to yield [default: all]
 
         Returns
         -------
-        contacts : list
-           A list of contact pairs
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
+
+        Raises
+        ------
+        ValueError
+           The matrix is not square
 
         """
-        contacts = mat.argsort(axis=None)[::-1]
-        contacts = (contacts % mat.shape[0]).astype(np.uint16), \
-                    np.floor(contacts / mat.shape[0]).astype(np.uint16)
-        return contacts
+        rows = (np.array(line.split(), dtype=np.float64) for line in f_handle if line.strip())
+        for record in self._iter_rows(rows, min_separation, min_score):
+            yield record
+
+    @staticmethod
+    def _iter_rows(rows, min_separation, min_score):
+        """Yield the contacts in the upper triangle of a square matrix given row by row"""
+        size = None
+        for i, row in enumerate(rows):
+            if size is None:
+                size = row.shape[0]
+            if row.shape[0] != size or i >= size:
+                msg = "Square matrix required, got a row of {} values in rows of {}"
+                raise ValueError(msg.format(row.shape[0], size))
+            res2_seqs = np.arange(i + max(min_separation, 0), size)
+            raw_scores = row[res2_seqs]
+            if min_score is not None:
+                selected = raw_scores >= min_score
+                res2_seqs, raw_scores = res2_seqs[selected], raw_scores[selected]
+            for res2_seq, raw_score in zip((res2_seqs + 1).tolist(), raw_scores.tolist()):
+                yield ContactRecord("map_1", i + 1, res2_seq, raw_score)
+        if size is not None and i + 1 != size:
+            raise ValueError("Square matrix required, got {} rows of {} values".format(i + 1, size))
+
+    @staticmethod
+    def _read_matrix(f_handle):
+        """Parse a whitespace-separated square matrix in a single pass"""
+        first_line = f_handle.readline()
+        while first_line and not first_line.strip():
+            first_line = f_handle.readline()
+        size = len(first_line.split())
+        # Convert the text in numpy rather than creating a str for every value
+        with warnings.catch_warnings():
+            # NumPy warns and stops at the first value it cannot convert
+            warnings.simplefilter('error', DeprecationWarning)
+            try:
+                values = np.fromstring(first_line + f_handle.read(), dtype=np.float64, sep=' ')
+            except DeprecationWarning:
+                raise ValueError("Unrecognised value in matrix")
+        if values.size != size * size:
+            raise ValueError("Square matrix required, got {} values in rows of {}".format(values.size, size))
+        return values.reshape(size, size)
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -136,13 +221,198 @@ class CCMpredParser(ContactFileParser):
             raise RuntimeError('More than one contact map provided')
 
         for contact_map in contact_file:
-            len_mat = max([c.res1_seq for c in contact_map] + [c.res2_seq for c in contact_map])
-            mat = np.zeros((len_mat, len_mat), np.float64)
+            np.savetxt(f_handle, self._to_matrix(contact_map), delimiter="\t")
+
+        return
 
-            for contact in contact_map:
-                mat[contact.res1_seq - 1][contact.res2_seq - 1] = contact.raw_score
-                mat[contact.res2_seq - 1][contact.res1_seq - 1] = contact.raw_score
+    @staticmethod
+    def _to_matrix(contact_map):
+        """Create the symmetric score matrix of a contact map"""
+        columns = contact_map.to_columnar()._columns
+        res1_seqs, res2_seqs = columns.res1_seq - 1, columns.res2_seq - 1
+        len_mat = max(res1_seqs.max(), res2_seqs.max()) + 1
+        mat = np.zeros((len_mat, len_mat), np.float64)
+        mat[res1_seqs, res2_seqs] = columns.raw_score
+        mat[res2_seqs, res1_seqs] = columns.raw_score
+        return mat
 
-            np.savetxt(f_handle, mat, delimiter="\t")
+
+class CCMpredNpzParser(ContactFileParser):
+    """
+    Class to parse a CCMpred contact matrix stored in binary NumPy format
+
+    The matrix is stored in an uncompressed ``.npz`` archive next to a small JSON
+    header with the format version, the prediction method and the sequence. Plain
+    ``.npy`` files of a square matrix are read as well.
+
+    Files on disk are memory-mapped, so only the rows needed to select the
+    contacts are paged into memory.
+
+    """
+    binary = True
+    version = 1
+
+    def __init__(self):
+        super(CCMpredNpzParser, self).__init__()
+
+    def read(self, f_handle, f_id="ccmpred", min_separation=0, top=None, min_score=None):
+        """Read a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions, binary mode]
+        f_id : str, optional
+           Unique contact file identifier
+        min_separation : int, optional
+           The minimum sequence separation of the contacts to read [default: 0]
+        top : int, optional
+           The maximum number of highest scoring contacts to read [default: all]
+        min_score : float, optional
+           The minimum score of the contacts to read [default: all]
+
+        Returns
+        -------
+        :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
+
+        Raises
+        ------
+        ValueError
+           The file is not a NumPy ``.npy`` or ``.npz`` file
+        ValueError
+           The file was written by a newer version of this format
+        ValueError
+           The matrix is not square
+
+        """
+        mat, header = self._load(f_handle)
+        if header.get('version', self.version) > self.version:
+            raise ValueError("Unsupported format version: {}".format(header['version']))
+
+        contact_file = ContactFile(f_id)
+        contact_file.method = header.get('method', 'Contact map predicted using CCMpred')
+
+        if mat.size > 0:
+            contact_map = ContactMap.from_matrix(
+                mat, min_separation=min_separation, top=top, min_score=min_score, id="map_1")
+        else:
+            contact_map = ContactMap("map_1")
+        if header.get('sequence'):
+            contact_map.sequence = Sequence(*header['sequence'])
+        contact_file.add(contact_map)
+
+        return contact_file
+
+    def read_selected(self, f_handle, f_id="ccmpred", min_separation=0, top=None, min_score=None):
+        """Read only the selected contacts of a contact file
+
+        The contacts are selected from the matrix as in :meth:`read`.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions, binary mode]
+        f_id : str, optional
+           Unique contact file identifier
+        min_separation : int, optional
+           The minimum sequence separation of the contacts to read [default: 0]
+        top : int, optional
+           The maximum number of highest scoring contacts to read [default: all]
+        min_score : float, optional
+           The minimum score of the contacts to read [default: all]
+
+        Returns
+        -------
+        :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
+
+        """
+        return self.read(f_handle, f_id=f_id, min_separation=min_separation, top=top, min_score=min_score)
+
+    def iter_contacts(self, f_handle, min_separation=0, min_score=None):
+        """Iterate over the contacts in a contact file
+
+        The contacts of each matrix row are yielded in the order of the residues.
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions, binary mode]
+        min_separation : int, optional
+           The minimum sequence separation of the contacts to yield [default: 0]
+        min_score : float, optional
+           The minimum score of the contacts to yield [default: all]
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
+
+        Raises
+        ------
+        ValueError
+           The matrix is not square
+
+        """
+        mat, _ = self._load(f_handle)
+        if mat.ndim != 2 or mat.shape[0] != mat.shape[1]:
+            raise ValueError("Square matrix required, got shape {}".format(mat.shape))
+        rows = (np.asarray(row, dtype=np.float64) for row in mat)
+        for record in CCMpredParser._iter_rows(rows, min_separation, min_score):
+            yield record
+
+    @staticmethod
+    def _load(f_handle):
+        """Load the matrix, memory-mapped if possible, and the header"""
+        fname = getattr(f_handle, 'name', None)
+        mappable = is_str_like(fname) and os.path.isfile(fname) and detect_compression(fname) is None
+
+        position = f_handle.tell()
+        magic = f_handle.read(len(np.lib.format.MAGIC_PREFIX))
+        f_handle.seek(position)
+
+        if magic == np.lib.format.MAGIC_PREFIX:
+            mat = np.load(fname, mmap_mode='r') if mappable else np.load(f_handle)
+            return mat, {}
+        elif magic[:4] != b'PK\x03\x04':
+            raise ValueError("Binary NumPy .npy or .npz file required")
+
+        archive = np.load(f_handle)
+        header = json.loads(str(archive['header'])) if 'header' in archive.files else {}
+        mat = memmap_npz_member(fname, 'matrix') if mappable else None
+        if mat is None:
+            mat = archive['matrix']
+        return mat, header
+
+    def write(self, f_handle, hierarchy):
+        """Write a contact file instance to to file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions, binary mode]
+        hierarchy : :obj:`ContactFile <conkit.core.contactfile.ContactFile>`, :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+                    or :obj:`Contact <conkit.core.contact.Contact>`
+
+        Raises
+        ------
+        RuntimeError
+           More than one contact map in the hierarchy
+
+        """
+        # Double check the type of hierarchy and reconstruct if necessary
+        contact_file = self._reconstruct(hierarchy)
+
+        if len(contact_file) > 1:
+            raise RuntimeError('More than one contact map provided')
+
+        for contact_map in contact_file:
+            header = {
+                'format': 'ccmpred-npz',
+                'version': self.version,
+                'method': contact_file.method,
+                'sequence': [contact_map.sequence.id, contact_map.sequence.seq] if contact_map.sequence is not None else None,
+            }
+            # Uncompressed, so that the matrix can be memory-mapped when read
+            np.savez(f_handle, matrix=CCMpredParser._to_matrix(contact_map), header=np.array(json.dumps(header)))
 
         return
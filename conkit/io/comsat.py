@@ -35,13 +35,9 @@ __author__ = "Felix Simkovic"
 __date__ = "03 Aug 2016"
 __version__ = "0.1"
 
-import os
 import re
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
-from conkit.core.contactfile import ContactFile
+from conkit.io._parser import ContactFileParser, ContactRecord
 
 RE_SPLIT = re.compile(r'\s+')
 
@@ -49,6 +45,8 @@ RE_SPLIT = re.compile(r'\s+')
 class ComsatParser(ContactFileParser):
     """Class to parse a COMSAT contact file
     """
+    method = 'Contact map predicted using COMSAT'
+
     def __init__(self):
         super(ComsatParser, self).__init__()
 
@@ -68,10 +66,24 @@ class ComsatParser(ContactFileParser):
 
         """
 
-        contact_file = ContactFile(f_id)
-        contact_map = ContactMap("map_1")
-        contact_file.add(contact_map)
+        contact_file, records = self.read_stream(f_handle, f_id=f_id)
+        contact_file.add(self._contact_map_from_records(records))
+        return contact_file
+
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
 
+        """
         for line in f_handle:
             line = line.rstrip()
 
@@ -80,19 +92,7 @@ class ComsatParser(ContactFileParser):
 
             else:
                 res1_seq, res1, res2_seq, res2, _ = RE_SPLIT.split(line)
-                contact = Contact(
-                    int(res1_seq),
-                    int(res2_seq),
-                    0.0
-                )
-                contact.res1 = res1
-                contact.res2 = res2
-
-                contact_map.add(contact)
-
-        contact_file.method = 'Contact map predicted using COMSAT'
-
-        return contact_file
+                yield ContactRecord("map_1", int(res1_seq), int(res2_seq), 0.0, res1=res1, res2=res2)
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -110,19 +110,11 @@ class ComsatParser(ContactFileParser):
            More than one contact map in the hierarchy
 
         """
-        # Double check the type of hierarchy and reconstruct if necessary
-        contact_file = self._reconstruct(hierarchy)
-
-        if len(contact_file) > 1:
-            raise RuntimeError('More than one contact map provided')
-
-        content = ""
-
-        for contact_map in contact_file:
-            for contact in contact_map:
-                line = "{res1_seq}{sep}{res1}{sep}{res2_seq}{sep}{res2}{sep}Hx-Hx"
-                line = line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq,
-                                   res1=contact.res1, res2=contact.res2, sep="\t")
-                content += line + os.linesep
-
-        f_handle.write(content)
+        self._write_single_map(f_handle, hierarchy)
+
+    @staticmethod
+    def _format_line(contact):
+        """Format a contact as a line"""
+        line = "{res1_seq}{sep}{res1}{sep}{res2_seq}{sep}{res2}{sep}Hx-Hx"
+        return line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq,
+                           res1=contact.res1, res2=contact.res2, sep="\t")
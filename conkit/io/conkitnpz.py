@@ -0,0 +1,152 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-18, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""
+Parser module specific to the ConKit binary contact file format
+"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+__version__ = "1.0"
+
+import json
+import numpy as np
+
+from conkit.io._parser import ContactFileParser
+from conkit.core._columns import FIELD_NAMES, _ContactColumns
+from conkit.core.contactmap import ContactMap
+from conkit.core.contactfile import ContactFile
+from conkit.core.sequence import Sequence
+
+
+class ConkitNpzParser(ContactFileParser):
+    """
+    Class to parse a ConKit binary contact file
+
+    The contact file is stored in an uncompressed NumPy ``.npz`` archive. Each contact
+    map is stored as one array per contact attribute, the same columns used by
+    :meth:`ContactMap.to_columnar <conkit.core.contactmap.ContactMap.to_columnar>`, and
+    a JSON header holds the contact file metadata and the sequence of each map.
+
+    Contact maps are read straight into column storage, so no
+    :obj:`Contact <conkit.core.contact.Contact>` instances are created until they are accessed.
+
+    """
+    binary = True
+    version = 1
+
+    def __init__(self):
+        super(ConkitNpzParser, self).__init__()
+
+    def read(self, f_handle, f_id="conkit"):
+        """Read a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions, binary mode]
+        f_id : str, optional
+           Unique contact file identifier
+
+        Returns
+        -------
+        :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
+
+        Raises
+        ------
+        ValueError
+           The file is not a ConKit binary contact file
+        ValueError
+           The file was written by a newer version of this format
+
+        """
+        archive = np.load(f_handle)
+        if 'header' not in archive.files:
+            raise ValueError("ConKit binary contact file required")
+        header = json.loads(str(archive['header']))
+        if header.get('format') != 'conkit-npz':
+            raise ValueError("ConKit binary contact file required")
+        elif header['version'] > self.version:
+            raise ValueError("Unsupported format version: {}".format(header['version']))
+
+        contact_file = ContactFile(f_id)
+        contact_file.author = header['author']
+        contact_file.method = header['method']
+        contact_file.remark = header['remark']
+        contact_file.target = header['target']
+
+        for i, map_header in enumerate(header['maps']):
+            columns = {name: archive['map_{}_{}'.format(i, name)] for name in FIELD_NAMES}
+            contact_map = ContactMap(map_header['id'])._from_columns(
+                _ContactColumns.from_arrays(map_header['ncontacts'], columns))
+            if map_header['sequence'] is not None:
+                sequence = Sequence(map_header['sequence']['id'], map_header['sequence']['seq'])
+                sequence.remark = map_header['sequence']['remark']
+                contact_map.sequence = sequence
+            contact_file.add(contact_map)
+
+        return contact_file
+
+    def write(self, f_handle, hierarchy):
+        """Write a contact file instance to to file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions, binary mode]
+        hierarchy : :obj:`ContactFile <conkit.core.contactfile.ContactFile>`, :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+                    or :obj:`Contact <conkit.core.contact.Contact>`
+
+        """
+        # Double check the type of hierarchy and reconstruct if necessary
+        contact_file = self._reconstruct(hierarchy)
+
+        header = {
+            'format': 'conkit-npz',
+            'version': self.version,
+            'author': contact_file.author,
+            'method': contact_file.method,
+            'remark': contact_file.remark,
+            'target': contact_file.target,
+            'maps': [],
+        }
+        arrays = {}
+        for i, contact_map in enumerate(contact_file):
+            ncontacts, columns = contact_map.to_columnar()._columns.to_arrays()
+            for name, array in columns.items():
+                arrays['map_{}_{}'.format(i, name)] = array
+            sequence = contact_map.sequence
+            if sequence is not None:
+                sequence = {'id': sequence.id, 'seq': sequence.seq, 'remark': sequence.remark}
+            header['maps'].append({'id': contact_map.id, 'ncontacts': ncontacts, 'sequence': sequence})
+
+        # Uncompressed, the columns are read in bulk without decompression
+        np.savez(f_handle, header=np.array(json.dumps(header)), **arrays)
+
+        return
@@ -35,9 +35,11 @@ __author__ = "Felix Simkovic"
 __date__ = "09 Sep 2016"
 __version__ = "0.1"
 
-import os
 
-from conkit.io._parser import SequenceFileParser
+import itertools
+
+from conkit.io._iotools import LineWriter
+from conkit.io._parser import SequenceFileParser, SequenceRecord
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
 
@@ -107,6 +109,76 @@ class FastaParser(SequenceFileParser):
 
         return hierarchy
 
+    def iter_sequences(self, f_handle):
+        """Iterate over the sequences in a sequence file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>` for each sequence
+
+        Notes
+        -----
+        As in :meth:`read`, the file ends at the first empty line after a sequence record.
+
+        """
+        id, chunks = None, []
+        for line in f_handle:
+            line = line.rstrip()
+
+            if id is None:
+                # Skip any comments before the first record
+                if line.startswith('>'):
+                    id = line[1:]
+                continue
+
+            elif line.startswith('>'):
+                yield SequenceRecord(id, "".join(chunks))
+                id, chunks = line[1:], []
+
+            elif not line:
+                break
+
+            else:
+                chunks.append(line)
+
+        if id is not None:
+            yield SequenceRecord(id, "".join(chunks))
+
+    def read_stream(self, f_handle, f_id='fasta'):
+        """Read the metadata of a sequence file and iterate over its sequences
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        f_id : str, optional
+           Unique sequence file identifier
+
+        Returns
+        -------
+        tuple
+           The :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` without any sequence
+           and a generator of :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>` for each sequence
+
+        """
+        hierarchy = SequenceFile(f_id)
+
+        # Read any possible comments and store in file remarks
+        line = f_handle.readline()
+        while line and not line.startswith('>'):
+            line = line.rstrip()
+            if line.startswith('#'):
+                hierarchy.remark = line[1:]
+            line = f_handle.readline()
+
+        return hierarchy, self.iter_sequences(itertools.chain([line], f_handle))
+
     def write(self, f_handle, hierarchy):
         """Write a sequence file instance to to file
 
@@ -120,21 +192,39 @@ class FastaParser(SequenceFileParser):
         # Double check the type of hierarchy and reconstruct if necessary
         hierarchy = self._reconstruct(hierarchy)
 
-        content = ""
+        with LineWriter(f_handle) as writer:
+            self._write_sequences(writer, hierarchy.remark, hierarchy)
+
+    def write_stream(self, f_handle, hierarchy, records):
+        """Write a sequence file from its metadata and an iterable of sequences
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions]
+        hierarchy : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+           The sequence file metadata
+        records
+           An iterable of :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>`
+
+        """
+        with LineWriter(f_handle) as writer:
+            self._write_sequences(writer, hierarchy.remark, records)
 
+    @staticmethod
+    def _write_sequences(writer, remarks, sequences):
+        """Write the remarks and a record for each sequence"""
         # Write remarks
-        for remark in hierarchy.remark:
-            content += '#{remark}'.format(remark=remark) + os.linesep
+        for remark in remarks:
+            writer.write_line('#{remark}'.format(remark=remark))
 
-        for sequence_entry in hierarchy:
+        for sequence_entry in sequences:
             header = '>{id}'.format(id=sequence_entry.id)
             if len(sequence_entry.remark) > 0:
-                header = '|'.join([header] + sequence_entry.remark)
-            content += header + os.linesep
+                header = '|'.join([header] + list(sequence_entry.remark))
+            writer.write_line(header)
 
             # Cut the sequence into chunks [FASTA <= 60 chars per line]
             sequence_string = sequence_entry.seq.upper()       # UPPER CASE !!!
-            for i in range(0, sequence_entry.seq_len, 60):
-                content += sequence_string[i:i+60] + os.linesep
-
-        f_handle.write(content)
+            for i in range(0, len(sequence_entry.seq), 60):
+                writer.write_line(sequence_string[i:i+60])
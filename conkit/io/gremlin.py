@@ -35,12 +35,10 @@ __author__ = "Felix Simkovic"
 __date__ = "04 Oct 2016"
 __version__ = "0.1"
 
-import os
 import re
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
+from conkit.io._iotools import LineWriter
+from conkit.io._parser import ContactFileParser, ContactRecord
 from conkit.core.contactfile import ContactFile
 
 RE_HEADER_INTRA = re.compile(r'^i\s+j\s+i_id\s+j_id\s+r_sco\s+s_sco\s+prob$')
@@ -70,19 +68,42 @@ class GremlinParser(ContactFileParser):
         :obj:`ContactFile <conkit.core.contactfile.ContactFile>`
 
         """
-        hierarchy = ContactFile(f_id)
+        contact_file = ContactFile(f_id)
+        self._contact_file_from_records(contact_file, self._iter_records(f_handle, contact_file))
+        contact_file.sort('id', inplace=True)
+        return contact_file
 
-        lines = iter([l.rstrip() for l in f_handle if l.rstrip()])
-        done = object()
-        line = next(lines, done)
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
 
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
+
+        Notes
+        -----
+        Unlike :meth:`read`, contacts are yielded in the order of the file rather than grouped by chain.
+
+        """
+        return self._iter_records(f_handle, ContactFile("gremlin"))
+
+    def _iter_records(self, f_handle, contact_file):
+        """Iterate over the contacts in a contact file and add its comments to ``contact_file``"""
         inter = False
-        chain_list = set()
-        contact_list = []
-        while line is not done:
+        for line in f_handle:
+            line = line.rstrip()
+
+            if not line:
+                continue
 
-            if RE_COMMENT.match(line):
-                hierarchy.remark = RE_COMMENT.match(line).group(1)
+            elif RE_COMMENT.match(line):
+                contact_file.remark = RE_COMMENT.match(line).group(1)
 
             elif RE_HEADER_INTRA.match(line):
                 inter = False
@@ -93,52 +114,19 @@ class GremlinParser(ContactFileParser):
                     res1_seq, res2_seq, chain, _, _, raw_score, scalar_score, _, _ = RE_SPLIT.split(line)
                 else:
                     res1_seq, res2_seq, _, _, raw_score, scalar_score, _ = RE_SPLIT.split(line)
-                    chain = 'UNK'
-
-                c = Contact(int(res1_seq), int(res2_seq), float(raw_score))
-                c.scalar_score = float(scalar_score)
-
-                if chain == 'UNK':
-                    chain_list.add('UNK')
-                elif len(chain) == 1:
-                    c.res1_chain = chain[0]
-                    c.res2_chain = chain[0]
-                    chain_list.add((c.res1_chain, c.res2_chain))
-                elif len(chain) == 2:
-                    c.res1_chain = chain[0]
-                    c.res2_chain = chain[1]
-                    chain_list.add((c.res1_chain, c.res2_chain))
-                elif len(chain) > 2:
+                    chain = ''
+
+                if len(chain) > 2:
                     raise ValueError('Cannot distinguish between chains')
+                elif chain:
+                    res1_chain, res2_chain = chain[0], chain[-1]
+                    map_id = res1_chain if res1_chain == res2_chain else chain
+                else:
+                    res1_chain = res2_chain = ''
+                    map_id = '1'
 
-                contact_list.append(c)
-
-            line = next(lines, done)
-
-        chain_list = list(chain_list)
-        if len(chain_list) == 1 and chain_list[0] == 'UNK':
-            contact_map = ContactMap('1')
-            for c in contact_list:
-                contact_map.add(c)
-            hierarchy.add(contact_map)
-        elif len(chain_list) == 1:
-            chain = chain_list[0]
-            map_id = chain[0] if chain[0] == chain[1] else "".join(chain)
-            contact_map = ContactMap(map_id)
-            for c in contact_list:
-                contact_map.add(c)
-            hierarchy.add(contact_map)
-        else:
-            for chain in chain_list:
-                map_id = chain[0] if chain[0] == chain[1] else "".join(chain)
-                contact_map = ContactMap(map_id)
-                for c in contact_list:
-                    if c.res1_chain == chain[0] and c.res2_chain == chain[1]:
-                        contact_map.add(c)
-                hierarchy.add(contact_map)
-
-        hierarchy.sort('id', inplace=True)
-        return hierarchy
+                yield ContactRecord(map_id, int(res1_seq), int(res2_seq), float(raw_score), res1_chain=res1_chain,
+                                    res2_chain=res2_chain, scalar_score=float(scalar_score))
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -154,38 +142,35 @@ class GremlinParser(ContactFileParser):
         # Double check the type of hierarchy and reconstruct if necessary
         contact_file = self._reconstruct(hierarchy)
 
-        content = ""
+        with LineWriter(f_handle) as writer:
+            if contact_file.top_map.top_contact.res1_chain and contact_file.top_map.top_contact.res2_chain:
+                header_args = ['i', 'j', 'gene', 'i_id', 'j_id', 'r_sco', 's_sco', 'prob', 'I_prob']
+                writer.write_line('\t'.join(header_args))
 
-        if contact_file.top_map.top_contact.res1_chain and contact_file.top_map.top_contact.res2_chain:
-            header_args = ['i', 'j', 'gene', 'i_id', 'j_id', 'r_sco', 's_sco', 'prob', 'I_prob']
-            content += '\t'.join(header_args) + os.linesep
+                out_kwargs = ['{res1_seq}', '{res2_seq}', '{chains}', '{res1_code}', '{res2_code}',
+                              '{raw_score}', '{scalar_score}', '1.0', 'N/A']
 
-            out_kwargs = ['{res1_seq}', '{res2_seq}', '{chains}', '{res1_code}', '{res2_code}',
-                          '{raw_score}', '{scalar_score}', '1.0', 'N/A']
-
-        else:
-            header_args = ['i', 'j', 'i_id', 'j_id', 'r_sco', 's_sco', 'prob']
-            content += '\t'.join(header_args) + os.linesep
-
-            out_kwargs = ['{res1_seq}', '{res2_seq}', '{res1_code}', '{res2_code}',
-                          '{raw_score}', '{scalar_score}', '1.0']
+            else:
+                header_args = ['i', 'j', 'i_id', 'j_id', 'r_sco', 's_sco', 'prob']
+                writer.write_line('\t'.join(header_args))
 
-        for contact_map in contact_file:
-            contact_map.calculate_scalar_score()
-            for c in contact_map:
-                res1_code = str(c.res1_seq) + '_' + c.res1
-                res2_code = str(c.res2_seq) + '_' + c.res2
+                out_kwargs = ['{res1_seq}', '{res2_seq}', '{res1_code}', '{res2_code}',
+                              '{raw_score}', '{scalar_score}', '1.0']
 
-                if c.res1_chain == c.res2_chain:
-                    chains = c.res1_chain
-                else:
-                    chains = "{0}{1}".format(c.res1_chain, c.res2_chain)
+            for contact_map in contact_file:
+                contact_map.calculate_scalar_score()
+                for c in contact_map:
+                    res1_code = str(c.res1_seq) + '_' + c.res1
+                    res2_code = str(c.res2_seq) + '_' + c.res2
 
-                out_line = '\t'.join(out_kwargs)
-                out_line = out_line.format(res1_seq=c.res1_seq, res2_seq=c.res2_seq, res1_code=res1_code,
-                                           res2_code=res2_code, chains=chains,
-                                           raw_score=c.raw_score, scalar_score=round(c.scalar_score, 1))
+                    if c.res1_chain == c.res2_chain:
+                        chains = c.res1_chain
+                    else:
+                        chains = "{0}{1}".format(c.res1_chain, c.res2_chain)
 
-                content += out_line + os.linesep
+                    out_line = '\t'.join(out_kwargs)
+                    out_line = out_line.format(res1_seq=c.res1_seq, res2_seq=c.res2_seq, res1_code=res1_code,
+                                               res2_code=res2_code, chains=chains,
+                                               raw_score=c.raw_score, scalar_score=round(c.scalar_score, 1))
 
-        f_handle.write(content)
+                    writer.write_line(out_line)
@@ -37,7 +37,8 @@ __version__ = "0.1"
 
 import os
 
-from conkit.io._parser import SequenceFileParser
+from conkit.io._iotools import LineWriter
+from conkit.io._parser import SequenceFileParser, SequenceRecord
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
 
@@ -98,6 +99,61 @@ class JonesParser(SequenceFileParser):
 
         return hierarchy
 
+    def iter_sequences(self, f_handle):
+        """Iterate over the sequences in a sequence file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>` for each sequence
+
+        Raises
+        ------
+        ValueError
+           Unknown character in a sequence
+
+        """
+        for i, line in enumerate(f_handle):
+
+            line = line.rstrip()
+            if not line:
+                continue
+
+            for a, c in enumerate(line):
+                if c.isalpha() or c == '-':
+                    continue
+                else:
+                    indicator = ['-'] * len(line)
+                    indicator[a] = '^'
+                    msg = "Unknown character in line {0}:{1}{1}{2}{1}{3}"
+                    msg = msg.format(i+1, os.linesep, line, ''.join(indicator))
+                    raise ValueError(msg)
+            yield SequenceRecord('seq_{i}'.format(i=i), line)
+
+    def read_stream(self, f_handle, f_id='jones'):
+        """Read the metadata of a sequence file and iterate over its sequences
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+        f_id : str, optional
+           Unique sequence file identifier
+
+        Returns
+        -------
+        tuple
+           The :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` without any sequence
+           and a generator of :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>` for each sequence
+
+        """
+        return SequenceFile(f_id), self.iter_sequences(f_handle)
+
     def write(self, f_handle, hierarchy):
         """Write a sequence file instance to to file
 
@@ -111,9 +167,27 @@ class JonesParser(SequenceFileParser):
         # Double check the type of hierarchy and reconstruct if necessary
         sequence_file = self._reconstruct(hierarchy)
 
-        content = ""
+        with LineWriter(f_handle) as writer:
+            self._write_sequences(writer, sequence_file)
 
-        for sequence_entry in sequence_file:
-            content += sequence_entry.seq + os.linesep
+    def write_stream(self, f_handle, hierarchy, records):
+        """Write a sequence file from its metadata and an iterable of sequences
 
-        f_handle.write(content)
+        Parameters
+        ----------
+        f_handle
+           Open file handle [write permissions]
+        hierarchy : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+           The sequence file metadata
+        records
+           An iterable of :obj:`SequenceRecord <conkit.io._parser.SequenceRecord>`
+
+        """
+        with LineWriter(f_handle) as writer:
+            self._write_sequences(writer, records)
+
+    @staticmethod
+    def _write_sequences(writer, sequences):
+        """Write a line for each sequence"""
+        for sequence_entry in sequences:
+            writer.write_line(sequence_entry.seq)
@@ -36,13 +36,9 @@ __author__ = "Felix Simkovic"
 __date__ = "12 Oct 2016"
 __version__ = "0.1"
 
-import os
 import re
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
-from conkit.core.contactfile import ContactFile
+from conkit.io._parser import ContactFileParser, ContactRecord
 
 RE_HEADER = re.compile(r'^Helix\s+Position\s+Residue\s+Helix\s+Position\s+Residue\s+Probability$')
 RE_SPLIT = re.compile(r'\s+')
@@ -51,6 +47,8 @@ RE_SPLIT = re.compile(r'\s+')
 class MemBrainParser(ContactFileParser):
     """Class to parse a MemBrain contact file
     """
+    method = 'Contact map predicted using MemBrain'
+
     def __init__(self):
         super(MemBrainParser, self).__init__()
 
@@ -70,10 +68,24 @@ class MemBrainParser(ContactFileParser):
 
         """
 
-        hierarchy = ContactFile(f_id)
-        contact_map = ContactMap("map_1")
-        hierarchy.add(contact_map)
+        contact_file, records = self.read_stream(f_handle, f_id=f_id)
+        contact_file.add(self._contact_map_from_records(records))
+        return contact_file
+
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
 
+        """
         for line in f_handle:
             line = line.rstrip()
 
@@ -85,19 +97,7 @@ class MemBrainParser(ContactFileParser):
 
             else:
                 _, res1_seq, res1, _, res2_seq, res2, raw_score = RE_SPLIT.split(line)
-
-                contact = Contact(
-                    int(res1_seq),
-                    int(res2_seq),
-                    float(raw_score)
-                )
-                contact.res1 = res1
-                contact.res2 = res2
-                contact_map.add(contact)
-
-        hierarchy.method = 'Contact map predicted using MemBrain'
-
-        return hierarchy
+                yield ContactRecord("map_1", int(res1_seq), int(res2_seq), float(raw_score), res1=res1, res2=res2)
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -115,21 +115,15 @@ class MemBrainParser(ContactFileParser):
            More than one contact map in the hierarchy
 
         """
-        # Double check the type of hierarchy and reconstruct if necessary
-        contact_file = self._reconstruct(hierarchy)
-
-        if len(contact_file) > 1:
-            raise RuntimeError('More than one contact map provided')
-
-        content = ""
-
-        for contact_map in contact_file:
-            content += 'Helix   Position        Residue Helix   Position        Residue Probability' + os.linesep
-            for contact in contact_map:
-                line = "Hx      {res1_seq: <7} {res1: <7} Hx      {res2_seq: <7} {res2: <7} {raw_score: <.6f}"
-                line = line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq,
-                                   res1=contact.res1, res2=contact.res2, raw_score=contact.raw_score)
-                content += line + os.linesep
-
-        f_handle.write(content)
-
+        self._write_single_map(f_handle, hierarchy)
+
+    def _write_header(self, writer, hierarchy, sequence, **kwargs):
+        """Write the column header"""
+        writer.write_line('Helix   Position        Residue Helix   Position        Residue Probability')
+
+    @staticmethod
+    def _format_line(contact):
+        """Format a contact as a line"""
+        line = "Hx      {res1_seq: <7} {res1: <7} Hx      {res2_seq: <7} {res2: <7} {raw_score: <.6f}"
+        return line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq,
+                           res1=contact.res1, res2=contact.res2, raw_score=contact.raw_score)
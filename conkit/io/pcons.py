@@ -40,12 +40,9 @@ __author__ = "Felix Simkovic"
 __date__ = "26 Oct 2016"
 __version__ = "0.1"
 
-import os
 import re
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
+from conkit.io._parser import ContactFileParser, ContactRecord
 from conkit.core.contactfile import ContactFile
 from conkit.core.sequence import Sequence
 
@@ -58,6 +55,8 @@ RE_PRED_CONTACTS = re.compile(r"^Predicted\s+contacts:\s*$")
 RE_CONTACT_HEADER = re.compile(r"^Res1\s+Res2\s+Score\s*$")
 RE_CONTACT = re.compile(r"^\s*(\d+)\s+(\d+)\s+(-?\d*\.\d+|\d+)\s*$")
 
+COMMENT_LINE = "##############################################################################"
+
 
 class PconsParser(ContactFileParser):
     """Class to parse a Pcons output
@@ -86,58 +85,70 @@ class PconsParser(ContactFileParser):
 
         """
         contact_file = ContactFile(f_id)
-        contact_map = ContactMap("1")
+        sequences = {}
+        contact_map = self._contact_map_from_records(self._iter_records(f_handle, contact_file, sequences), map_id="1")
         contact_file.add(contact_map)
 
-        lines = iter([l.rstrip() for l in f_handle if l.rstrip()])
-        done = object()
-        line = next(lines, done)
+        if "1" in sequences:
+            contact_map.sequence = sequences["1"]
 
-        seq = ''
-        seq_id = 'seq_1'
+        contact_file.method = 'Contact map predicted using Pcons'
+
+        return contact_file
+
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
 
-        while line is not done:
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
+
+        """
+        return self._iter_records(f_handle, ContactFile("pcons"), {})
+
+    def _iter_records(self, f_handle, contact_file, sequences):
+        """Iterate over the contacts in a contact file and store its header and sequence
+
+        The remarks are added to ``contact_file`` and the sequence, once all lines are read,
+        to the ``sequences`` dictionary.
+
+        """
+        seq_id = 'seq_1'
+        seq_chunks = []
+        in_sequence = False
+        for line in f_handle:
+            line = line.rstrip()
 
             if not line:
-                pass
+                continue
+
+            elif in_sequence and not any(regex.match(line) for regex in (RE_CONTACT_HEADER, RE_PRED_CONTACTS,
+                                                                         RE_CONTACT)):
+                seq_chunks.append(line)
+                continue
 
-            elif RE_GENERATED.match(line):
+            in_sequence = False
+            if RE_GENERATED.match(line):
                 contact_file.remark = line
 
             elif RE_SEQUENCE_NAME.match(line):
                 seq_id = RE_SEQUENCE_NAME.match(line).group(1)
 
             elif RE_SEQUENCE.match(line):
-                line = next(lines, done)
-                while line is not done:
-                    if not line:
-                        break
-                    elif RE_CONTACT_HEADER.match(line):
-                        break
-                    elif RE_PRED_CONTACTS.match(line):
-                        break
-                    elif RE_CONTACT.match(line):
-                        break
-                    else:
-                        seq += line
-                    line = next(lines, done)
-
-            if RE_CONTACT.match(line):
-                res1_seq, res2_seq, raw_score = line.split()
-                contact = Contact(
-                    int(res1_seq), int(res2_seq),
-                    float(raw_score)
-                )
-                contact_map.add(contact)
-
-            line = next(lines, done)
-
-        if seq:
-            contact_map.sequence = Sequence(seq_id, seq)
+                in_sequence = True
 
-        contact_file.method = 'Contact map predicted using Pcons'
+            elif RE_CONTACT.match(line):
+                res1_seq, res2_seq, raw_score = line.split()
+                yield ContactRecord("1", int(res1_seq), int(res2_seq), float(raw_score))
 
-        return contact_file
+        if seq_chunks:
+            sequences["1"] = Sequence(seq_id, "".join(seq_chunks))
 
     def write(self, f_handle, hierarchy, write_header_footer=True):
         """Write a contact file instance to to file
@@ -160,44 +171,36 @@ class PconsParser(ContactFileParser):
            More than one contact map in the hierarchy
 
         """
-        # Double check the type of hierarchy and reconstruct if necessary
-        contact_file = self._reconstruct(hierarchy)
-
-        if len(contact_file) > 1:
-            raise RuntimeError('More than one contact map provided')
-
-        comment_line = "##############################################################################"
-
-        content = ""
-
-        for contact_map in contact_file:
-            if write_header_footer:
-                content += comment_line + os.linesep
-                content += "PconsC3 result file" + os.linesep
-                content += "Generated using ConKit" + os.linesep
-                content += comment_line + os.linesep
-
-                if contact_map.sequence is not None:
-                    content += "Sequence number: 1" + os.linesep
-                    content += "Sequence name: {0}".format(
-                        contact_map.sequence.id) + os.linesep
-                    content += "Sequence length: {0} aa.".format(
-                        contact_map.sequence.seq_len) + os.linesep
-                    content += "Sequence:" + os.linesep
-                    content += contact_map.sequence.seq + os.linesep * 3
-
-                content += "Predicted contacts:" + os.linesep
-                content += "Res1 Res2 Score" + os.linesep
-
-            for contact in contact_map:
-                res1_seq = contact.res1_seq
-                res2_seq = contact.res2_seq
-                raw_score = contact.raw_score
-                l = "{res1_seq:>4} {res2_seq:>4} {raw_score:>.6f}".format(res1_seq=res1_seq, res2_seq=res2_seq,
-                                                                          raw_score=raw_score)
-                content += l + os.linesep
-
-            if write_header_footer:
-                content += os.linesep + comment_line + os.linesep
-
-        f_handle.write(content)
+        self._write_single_map(f_handle, hierarchy, write_header_footer=write_header_footer)
+
+    def _write_header(self, writer, hierarchy, sequence, write_header_footer=True):
+        """Write the comments, the sequence if provided and the column header"""
+        if not write_header_footer:
+            return
+
+        writer.write_line(COMMENT_LINE)
+        writer.write_line("PconsC3 result file")
+        writer.write_line("Generated using ConKit")
+        writer.write_line(COMMENT_LINE)
+
+        if sequence is not None:
+            writer.write_line("Sequence number: 1")
+            writer.write_line("Sequence name: {0}".format(sequence.id))
+            writer.write_line("Sequence length: {0} aa.".format(sequence.seq_len))
+            writer.write_line("Sequence:")
+            writer.write_lines([sequence.seq, "", ""])
+
+        writer.write_line("Predicted contacts:")
+        writer.write_line("Res1 Res2 Score")
+
+    def _write_footer(self, writer, hierarchy, write_header_footer=True):
+        """Write the closing comment"""
+        if write_header_footer:
+            writer.write_lines(["", COMMENT_LINE])
+
+    @staticmethod
+    def _format_line(contact):
+        """Format a contact as a line"""
+        return "{res1_seq:>4} {res2_seq:>4} {raw_score:>.6f}".format(res1_seq=contact.res1_seq,
+                                                                    res2_seq=contact.res2_seq,
+                                                                    raw_score=contact.raw_score)
@@ -36,17 +36,15 @@ __author__ = "Felix Simkovic"
 __date__ = "03 Aug 2016"
 __version__ = "0.1"
 
-import os
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
-from conkit.core.contactfile import ContactFile
+from conkit.io._parser import ContactFileParser, ContactRecord
 
 
 class PlmDCAParser(ContactFileParser):
     """Class to parse a plmDCA contact prediction
     """
+    method = 'Contact map predicted using plmDCA'
+
     def __init__(self):
         super(PlmDCAParser, self).__init__()
 
@@ -66,10 +64,24 @@ class PlmDCAParser(ContactFileParser):
 
         """
 
-        contact_file = ContactFile(f_id)
-        contact_map = ContactMap("map_1")
-        contact_file.add(contact_map)
+        contact_file, records = self.read_stream(f_handle, f_id=f_id)
+        contact_file.add(self._contact_map_from_records(records))
+        return contact_file
+
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
+
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
 
+        """
         for line in f_handle:
             line = line.strip()
 
@@ -78,12 +90,7 @@ class PlmDCAParser(ContactFileParser):
 
             elif line[0].isdigit():
                 res1_seq, res2_seq, raw_score = line.split(',')
-                contact = Contact(int(res1_seq), int(res2_seq), float(raw_score))
-                contact_map.add(contact)
-
-        contact_file.method = 'Contact map predicted using plmDCA'
-
-        return contact_file
+                yield ContactRecord("map_1", int(res1_seq), int(res2_seq), float(raw_score))
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -101,18 +108,10 @@ class PlmDCAParser(ContactFileParser):
            More than one contact map in the hierarchy
 
         """
-        # Double check the type of hierarchy and reconstruct if necessary
-        contact_file = self._reconstruct(hierarchy)
-
-        if len(contact_file) > 1:
-            raise RuntimeError('More than one contact map provided')
-
-        content = ""
-
-        for contact_map in contact_file:
-            for contact in contact_map:
-                line = "{res1_seq},{res2_seq},{raw_score:.6f}"
-                line = line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq, raw_score=contact.raw_score)
-                content += line + os.linesep
+        self._write_single_map(f_handle, hierarchy)
 
-        f_handle.write(content)
+    @staticmethod
+    def _format_line(contact):
+        """Format a contact as a line"""
+        line = "{res1_seq},{res2_seq},{raw_score:.6f}"
+        return line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq, raw_score=contact.raw_score)
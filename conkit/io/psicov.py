@@ -36,17 +36,15 @@ __author__ = "Felix Simkovic"
 __date__ = "03 Aug 2016"
 __version__ = "0.1"
 
-import os
 
-from conkit.io._parser import ContactFileParser
-from conkit.core.contact import Contact
-from conkit.core.contactmap import ContactMap
-from conkit.core.contactfile import ContactFile
+from conkit.io._parser import ContactFileParser, ContactRecord
 
 
 class PsicovParser(ContactFileParser):
     """Class to parse a PSICOV contact prediction
     """
+    method = 'Contact map predicted using PSICOV'
+
     def read(self, f_handle, f_id="psicov"):
         """Read a contact file
 
@@ -63,10 +61,24 @@ class PsicovParser(ContactFileParser):
 
         """
 
-        hierarchy = ContactFile(f_id)
-        _map = ContactMap("map_1")
-        hierarchy.add(_map)
+        contact_file, records = self.read_stream(f_handle, f_id=f_id)
+        contact_file.add(self._contact_map_from_records(records))
+        return contact_file
+
+    def iter_contacts(self, f_handle):
+        """Iterate over the contacts in a contact file
 
+        Parameters
+        ----------
+        f_handle
+           Open file handle [read permissions]
+
+        Returns
+        -------
+        generator
+           A :obj:`ContactRecord <conkit.io._parser.ContactRecord>` for each contact
+
+        """
         for line in f_handle:
             line = line.strip().split()
 
@@ -74,13 +86,8 @@ class PsicovParser(ContactFileParser):
                 continue
 
             elif line[0].isdigit():
-                _contact = Contact(int(line[0]), int(line[1]), float(line[4]),
-                                   distance_bound=(float(line[2]), float(line[3])))
-                _map.add(_contact)
-
-        hierarchy.method = 'Contact map predicted using PSICOV'
-
-        return hierarchy
+                yield ContactRecord("map_1", int(line[0]), int(line[1]), float(line[4]),
+                                    lower_bound=float(line[2]), upper_bound=float(line[3]))
 
     def write(self, f_handle, hierarchy):
         """Write a contact file instance to to file
@@ -98,21 +105,13 @@ class PsicovParser(ContactFileParser):
            More than one contact map in the hierarchy
 
         """
-        # Double check the type of hierarchy and reconstruct if necessary
-        contact_file = self._reconstruct(hierarchy)
-
-        if len(contact_file) > 1:
-            raise RuntimeError('More than one contact map provided')
-
-        content = ""
-
-        for contact_map in contact_file:
-            for contact in contact_map:
-                line = "{res1_seq} {res2_seq} {lb} {ub} {raw_score:.6f}"
-                lb = int(contact.lower_bound) if float(contact.lower_bound).is_integer() else contact.lower_bound
-                ub = int(contact.upper_bound) if float(contact.upper_bound).is_integer() else contact.upper_bound
-                line = line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq, raw_score=contact.raw_score,
-                                   lb=lb, ub=ub)
-                content += line + os.linesep
-
-        f_handle.write(content)
+        self._write_single_map(f_handle, hierarchy)
+
+    @staticmethod
+    def _format_line(contact):
+        """Format a contact as a line"""
+        line = "{res1_seq} {res2_seq} {lb} {ub} {raw_score:.6f}"
+        lb = int(contact.lower_bound) if float(contact.lower_bound).is_integer() else contact.lower_bound
+        ub = int(contact.upper_bound) if float(contact.upper_bound).is_integer() else contact.upper_bound
+        return line.format(res1_seq=contact.res1_seq, res2_seq=contact.res2_seq,
+                           raw_score=contact.raw_score, lb=lb, ub=ub)
@@ -36,9 +36,9 @@ __author__ = "Felix Simkovic"
 __date__ = "09 Sep 2016"
 __version__ = "0.1"
 
-import os
 import re
 
+from conkit.io._iotools import LineWriter
 from conkit.io._parser import SequenceFileParser
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
@@ -130,29 +130,28 @@ class StockholmParser(SequenceFileParser):
         # Double check the type of sequence_file and reconstruct if necessary
         sequence_file = self._reconstruct(hierarchy)
 
-        content = "# STOCKHOLM 1.0" + os.linesep
-        content += "#=GF ID {}".format(sequence_file.top_sequence.id) + os.linesep * 2
+        with LineWriter(f_handle) as writer:
+            writer.write_line("# STOCKHOLM 1.0")
+            writer.write_lines(["#=GF ID {}".format(sequence_file.top_sequence.id), ""])
 
-        chunks = []
-        for i, sequence_entry in enumerate(sequence_file):
+            chunks = []
+            for i, sequence_entry in enumerate(sequence_file):
 
-            if i != 0:
-                content += '#=GS {:33} DE {}'.format(sequence_entry.id, " ".join(sequence_entry.remark)) + os.linesep
+                if i != 0:
+                    writer.write_line('#=GS {:33} DE {}'.format(sequence_entry.id, " ".join(sequence_entry.remark)))
 
-            # Cut the sequence into chunks [ <= 200 seq chars per line]
-            chunk = []
-            sequence_string = sequence_entry.seq
-            sequence_string = sequence_string.upper()  # UPPER CASE !!!
-            for j in range(0, sequence_entry.seq_len, 200):
-                chunk.append(sequence_string[j:j + 200])
-            chunks.append(tuple([sequence_entry.id, chunk]))
+                # Cut the sequence into chunks [ <= 200 seq chars per line]
+                chunk = []
+                sequence_string = sequence_entry.seq
+                sequence_string = sequence_string.upper()  # UPPER CASE !!!
+                for j in range(0, sequence_entry.seq_len, 200):
+                    chunk.append(sequence_string[j:j + 200])
+                chunks.append(tuple([sequence_entry.id, chunk]))
 
-        # Write the sequence out in chunks
-        for j in range(len(chunks[0][1])):
-            content += os.linesep
-            for i in range(len(chunks)):
-                content += "{:41} {}".format(chunks[i][0], chunks[i][1][j]) + os.linesep
+            # Write the sequence out in chunks
+            for j in range(len(chunks[0][1])):
+                writer.write_line("")
+                for i in range(len(chunks)):
+                    writer.write_line("{:41} {}".format(chunks[i][0], chunks[i][1][j]))
 
-        content += "//" + os.linesep
-
-        f_handle.write(content)
+            writer.write_line("//")
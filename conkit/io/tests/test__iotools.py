@@ -3,6 +3,9 @@
 __author__ = "Felix Simkovic"
 __date__ = "21 Nov 2016"
 
+import gzip
+import io
+import numpy as np
 import os
 import unittest
 
@@ -11,6 +14,25 @@ from conkit.io import _iotools
 
 class Test(unittest.TestCase):
 
+    def test_line_writer_1(self):
+        f_handle = io.StringIO()
+        with _iotools.LineWriter(f_handle, buffer_size=10) as writer:
+            writer.write_line(u"PFRMAT RR")
+            self.assertEqual(u"", f_handle.getvalue())
+            writer.write_line(u"MODEL  1")
+            self.assertEqual(u"PFRMAT RR" + os.linesep + u"MODEL  1" + os.linesep, f_handle.getvalue())
+            writer.write_lines([u"1 2", u"END"])
+            writer.write(u"//")
+        self.assertEqual(os.linesep.join([u"PFRMAT RR", u"MODEL  1", u"1 2", u"END", u"//"]), f_handle.getvalue())
+
+    def test_line_writer_2(self):
+        f_handle = io.StringIO()
+        with self.assertRaises(RuntimeError):
+            with _iotools.LineWriter(f_handle) as writer:
+                writer.write_line(u"PFRMAT RR")
+                raise RuntimeError
+        self.assertEqual(u"", f_handle.getvalue())
+
     def test_create_tmp_f_1(self):
         fname = _iotools.create_tmp_f()
         self.assertTrue(os.path.isfile(fname))
@@ -98,6 +120,103 @@ class Test(unittest.TestCase):
         with self.assertRaises(ValueError):
             _iotools.open_f_handle(fname, 'bar')
 
+    def test_open_f_handle_7(self):
+        fname = _iotools.create_tmp_f(content=b'\x00\x01', mode='wb')
+        with _iotools.open_f_handle(fname, 'read', binary=True) as fhandle:
+            self.assertEqual('rb', fhandle.mode)
+            self.assertEqual(b'\x00\x01', fhandle.read())
+        with open(fname, 'rb') as fhandle:
+            self.assertIs(fhandle, _iotools.open_f_handle(fhandle, 'read', binary=True))
+            with self.assertRaises(TypeError):
+                _iotools.open_f_handle(fhandle, 'read')
+        os.unlink(fname)
+
+    def test_open_f_handle_8(self):
+        for compression, _ in _iotools.COMPRESSIONS:
+            if compression == 'xz' and _iotools.lzma is None:
+                continue
+            fname = _iotools.create_tmp_f() + '.' + compression
+            with _iotools.open_f_handle(fname, 'write') as fhandle:
+                fhandle.write(u"hello world!\n" * 10000)
+            with open(fname, 'rb') as fhandle:
+                self.assertNotEqual(b"hello", fhandle.read(5))
+            with _iotools.open_f_handle(fname, 'read') as fhandle:
+                self.assertEqual(u"hello world!\n", fhandle.readline())
+                self.assertEqual(9999, len(fhandle.readlines()))
+            os.unlink(fname)
+
+    def test_open_f_handle_9(self):
+        fname = _iotools.create_tmp_f()
+        with gzip.open(fname, 'wb') as fhandle:
+            fhandle.write(b"\x00\x01\x02")
+        self.assertEqual('gz', _iotools.detect_compression(fname))
+        with _iotools.open_f_handle(fname, 'read', binary=True) as fhandle:
+            self.assertEqual(b"\x00\x01", fhandle.read(2))
+            fhandle.seek(0)
+            self.assertEqual(b"\x00\x01\x02", fhandle.read())
+        os.unlink(fname)
+
+    def test_compressing_writer_1(self):
+        fname = _iotools.create_tmp_f() + '.gz'
+        with _iotools.open_f_handle(fname, 'write', binary=True) as fhandle:
+            fhandle.write(b"\x00\x01\x02")
+            fhandle.seek(0)
+            fhandle.write(b"\x03")
+            self.assertFalse(os.path.isfile(fname))
+        with gzip.open(fname, 'rb') as fhandle:
+            self.assertEqual(b"\x03\x01\x02", fhandle.read())
+        os.unlink(fname)
+
+    def test_compressing_writer_2(self):
+        fname = _iotools.create_tmp_f() + '.gz'
+        with self.assertRaises(RuntimeError):
+            with _iotools.open_f_handle(fname, 'write', binary=True) as fhandle:
+                fhandle.write(b"\x00\x01\x02")
+                raise RuntimeError
+        self.assertFalse(os.path.isfile(fname))
+        self.assertTrue(fhandle.closed)
+
+    def test_detect_compression_1(self):
+        fname = _iotools.create_tmp_f(content=b'plain text', mode='wb')
+        self.assertIsNone(_iotools.detect_compression(fname))
+        self.assertIsNone(_iotools.detect_compression(fname, 'write'))
+        self.assertEqual('gz', _iotools.detect_compression(fname + '.GZ', 'write'))
+        self.assertEqual('xz', _iotools.detect_compression(fname + '.xz', 'read'))
+        os.rename(fname, fname + '.bz2')
+        self.assertIsNone(_iotools.detect_compression(fname + '.bz2'))
+        self.assertEqual('bz2', _iotools.detect_compression(fname + '.bz2', 'write'))
+        os.unlink(fname + '.bz2')
+
+    def test_read_ahead_reader_1(self):
+        content = os.urandom(100000)
+        with io.BufferedReader(_iotools.ReadAheadReader(io.BytesIO(content), chunk_size=1000, depth=2)) as fhandle:
+            self.assertEqual(content[:10], fhandle.read(10))
+            self.assertEqual(content[10:], fhandle.read())
+            self.assertEqual(b"", fhandle.read())
+        fhandle = _iotools.ReadAheadReader(io.BytesIO(content), chunk_size=1000, depth=2)
+        fhandle.close()
+        self.assertTrue(fhandle.closed)
+
+    def test_memmap_npz_member_1(self):
+        fname = _iotools.create_tmp_f()
+        with open(fname, 'wb') as f_out:
+            np.savez(f_out, a=np.arange(12.).reshape(3, 4), b=np.asfortranarray(np.eye(3)))
+        a = _iotools.memmap_npz_member(fname, 'a')
+        self.assertIsInstance(a, np.memmap)
+        self.assertEqual(np.arange(12.).reshape(3, 4).tolist(), a.tolist())
+        self.assertEqual(np.eye(3).tolist(), _iotools.memmap_npz_member(fname, 'b').tolist())
+        with self.assertRaises(KeyError):
+            _iotools.memmap_npz_member(fname, 'c')
+        del a
+        os.unlink(fname)
+
+    def test_memmap_npz_member_2(self):
+        fname = _iotools.create_tmp_f()
+        with open(fname, 'wb') as f_out:
+            np.savez_compressed(f_out, a=np.arange(12.))
+        self.assertIsNone(_iotools.memmap_npz_member(fname, 'a'))
+        os.unlink(fname)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -8,7 +8,10 @@ from conkit.core.contactfile import ContactFile
 from conkit.core.contactmap import ContactMap
 from conkit.core.sequence import Sequence
 from conkit.core.sequencefile import SequenceFile
-from conkit.io._parser import Parser
+import io
+
+from conkit.io import _parser
+from conkit.io._parser import ContactFileParser, ContactRecord, Parser, SequenceFileParser, SequenceRecord
 
 import unittest
 
@@ -41,5 +44,142 @@ class Test_Parser(unittest.TestCase):
         self.assertTrue(isinstance(hierarchy, SequenceFile))
 
 
+    def test_iter_contacts_1(self):
+        class DummyParser(ContactFileParser):
+            def read(self, f_handle, f_id='dummy'):
+                contact_map = ContactMap('1')
+                contact_map.add(Contact(1, 3, 0.5))
+                contact_file = ContactFile(f_id)
+                contact_file.add(contact_map)
+                return contact_file
+
+            def write(self, f_handle, hierarchy):
+                pass
+
+        records = list(DummyParser().iter_contacts(None))
+        self.assertEqual([ContactRecord('1', 1, 3, 0.5)], records)
+
+    def test_iter_sequences_1(self):
+        class DummyParser(SequenceFileParser):
+            def read(self, f_handle, f_id='dummy'):
+                sequence_file = SequenceFile(f_id)
+                sequence_file.add(Sequence('seq_1', 'AAA'))
+                return sequence_file
+
+            def write(self, f_handle, hierarchy):
+                pass
+
+        self.assertEqual([SequenceRecord('seq_1', 'AAA', ())], list(DummyParser().iter_sequences(None)))
+
+    def test_read_stream_1(self):
+        class DummyParser(ContactFileParser):
+            def read(self, f_handle, f_id='dummy'):
+                pass
+
+            def write(self, f_handle, hierarchy):
+                pass
+
+        with self.assertRaises(NotImplementedError):
+            DummyParser().read_stream(None)
+        with self.assertRaises(NotImplementedError):
+            DummyParser().write_stream(None, ContactFile('dummy'), [])
+
+    def test_read_stream_2(self):
+        class DummyParser(ContactFileParser):
+            method = 'Dummy method'
+
+            def read(self, f_handle, f_id='dummy'):
+                pass
+
+            def iter_contacts(self, f_handle):
+                for line in f_handle:
+                    res1_seq, res2_seq = line.split()
+                    yield ContactRecord('map_1', int(res1_seq), int(res2_seq), 1.0)
+
+            def write(self, f_handle, hierarchy):
+                self._write_single_map(f_handle, hierarchy, footer=u'END')
+
+            def _write_header(self, writer, hierarchy, sequence, footer=None):
+                writer.write_line(u'ID {}'.format(hierarchy.id))
+
+            def _write_footer(self, writer, hierarchy, footer=None):
+                writer.write_line(footer)
+
+            @staticmethod
+            def _format_line(contact):
+                return u'{} {}'.format(contact.res1_seq, contact.res2_seq)
+
+        contact_file, records = DummyParser().read_stream(io.StringIO(u'1 5\n2 6\n'), f_id='dummy')
+        self.assertEqual(['Dummy method'], contact_file.method)
+        f_handle = io.StringIO()
+        DummyParser().write_stream(f_handle, contact_file, records, footer=u'//')
+        self.assertEqual([u'ID dummy', u'1 5', u'2 6', u'//'], f_handle.getvalue().splitlines())
+        f_handle = io.StringIO()
+        DummyParser().write(f_handle, Contact(3, 7, 0.5))
+        self.assertEqual([u'ID conkit', u'3 7', u'END'], f_handle.getvalue().splitlines())
+
+    def test_read_selected_1(self):
+        class DummyParser(ContactFileParser):
+            def read(self, f_handle, f_id='dummy'):
+                contact_map = ContactMap('1')
+                for res1_seq, res2_seq, raw_score in [(1, 3, 0.5), (1, 9, 0.2), (2, 8, 0.7), (3, 9, 0.5)]:
+                    contact_map.add(Contact(res1_seq, res2_seq, raw_score))
+                contact_file = ContactFile(f_id)
+                contact_file.add(contact_map)
+                return contact_file
+
+            def write(self, f_handle, hierarchy):
+                pass
+
+        contact_file = DummyParser().read_selected(None, min_separation=3, top=2)
+        self.assertEqual([(2, 8), (3, 9)], [c.id for c in contact_file[0]])
+        contact_file = DummyParser().read_selected(None, min_score=0.5)
+        self.assertEqual([(1, 3), (2, 8), (3, 9)], [c.id for c in contact_file[0]])
+
+    def test_read_selected_2(self):
+        class DummyParser(ContactFileParser):
+            def read(self, f_handle, f_id='dummy'):
+                pass
+
+            def read_stream(self, f_handle, f_id='dummy'):
+                records = [ContactRecord('map_1', 1, 3, 0.5), ContactRecord('map_1', 1, 9, 0.2, res1='A'),
+                           ContactRecord('map_1', 2, 8, 0.7), ContactRecord('map_1', 3, 9, 0.5)]
+                return ContactFile(f_id), iter(records)
+
+            def write(self, f_handle, hierarchy):
+                pass
+
+        contact_file = DummyParser().read_selected(None, min_separation=3, top=2)
+        self.assertEqual('conkit', contact_file.id)
+        self.assertEqual('map_1', contact_file[0].id)
+        self.assertEqual([(2, 8), (3, 9)], [c.id for c in contact_file[0]])
+        contact_file = DummyParser().read_selected(None, min_separation=3, min_score=0.1)
+        self.assertEqual([(1, 9, 'A'), (2, 8, 'X'), (3, 9, 'X')], [c.id + (c.res1, ) for c in contact_file[0]])
+        contact_file = DummyParser().read_selected(None, min_score=1.0)
+        self.assertEqual(0, len(contact_file[0]))
+
+
+    def test__contact_map_from_records_1(self):
+        records = [ContactRecord('1', i, i + 5, i / 10., res1_chain='A' if i == 3 else '') for i in range(1, 6)]
+        chunk_size = _parser.RECORD_CHUNK_SIZE
+        _parser.RECORD_CHUNK_SIZE = 2
+        try:
+            contact_map = ContactFileParser._contact_map_from_records(iter(records), altloc=True)
+        finally:
+            _parser.RECORD_CHUNK_SIZE = chunk_size
+        self.assertTrue(contact_map.columnar)
+        self.assertEqual('1', contact_map.id)
+        self.assertEqual([(i, i + 5) for i in range(1, 6)], [c.id for c in contact_map])
+        self.assertEqual([(i, i + 5) for i in range(1, 6)], [(c.res1_altseq, c.res2_altseq) for c in contact_map])
+        self.assertEqual(['', '', 'A', '', ''], [c.res1_chain for c in contact_map])
+        self.assertEqual([0.1, 0.2, 0.3, 0.4, 0.5], [c.raw_score for c in contact_map])
+        self.assertEqual(['X'] * 5, [c.res1 for c in contact_map])
+        self.assertEqual([8.0] * 5, [c.upper_bound for c in contact_map])
+
+    def test__contact_map_from_records_2(self):
+        contact_map = ContactFileParser._contact_map_from_records([], map_id='foo')
+        self.assertEqual('foo', contact_map.id)
+        self.assertEqual(0, len(contact_map))
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
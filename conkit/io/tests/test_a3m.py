@@ -333,5 +333,26 @@ HPNRLWIWEKHVYLDEFRRSWLPVVIKSNEKFQVILRQEDVTLGEAMSPSQLVPYEL
         os.unlink(f_name_out)
 
 
+    def test_iter_sequences_1(self):
+        content = """>header1
+AAAAAAA
+>header2
+AAAaaAA-A
+>header3
+AA-AAaAA
+"""
+        f_name = create_tmp_f(content=content)
+        with open(f_name, 'r') as f_in:
+            records = list(A3mParser().iter_sequences(f_in))
+        self.assertEqual([('header1', 'AAAAAAA'), ('header2', 'AAAAA-A'), ('header3', 'AA-AAAA')],
+                         [(r.id, r.seq) for r in records])
+        with open(f_name, 'r') as f_in:
+            records = list(A3mParser().iter_sequences(f_in, remove_insert=False))
+        with open(f_name, 'r') as f_in:
+            sequence_file = A3mParser().read(f_in, remove_insert=False)
+        self.assertEqual([s.seq for s in sequence_file], [r.seq for r in records])
+        os.unlink(f_name)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -12,6 +12,7 @@ from conkit.core.contactmap import ContactMap
 from conkit.core.sequence import Sequence
 from conkit.io.casp import CaspParser
 from conkit.io._iotools import create_tmp_f
+from conkit.io._parser import ContactRecord
 
 
 class TestCaspParser(unittest.TestCase):
@@ -246,6 +247,25 @@ END
         self.assertEqual("HLEG-IGILL-K-E-------------------", contact_map1.repr_sequence.seq)
         os.unlink(f_name)
 
+    def test_read_8(self):
+        content = """PFRMAT RR
+MODEL  1
+1  5  0  8  0.50
+ENDMDL
+MODEL  1
+2  6  0  8  0.40
+ENDMDL
+END
+"""
+        f_name = create_tmp_f(content=content)
+        with open(f_name, 'r') as f_in:
+            with self.assertRaises(ValueError):
+                CaspParser().read(f_in)
+        with open(f_name, 'r') as f_in:
+            with self.assertRaises(ValueError):
+                list(CaspParser().iter_contacts(f_in))
+        os.unlink(f_name)
+
     def test_write_1(self):
         contact_file = ContactFile('RR')
         contact_file.target = 'R9999'
@@ -437,6 +457,72 @@ END
         os.unlink(f_name)
 
 
+    def test_iter_contacts_1(self):
+        content = """PFRMAT RR
+TARGET R9999
+MODEL  1
+HLEGSIGILL
+1  9  0  8  0.70
+A2 B8  0  6  0.90
+ENDMDL
+MODEL  2
+3  7  0  8  0.40
+ENDMDL
+END
+"""
+        f_name = create_tmp_f(content=content)
+        with open(f_name, 'r') as f_in:
+            records = list(CaspParser().iter_contacts(f_in))
+        self.assertEqual([('1', 1, 9, 0.7, 'H', 'L', '', '', 8.0), ('1', 2, 8, 0.9, 'L', 'I', 'A', 'B', 6.0),
+                          ('2', 3, 7, 0.4, 'X', 'X', '', '', 8.0)],
+                         [(r.map_id, r.res1_seq, r.res2_seq, r.raw_score, r.res1, r.res2, r.res1_chain, r.res2_chain,
+                           r.upper_bound) for r in records])
+        os.unlink(f_name)
+
+    def test_write_stream_1(self):
+        contact_file = ContactFile('RR')
+        contact_file.method = 'Contact map predicted using PSICOV'
+        records = [ContactRecord('map_1', 1, 9, -1.0), ContactRecord('map_1', 2, 8, 3.0),
+                   ContactRecord('map_1', 5, 8, 0.0, res1_chain='A', res2_chain='B')]
+        f_name = create_tmp_f()
+        with open(f_name, 'w') as f_out:
+            CaspParser().write_stream(f_out, contact_file, records, score_range=(-1.0, 3.0))
+        content = [
+            "PFRMAT RR",
+            "METHOD Contact map predicted using PSICOV",
+            "MODEL  map_1",
+            "1    9    0   8   0.000000",
+            "2    8    0   8   1.000000",
+            "A5    B8    0   8   0.250000",
+            "ENDMDL",
+            "END",
+        ]
+        with open(f_name, 'r') as f_in:
+            output = f_in.read().splitlines()
+        self.assertEqual(content, output)
+        os.unlink(f_name)
+
+    def test_write_stream_2(self):
+        records = [ContactRecord('1', 1, 9, 0.5), ContactRecord('2', 2, 8, 0.25)]
+        f_name = create_tmp_f()
+        with open(f_name, 'w') as f_out:
+            CaspParser().write_stream(f_out, ContactFile('RR'), records)
+        content = [
+            "PFRMAT RR",
+            "MODEL  1",
+            "1    9    0   8   0.500000",
+            "ENDMDL",
+            "MODEL  2",
+            "2    8    0   8   0.250000",
+            "ENDMDL",
+            "END",
+        ]
+        with open(f_name, 'r') as f_in:
+            output = f_in.read().splitlines()
+        self.assertEqual(content, output)
+        os.unlink(f_name)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
 
@@ -3,6 +3,7 @@
 __author__ = "Felix Simkovic"
 __date__ = "14 Sep 2016"
 
+import numpy as np
 import os
 import sys
 import unittest
@@ -11,8 +12,8 @@ from conkit.core.contact import Contact
 from conkit.core.contactfile import ContactFile
 from conkit.core.contactmap import ContactMap
 from conkit.core.sequence import Sequence
-from conkit.io.ccmpred import CCMpredParser
-from conkit.io._iotools import create_tmp_f
+from conkit.io.ccmpred import CCMpredParser, CCMpredNpzParser
+from conkit.io._iotools import create_tmp_f, open_f_handle
 
 
 class TestCCMpredParser(unittest.TestCase):
@@ -54,6 +55,52 @@ class TestCCMpredParser(unittest.TestCase):
         )
         os.unlink(f_name)
 
+    def test_read_2(self):
+        content = """0.0\t0.4\t0.9\t0.2
+0.4\t0.0\t0.1\t0.7
+0.9\t0.1\t0.0\t0.3
+0.2\t0.7\t0.3\t0.0
+"""
+        f_name = create_tmp_f(content=content)
+        with open(f_name, 'r') as f_in:
+            contact_map = CCMpredParser().read(f_in, min_separation=2, top=2).top_map
+        self.assertEqual([(1, 3), (2, 4)], [c.id for c in contact_map])
+        with open(f_name, 'r') as f_in:
+            contact_map = CCMpredParser().read(f_in, min_score=0.5).top_map
+        self.assertEqual([(1, 3), (2, 4)], [c.id for c in contact_map])
+        os.unlink(f_name)
+
+    def test_read_3(self):
+        f_name = create_tmp_f(content="0.0 0.4 0.9\n0.4 0.0\n")
+        with open(f_name, 'r') as f_in:
+            with self.assertRaises(ValueError):
+                CCMpredParser().read(f_in)
+        os.unlink(f_name)
+
+    def test_read_4(self):
+        f_name = create_tmp_f(content="0.0 0.4\n0.4 0.0\nfoo\n")
+        with open(f_name, 'r') as f_in:
+            with self.assertRaises(ValueError):
+                CCMpredParser().read(f_in)
+        os.unlink(f_name)
+
+    def test_iter_contacts_1(self):
+        f_name = create_tmp_f(content="0.0 0.4 0.9\n0.4 0.0 0.1\n\n0.9 0.1 0.0\n")
+        with open(f_name, 'r') as f_in:
+            records = list(CCMpredParser().iter_contacts(f_in, min_separation=1))
+        self.assertEqual([(1, 2, 0.4), (1, 3, 0.9), (2, 3, 0.1)], [(r.res1_seq, r.res2_seq, r.raw_score) for r in records])
+        with open(f_name, 'r') as f_in:
+            records = list(CCMpredParser().iter_contacts(f_in, min_score=0.3))
+        self.assertEqual([(1, 2), (1, 3)], [(r.res1_seq, r.res2_seq) for r in records])
+        os.unlink(f_name)
+
+    def test_iter_contacts_2(self):
+        f_name = create_tmp_f(content="0.0 0.4 0.9\n0.4 0.0 0.1\n")
+        with open(f_name, 'r') as f_in:
+            with self.assertRaises(ValueError):
+                list(CCMpredParser().iter_contacts(f_in))
+        os.unlink(f_name)
+
     def test_write_1(self):
         contact_file = ContactFile('test')
         contact_map = ContactMap('1')
@@ -103,5 +150,84 @@ class TestCCMpredParser(unittest.TestCase):
                 self.assertTrue(True)
 
 
+class TestCCMpredNpzParser(unittest.TestCase):
+
+    def test_read_1(self):
+        f_name = create_tmp_f()
+        mat = np.array([[0.0, 0.4, 0.9, 0.2], [0.4, 0.0, 0.1, 0.7], [0.9, 0.1, 0.0, 0.3], [0.2, 0.7, 0.3, 0.0]])
+        with open(f_name, 'wb') as f_out:
+            np.save(f_out, mat)
+        with open(f_name, 'rb') as f_in:
+            contact_file = CCMpredNpzParser().read(f_in)
+        self.assertEqual(['Contact map predicted using CCMpred'], contact_file.method)
+        self.assertEqual(10, len(contact_file.top_map))
+        self.assertEqual((1, 3), contact_file.top_map.top_contact.id)
+        with open(f_name, 'rb') as f_in:
+            contact_map = CCMpredNpzParser().read(f_in, min_separation=2, top=2).top_map
+        self.assertEqual([(1, 3), (2, 4)], [c.id for c in contact_map])
+        os.unlink(f_name)
+
+    def test_read_2(self):
+        f_name = create_tmp_f(content="0.0 0.4\n0.4 0.0\n")
+        with open(f_name, 'rb') as f_in:
+            with self.assertRaises(ValueError):
+                CCMpredNpzParser().read(f_in)
+        os.unlink(f_name)
+
+    def test_write_1(self):
+        contact_file = ContactFile('test')
+        contact_file.method = 'Test method'
+        contact_map = ContactMap('1')
+        contact_file.add(contact_map)
+        for c in [(1, 9, 0.7), (1, 10, 0.7), (2, 8, 0.9), (3, 12, 0.4)]:
+            contact_map.add(Contact(c[0], c[1], c[2]))
+        contact_map.sequence = Sequence('seq_1', 'HLEGSIGILLKK')
+        f_name = create_tmp_f()
+        with open(f_name, 'wb') as f_out:
+            CCMpredNpzParser().write(f_out, contact_file)
+        with open(f_name, 'rb') as f_in:
+            contact_file = CCMpredNpzParser().read(f_in, min_separation=1, min_score=0.1)
+        contact_map = contact_file.top_map
+        self.assertEqual(['Test method'], contact_file.method)
+        self.assertEqual([(2, 8), (1, 9), (1, 10), (3, 12)], [c.id for c in contact_map])
+        self.assertEqual([0.9, 0.7, 0.7, 0.4], [c.raw_score for c in contact_map])
+        self.assertEqual(('seq_1', 'HLEGSIGILLKK'), (contact_map.sequence.id, contact_map.sequence.seq))
+        with open(f_name, 'rb') as f_in:
+            self.assertEqual(66, len(np.load(f_in)['matrix'][np.triu_indices(12, k=1)]))
+        os.unlink(f_name)
+
+    def test_iter_contacts_1(self):
+        f_name = create_tmp_f()
+        with open(f_name, 'wb') as f_out:
+            np.save(f_out, np.array([[0.0, 0.4, 0.9], [0.4, 0.0, 0.1], [0.9, 0.1, 0.0]]))
+        with open(f_name, 'rb') as f_in:
+            records = list(CCMpredNpzParser().iter_contacts(f_in, min_separation=1, min_score=0.2))
+        self.assertEqual([(1, 2, 0.4), (1, 3, 0.9)], [(r.res1_seq, r.res2_seq, r.raw_score) for r in records])
+        os.unlink(f_name)
+
+    def test_write_2(self):
+        contact_map = ContactMap.from_arrays([1, 2], [5, 6], [0.5, 0.8])
+        f_name = create_tmp_f()
+        with open(f_name, 'wb') as f_out:
+            CCMpredNpzParser().write(f_out, contact_map)
+        with open(f_name, 'rb') as f_in:
+            contact_file = CCMpredNpzParser().read(f_in, top=1)
+        self.assertEqual([(2, 6)], [c.id for c in contact_file.top_map])
+        self.assertIsNone(contact_file.top_map.sequence)
+        os.unlink(f_name)
+
+    def test_write_3(self):
+        contact_map = ContactMap.from_arrays([1, 2], [5, 6], [0.5, 0.8])
+        f_name = create_tmp_f() + '.npz.gz'
+        with open_f_handle(f_name, 'write', binary=True) as f_out:
+            CCMpredNpzParser().write(f_out, contact_map)
+        with open(f_name, 'rb') as f_in:
+            self.assertEqual(b'\x1f\x8b', f_in.read(2))
+        with open_f_handle(f_name, 'read', binary=True) as f_in:
+            contact_file = CCMpredNpzParser().read(f_in, top=2)
+        self.assertEqual([(2, 6), (1, 5)], [c.id for c in contact_file.top_map])
+        os.unlink(f_name)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,110 @@
+"""Testing facility for conkit.io.ConkitNpzParser"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import numpy as np
+import os
+import unittest
+
+from conkit.core.contact import Contact
+from conkit.core.contactfile import ContactFile
+from conkit.core.contactmap import ContactMap
+from conkit.core.sequence import Sequence
+from conkit.io.conkitnpz import ConkitNpzParser
+from conkit.io._iotools import create_tmp_f, open_f_handle
+
+
+class TestConkitNpzParser(unittest.TestCase):
+
+    def _round_trip(self, hierarchy):
+        f_name = create_tmp_f()
+        with open(f_name, 'wb') as f_out:
+            ConkitNpzParser().write(f_out, hierarchy)
+        with open(f_name, 'rb') as f_in:
+            contact_file = ConkitNpzParser().read(f_in, f_id='test')
+        os.unlink(f_name)
+        return contact_file
+
+    def test_read_1(self):
+        contact_file = ContactFile('test')
+        contact_file.author = '1234-5678-9000'
+        contact_file.method = ['Method one', 'Method two']
+        contact_file.remark = 'Predictor remarks'
+        contact_file.target = 'R9999'
+        contact_map = ContactMap('1')
+        contact_file.add(contact_map)
+        for c in [(1, 9, 0, 8, 0.7), (2, 8, 3, 6, 0.9), (3, 12, 0, 8, 0.4)]:
+            contact = Contact(c[0], c[1], c[4], distance_bound=(c[2], c[3]))
+            contact_map.add(contact)
+        contact_map.sequence = Sequence('seq_1', 'HLEGSIGILLKK')
+        contact_map.sequence.remark = 'A remark'
+        contact_map.assign_sequence_register()
+        contact_map.child_list[0].res1_chain = 'A'
+        contact_map.child_list[0].res2_chain = 'B'
+        contact_map.child_list[1].res1_altseq = 20
+        contact_map.child_list[1].res2_altseq = 26
+        contact_map.child_list[1].scalar_score = 1.5
+        contact_map.child_list[1].weight = 2.0
+        contact_map.child_list[2].define_match()
+        contact_map.child_list[1].define_mismatch()
+
+        read_file = self._round_trip(contact_file)
+        self.assertEqual('test', read_file.id)
+        self.assertEqual('1234-5678-9000', read_file.author)
+        self.assertEqual(['Method one', 'Method two'], read_file.method)
+        self.assertEqual(['Predictor remarks'], read_file.remark)
+        self.assertEqual('R9999', read_file.target)
+        self.assertEqual(1, len(read_file))
+        read_map = read_file.top_map
+        self.assertEqual('1', read_map.id)
+        self.assertTrue(read_map.columnar)
+        self.assertEqual(('seq_1', 'HLEGSIGILLKK', ['A remark']),
+                         (read_map.sequence.id, read_map.sequence.seq, read_map.sequence.remark))
+        attributes = ['id', 'raw_score', 'res1', 'res2', 'res1_chain', 'res2_chain', 'res1_altseq', 'res2_altseq',
+                      'scalar_score', 'status', 'weight', 'distance_bound']
+        for contact, read_contact in zip(contact_map, read_map):
+            for attribute in attributes:
+                self.assertEqual(getattr(contact, attribute), getattr(read_contact, attribute))
+
+    def test_read_2(self):
+        contact_file = ContactFile('test')
+        contact_file.add(ContactMap.from_arrays([1, 2, 3], [5, 8, 9], [0.5, 0.2, 0.9], chains=('A', 'A'), id='1'))
+        contact_file.add(ContactMap('2'))
+        contact_file.add(ContactMap.from_arrays([4], [10], [0.1], bounds=(2, 6), id='3'))
+        read_file = self._round_trip(contact_file)
+        self.assertEqual(['1', '2', '3'], [m.id for m in read_file])
+        self.assertEqual([[(1, 5), (2, 8), (3, 9)], [], [(4, 10)]], [[c.id for c in m] for m in read_file])
+        self.assertEqual(['A', 'A', 'A'], [c.res1_chain for c in read_file['1']])
+        self.assertEqual([(2.0, 6.0)], [c.distance_bound for c in read_file['3']])
+        self.assertIsNone(read_file['2'].sequence)
+
+    def test_read_3(self):
+        f_name = create_tmp_f()
+        with open(f_name, 'wb') as f_out:
+            np.savez(f_out, matrix=np.zeros((2, 2)))
+        with open(f_name, 'rb') as f_in:
+            with self.assertRaises(ValueError):
+                ConkitNpzParser().read(f_in)
+        os.unlink(f_name)
+
+    def test_write_1(self):
+        contact_file = self._round_trip(Contact(1, 10, 0.5))
+        self.assertEqual([[(1, 10)]], [[c.id for c in m] for m in contact_file])
+
+    def test_write_2(self):
+        contact_file = ContactFile('test')
+        contact_map = ContactMap('1')
+        contact_file.add(contact_map)
+        contact_map.add(Contact(1, 10, 0.5))
+        f_name = create_tmp_f() + '.npz.xz'
+        with open_f_handle(f_name, 'write', binary=True) as f_out:
+            ConkitNpzParser().write(f_out, contact_file)
+        with open_f_handle(f_name, 'read', binary=True) as f_in:
+            contact_file = ConkitNpzParser().read(f_in)
+        self.assertEqual([[(1, 10)]], [[c.id for c in m] for m in contact_file])
+        os.unlink(f_name)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
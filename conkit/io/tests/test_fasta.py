@@ -6,8 +6,10 @@ __date__ = "09 Sep 2016"
 import os
 import unittest
 
+from conkit.core.sequencefile import SequenceFile
 from conkit.io.fasta import FastaParser
 from conkit.io._iotools import create_tmp_f
+from conkit.io._parser import SequenceRecord
 
 
 class TestFastaParser(unittest.TestCase):
@@ -141,5 +143,55 @@ EVHKVQECKQSDIMMRDNLFEIVTTSRTFWKRRYFQLDENTIGYF
         os.unlink(f_name_out)
 
 
+    def test_iter_sequences_1(self):
+        content = """#foo
+>seq_1
+GSMFTPKPPQDSAVIKAGYCVKQGAVMKNWKRRYFQLDENTIGYFKSELEKEPLRVIPLKEV
+HKVQECKQSDIMMRDNLFEIVTTSRTFYVQADSPEEMHSWIKAVSGAIVAQRGPGRS
+>seq_2
+ASMFTPKPPQDSAVIK
+
+>seq_3
+BBBBBBB
+"""
+        f_name = create_tmp_f(content=content)
+        with open(f_name, 'r') as f_in:
+            records = list(FastaParser().iter_sequences(f_in))
+        self.assertEqual(['seq_1', 'seq_2'], [r.id for r in records])
+        self.assertEqual(119, len(records[0].seq))
+        self.assertEqual('ASMFTPKPPQDSAVIK', records[1].seq)
+        os.unlink(f_name)
+
+    def test_read_stream_1(self):
+        content = """#foo
+#bar
+>seq_1
+GSMFTPKPPQ
+DSAVIK
+>seq_2|baz
+ASMFTPKPPQDSAVIK
+"""
+        f_name = create_tmp_f(content=content)
+        with open(f_name, 'r') as f_in:
+            sequence_file, records = FastaParser().read_stream(f_in)
+            self.assertEqual(0, len(sequence_file))
+            self.assertEqual(['foo', 'bar'], sequence_file.remark)
+            self.assertEqual([('seq_1', 'GSMFTPKPPQDSAVIK'), ('seq_2|baz', 'ASMFTPKPPQDSAVIK')],
+                             [(r.id, r.seq) for r in records])
+        os.unlink(f_name)
+
+    def test_write_stream_1(self):
+        sequence_file = SequenceFile('test')
+        sequence_file.remark = 'foo'
+        records = [SequenceRecord('seq_1', 'A' * 70), SequenceRecord('seq_2', 'acd', ('bar', ))]
+        f_name = create_tmp_f()
+        with open(f_name, 'w') as f_out:
+            FastaParser().write_stream(f_out, sequence_file, records)
+        with open(f_name, 'r') as f_in:
+            output = f_in.read().splitlines()
+        self.assertEqual(['#foo', '>seq_1', 'A' * 60, 'A' * 10, '>seq_2|bar', 'ACD'], output)
+        os.unlink(f_name)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
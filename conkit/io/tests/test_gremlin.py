@@ -202,5 +202,20 @@ i	j	i_id	j_id	r_sco	s_sco	prob
         os.unlink(f_name)
 
 
+    def test_iter_contacts_1(self):
+        content = """# Some comment
+i	j	gene	i_id	j_id	r_sco	s_sco	prob	I_prob
+8	62	AB	8_T	62_I	0.118	3.612	1.000	N/A
+7	45	A	7_K	45_L	0.100	3.200	1.000	N/A
+"""
+        f_name = create_tmp_f(content=content)
+        with open(f_name, 'r') as f_in:
+            records = list(GremlinParser().iter_contacts(f_in))
+        self.assertEqual([('AB', 8, 62, 'A', 'B', 0.118, 3.612), ('A', 7, 45, 'A', 'A', 0.1, 3.2)],
+                         [(r.map_id, r.res1_seq, r.res2_seq, r.res1_chain, r.res2_chain, r.raw_score, r.scalar_score)
+                          for r in records])
+        os.unlink(f_name)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,65 @@
+"""Testing facility for conkit.io"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import os
+import unittest
+
+from conkit import io
+from conkit.io._iotools import create_tmp_f
+
+
+class TestIo(unittest.TestCase):
+
+    def setUp(self):
+        self.f_names = [
+            create_tmp_f(content="1 9 0 8 0.7\n2 10 0 8 0.9\n"),
+            create_tmp_f(content="1 9 0 8 x\n"),
+            create_tmp_f(content="3 9 0 8 0.2\n"),
+        ]
+
+    def tearDown(self):
+        for f_name in self.f_names:
+            os.unlink(f_name)
+
+    def test_read_many_1(self):
+        results = list(io.read_many(self.f_names, 'psicov', workers=1))
+        self.assertEqual(self.f_names, [r.fname for r in results])
+        self.assertEqual([(1, 9), (2, 10)], [c.id for c in results[0].hierarchy[0]])
+        self.assertIsNone(results[0].error)
+        self.assertIsNone(results[1].hierarchy)
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual([(3, 9)], [c.id for c in results[2].hierarchy[0]])
+
+    def test_read_many_2(self):
+        results = list(io.read_many(self.f_names, 'psicov', workers=2, top=1))
+        self.assertEqual(self.f_names, [r.fname for r in results])
+        self.assertTrue(results[0].hierarchy[0].columnar)
+        self.assertEqual([(2, 10)], [c.id for c in results[0].hierarchy[0]])
+        self.assertIsInstance(results[1].error, ValueError)
+        self.assertEqual([(3, 9)], [c.id for c in results[2].hierarchy[0]])
+
+    def test_read_many_3(self):
+        results = list(io.read_many(self.f_names, 'psicov', workers=2, ordered=False))
+        self.assertEqual(sorted(self.f_names), sorted(r.fname for r in results))
+
+    def test_read_many_4(self):
+        with self.assertRaises(ValueError):
+            io.read_many(self.f_names, 'foo')
+
+    def test_read_many_5(self):
+        serial = list(io.read_many(self.f_names, 'psicov', workers=1))
+        parallel = list(io.read_many(self.f_names, 'psicov', workers=2))
+        for s, p in zip(serial, parallel):
+            self.assertEqual(s.fname, p.fname)
+            self.assertEqual(type(s.error), type(p.error))
+            if s.hierarchy is not None:
+                self.assertTrue(s.hierarchy[0].columnar)
+                self.assertTrue(p.hierarchy[0].columnar)
+                self.assertEqual([(c.id, c.raw_score, c.distance_bound) for c in s.hierarchy[0]],
+                                 [(c.id, c.raw_score, c.distance_bound) for c in p.hierarchy[0]])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
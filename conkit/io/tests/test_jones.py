@@ -76,5 +76,17 @@ EVHKVQECK--DIMMRDNLFEI--TSRTF--RRY--LDENTIGYF
         os.unlink(f_name_out)
 
 
+    def test_iter_sequences_1(self):
+        f_name = create_tmp_f(content="GSMFTPK\n\nASMF-PK\n")
+        with open(f_name, 'r') as f_in:
+            records = list(JonesParser().iter_sequences(f_in))
+        self.assertEqual([('seq_0', 'GSMFTPK'), ('seq_2', 'ASMF-PK')], [(r.id, r.seq) for r in records])
+        f_name = create_tmp_f(content="GSMFTPK\nASMF1PK\n")
+        with open(f_name, 'r') as f_in:
+            with self.assertRaises(ValueError):
+                list(JonesParser().iter_sequences(f_in))
+        os.unlink(f_name)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
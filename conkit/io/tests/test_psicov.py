@@ -73,5 +73,50 @@ class TestPsicovParser(unittest.TestCase):
         os.unlink(f_name)
 
 
+    def test_iter_contacts_1(self):
+        f_name = create_tmp_f(content="46 78 0 8 9.301869\n\n80 105 2 6 8.856009\n")
+        with open(f_name, 'r') as f_in:
+            records = list(PsicovParser().iter_contacts(f_in))
+        self.assertEqual([("map_1", 46, 78, 9.301869, 0.0, 8.0), ("map_1", 80, 105, 8.856009, 2.0, 6.0)],
+                         [(r.map_id, r.res1_seq, r.res2_seq, r.raw_score, r.lower_bound, r.upper_bound)
+                          for r in records])
+        os.unlink(f_name)
+
+    def test_read_stream_1(self):
+        f_name = create_tmp_f(content="46 78 0 8 9.301869\n80 105 2 6 8.856009\n")
+        with open(f_name, 'r') as f_in:
+            contact_file, records = PsicovParser().read_stream(f_in)
+            self.assertEqual(0, len(contact_file))
+            self.assertEqual(['Contact map predicted using PSICOV'], contact_file.method)
+            self.assertEqual([(46, 78), (80, 105)], [(r.res1_seq, r.res2_seq) for r in records])
+        os.unlink(f_name)
+
+    def test_write_stream_1(self):
+        contact_file = ContactFile('RR')
+        contact_map = ContactMap('1')
+        contact_file.add(contact_map)
+        for c in [(1, 9, 0, 8, 0.7), (1, 10, 0, 8, 0.7), (41, 58, 0, 8, 0.1)]:
+            contact = Contact(c[0], c[1], c[4], distance_bound=(c[2], c[3]))
+            contact_map.add(contact)
+        f_name_1, f_name_2 = create_tmp_f(), create_tmp_f()
+        with open(f_name_1, 'w') as f_out:
+            PsicovParser().write(f_out, contact_file)
+        with open(f_name_1, 'r') as f_in, open(f_name_2, 'w') as f_out:
+            PsicovParser().write_stream(f_out, *PsicovParser().read_stream(f_in))
+        with open(f_name_1, 'r') as f_in_1, open(f_name_2, 'r') as f_in_2:
+            self.assertEqual(f_in_1.read(), f_in_2.read())
+        os.unlink(f_name_1)
+        os.unlink(f_name_2)
+
+    def test_read_selected_1(self):
+        f_name = create_tmp_f(content="46 78 0 8 9.301869\n80 105 2 6 8.856009\n10 12 0 8 9.9\n1 20 0 8 9.5\n")
+        with open(f_name, 'r') as f_in:
+            contact_file = PsicovParser().read_selected(f_in, min_separation=5, top=2)
+        self.assertEqual(['Contact map predicted using PSICOV'], contact_file.method)
+        self.assertEqual([(1, 20, 9.5), (46, 78, 9.301869)], [(c.res1_seq, c.res2_seq, c.raw_score)
+                                                               for c in contact_file[0]])
+        os.unlink(f_name)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,239 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-18, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Shared algorithms of the contact predictors"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+__version__ = "1.0"
+
+import numpy as np
+
+from conkit.core import _msa
+from conkit.core.contactmap import ContactMap
+from conkit.core.sequencefile import AMINO_ACID_STATES
+
+# The number of residue states including the gap state
+NSTATES = len(AMINO_ACID_STATES)
+
+
+def frequencies(msa, nstates, identity, pseudocount, memory_limit):
+    """Calculate the single and pair frequencies of the first ``nstates`` residue states with pseudocounts
+
+    Parameters
+    ----------
+    msa : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+       The alignment
+    nstates : int
+       The number of residue states to include, in the order of
+       :data:`AMINO_ACID_STATES <conkit.core.sequencefile.AMINO_ACID_STATES>`
+    identity : float
+       The sequence identity for the sequence weights, or :obj:`None` for equal weights
+    pseudocount : float
+       The fraction of a uniform distribution mixed into the frequencies
+    memory_limit : int
+       The memory budget in MB for the encoded sequences
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The single frequencies of shape ``(nstates * L, )``, where the state ``a`` in column ``i``
+       is indexed by ``a * L + i``
+    :obj:`numpy.ndarray`
+       The pair frequencies of shape ``(nstates * L, nstates * L)`` in the same order
+
+    Raises
+    ------
+    ValueError
+       :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+    ValueError
+       Pseudocount needs to be between 0 and 1
+
+    """
+    if not msa.is_alignment:
+        raise ValueError('This is not an alignment')
+    elif pseudocount < 0 or pseudocount > 1:
+        raise ValueError("Pseudocount needs to be between 0 and 1")
+
+    states = msa.state_matrix
+    if identity is None:
+        weights = np.ones(states.shape[0], dtype=np.float64)
+    else:
+        weights = np.asarray(msa.calculate_weights(identity=identity, memory_limit=memory_limit))
+
+    ncols = states.shape[1]
+    pair = _msa.pair_frequency_matrix(states, nstates, weights, memory_limit=memory_limit)
+    single = pair.diagonal() * (1. - pseudocount) + pseudocount / NSTATES
+    pair *= 1. - pseudocount
+    pair += pseudocount / NSTATES ** 2
+    # A column holds a single state per sequence, so its own pair frequencies are its single frequencies
+    columns = np.arange(ncols)
+    pair.reshape(nstates, ncols, nstates, ncols)[:, columns, :, columns] = 0.
+    pair[np.diag_indices_from(pair)] = single
+    return single, pair
+
+
+def apc(scores):
+    """Apply the Average Product Correction to a symmetric matrix of scores
+
+    .. math::
+
+       S_{ij}^{APC}=S_{ij}-\\frac{\\bar{S}_{i}\\bar{S}_{j}}{\\bar{S}}
+
+    The means exclude the diagonal.
+
+    Parameters
+    ----------
+    scores : :obj:`numpy.ndarray`
+       The 2-D matrix of scores
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The corrected scores
+
+    """
+    ncols = scores.shape[0]
+    if ncols < 2:
+        return scores.copy()
+    row_sums = scores.sum(axis=1) - scores.diagonal()
+    total = row_sums.sum()
+    if total == 0:
+        return scores.copy()
+    row_means = row_sums / (ncols - 1)
+    return scores - np.outer(row_means, row_means) / (total / (ncols * (ncols - 1)))
+
+
+def frobenius_norms(couplings, nstates, memory_limit):
+    """Calculate the Frobenius norm of the coupling matrix of each pair of columns
+
+    The couplings of each pair of columns are shifted to the zero-sum gauge over all
+    :data:`NSTATES` states, where states beyond ``nstates`` have zero couplings, and the
+    norm is taken over the amino acid states, i.e. without the gap state.
+
+    Parameters
+    ----------
+    couplings : :obj:`numpy.ndarray`
+       The couplings of shape ``(nstates * L, nstates * L)``, where the state ``a`` in column ``i``
+       is indexed by ``a * L + i``
+    nstates : int
+       The number of residue states in ``couplings``
+    memory_limit : int
+       The memory budget in MB for the intermediate matrices
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+       The norms of shape ``(L, L)``
+
+    """
+    ncols = couplings.shape[0] // nstates
+    blocks = couplings.reshape(nstates, ncols, nstates, ncols)
+    norms = np.empty((ncols, ncols), dtype=np.float64)
+    chunk = max(1, int(memory_limit * 1024 ** 2 / (2 * 8 * ncols * nstates ** 2)))
+    for i in range(0, ncols, chunk):
+        block = blocks[:, i:i + chunk].transpose(1, 3, 0, 2)
+        centered = block - block.sum(axis=3, keepdims=True) / NSTATES - block.sum(axis=2, keepdims=True) / NSTATES
+        centered += block.sum(axis=(2, 3), keepdims=True) / NSTATES ** 2
+        centered = centered[:, :, :NSTATES - 1, :NSTATES - 1]
+        norms[i:i + chunk] = np.sqrt(np.square(centered).sum(axis=(2, 3)))
+    return norms
+
+
+def inverse(matrix, memory_limit):
+    """Invert a symmetric positive definite matrix, overwriting ``matrix`` if possible
+
+    The inverse is calculated from the Cholesky decomposition if SciPy is installed, which
+    takes about half the time of a general matrix inversion.
+
+    Parameters
+    ----------
+    matrix : :obj:`numpy.ndarray`
+       The symmetric positive definite 2-D matrix
+    memory_limit : int
+       The memory budget in MB for the intermediate matrices
+
+    Returns
+    -------
+    :obj:`numpy.ndarray`
+
+    Raises
+    ------
+    numpy.linalg.LinAlgError
+       The matrix is singular
+
+    """
+    try:
+        from scipy.linalg import lapack
+    except ImportError:
+        return np.linalg.inv(matrix)
+
+    # The transpose of a symmetric C-ordered matrix is the same matrix in Fortran order, so LAPACK works in place
+    factor, info = lapack.dpotrf(matrix.T, lower=False, overwrite_a=True, clean=False)
+    if info == 0:
+        inverse, info = lapack.dpotri(factor, lower=False, overwrite_c=True)
+    if info != 0:
+        raise np.linalg.LinAlgError("Matrix is not positive definite")
+
+    # Only the upper triangle is computed, mirror it to the lower triangle in chunks of rows
+    size = inverse.shape[0]
+    chunk = max(1, int(memory_limit * 1024 ** 2 / (8 * max(size, 1))))
+    for i in range(0, size, chunk):
+        block = inverse[i:i + chunk, i:i + chunk]
+        block[...] = np.triu(block) + np.triu(block, 1).T
+        inverse[i + chunk:, i:i + chunk] = inverse[i:i + chunk, i + chunk:].T
+    # Return the symmetric inverse in C order again
+    return inverse.T
+
+
+def to_contact_map(scores, msa, min_separation, top):
+    """Create a :obj:`ContactMap <conkit.core.contactmap.ContactMap>` from a matrix of scores
+
+    Parameters
+    ----------
+    scores : :obj:`numpy.ndarray`
+       The symmetric 2-D matrix of scores
+    msa : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+       The alignment, whose first sequence is assigned to the contact map
+    min_separation : int
+       The minimum sequence separation of the contacts
+    top : int
+       The number of highest-scoring contacts, or :obj:`None` for all
+
+    Returns
+    -------
+    :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+
+    """
+    contact_map = ContactMap.from_matrix(scores, min_separation=min_separation, top=top, id="map_1")
+    contact_map.sequence = msa.top_sequence.copy()
+    return contact_map
@@ -0,0 +1,120 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-18, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Contact prediction by mean-field Direct Coupling Analysis"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+__version__ = "1.0"
+
+import numpy as np
+
+from conkit.core import _msa
+from conkit.predict import _couplings
+
+
+def mean_field_dca(msa, apc=True, identity=0.8, pseudocount=0.5, shrinkage=0.0, min_separation=1, top=None,
+                   memory_limit=_msa.MEMORY_LIMIT):
+    """Predict contacts by mean-field Direct Coupling Analysis [#]_
+
+    The couplings are the negative inverse of the covariance matrix of the weighted
+    residue state frequencies, with the gap state as reference state. Each pair of
+    columns is scored by the Frobenius norm of its couplings in the zero-sum gauge.
+
+    Parameters
+    ----------
+    msa : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+       The alignment
+    apc : bool, optional
+       Apply the Average Product Correction [default: True]
+    identity : float, optional
+       The sequence identity for the sequence weights, :obj:`None` for equal weights [default: 0.8]
+    pseudocount : float, optional
+       The fraction of a uniform distribution mixed into the frequencies [default: 0.5]
+    shrinkage : float, optional
+       The fraction by which the off-diagonal covariances are shrunk towards zero [default: 0.0]
+    min_separation : int, optional
+       The minimum sequence separation of the contacts [default: 1]
+    top : int, optional
+       The number of highest-scoring contacts to keep [default: all]
+    memory_limit : int, optional
+       The memory budget in MB for the encoded sequences and intermediate matrices [default: 256]
+
+    Returns
+    -------
+    :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+       The contacts ordered by descending score
+
+    Raises
+    ------
+    ValueError
+       :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+    ValueError
+       Pseudocount needs to be between 0 and 1
+    ValueError
+       Shrinkage needs to be between 0 and 1
+    numpy.linalg.LinAlgError
+       The covariance matrix is singular, e.g. without pseudocount
+
+    Notes
+    -----
+    The covariance matrix has :math:`(20L)^2` entries, and its inversion dominates the
+    run time. It is inverted through its Cholesky decomposition if SciPy is installed. The
+    matrix operations run in the (multi-threaded) BLAS and LAPACK libraries, which can be
+    limited through their environment variables, e.g. ``OMP_NUM_THREADS``.
+
+    .. [#] Morcos F. et al. (2011). Direct-coupling analysis of residue coevolution captures
+       native contacts across many protein families. Proc Natl Acad Sci USA 108(49), E1293-301.
+
+    """
+    if shrinkage < 0 or shrinkage > 1:
+        raise ValueError("Shrinkage needs to be between 0 and 1")
+
+    # The gap state is the reference state, whose couplings are zero
+    nstates = _couplings.NSTATES - 1
+    single, covariance = _couplings.frequencies(msa, nstates, identity, pseudocount, memory_limit)
+    width = single.shape[0]
+    chunk = max(1, int(memory_limit * 1024 ** 2 / (8 * max(width, 1))))
+    for i in range(0, width, chunk):
+        covariance[i:i + chunk] -= np.outer(single[i:i + chunk], single)
+    if shrinkage > 0:
+        variances = covariance.diagonal().copy()
+        covariance *= 1. - shrinkage
+        covariance[np.diag_indices_from(covariance)] = variances
+
+    couplings = _couplings.inverse(covariance, memory_limit)
+    couplings *= -1.
+    scores = _couplings.frobenius_norms(couplings, nstates, memory_limit)
+    scores[np.diag_indices_from(scores)] = 0.
+    if apc:
+        scores = _couplings.apc(scores)
+    return _couplings.to_contact_map(scores, msa, min_separation, top)
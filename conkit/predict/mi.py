@@ -0,0 +1,103 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-18, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Contact prediction by Mutual Information"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+__version__ = "1.0"
+
+import numpy as np
+
+from conkit.core import _msa
+from conkit.predict import _couplings
+
+
+def mutual_information(msa, apc=True, identity=0.8, pseudocount=0.0, min_separation=1, top=None,
+                       memory_limit=_msa.MEMORY_LIMIT):
+    """Predict contacts by the Mutual Information of each pair of alignment columns
+
+    .. math::
+
+       MI_{ij}=\\sum_{a,b}f_{ij}(a,b)\\ln\\frac{f_{ij}(a,b)}{f_{i}(a)f_{j}(b)}
+
+    The frequencies are weighted by the sequence weights and include the gap state.
+
+    Parameters
+    ----------
+    msa : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+       The alignment
+    apc : bool, optional
+       Apply the Average Product Correction [default: True]
+    identity : float, optional
+       The sequence identity for the sequence weights, :obj:`None` for equal weights [default: 0.8]
+    pseudocount : float, optional
+       The fraction of a uniform distribution mixed into the frequencies [default: 0.0]
+    min_separation : int, optional
+       The minimum sequence separation of the contacts [default: 1]
+    top : int, optional
+       The number of highest-scoring contacts to keep [default: all]
+    memory_limit : int, optional
+       The memory budget in MB for the encoded sequences [default: 256]
+
+    Returns
+    -------
+    :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+       The contacts ordered by descending score
+
+    Raises
+    ------
+    ValueError
+       :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+    ValueError
+       Pseudocount needs to be between 0 and 1
+
+    """
+    nstates = _couplings.NSTATES
+    single, pair = _couplings.frequencies(msa, nstates, identity, pseudocount, memory_limit)
+    ncols = single.shape[0] // nstates
+
+    single = single.reshape(nstates, ncols)
+    blocks = pair.reshape(nstates, ncols, nstates, ncols)
+    scores = np.empty((ncols, ncols), dtype=np.float64)
+    chunk = max(1, int(memory_limit * 1024 ** 2 / (2 * 8 * ncols * nstates ** 2)))
+    for i in range(0, ncols, chunk):
+        observed = blocks[:, i:i + chunk]
+        expected = single[:, i:i + chunk, np.newaxis, np.newaxis] * single[np.newaxis, np.newaxis]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terms = np.where(observed > 0, observed * np.log(observed / expected), 0.)
+        scores[i:i + chunk] = terms.sum(axis=(0, 2))
+
+    scores[np.diag_indices_from(scores)] = 0.
+    if apc:
+        scores = _couplings.apc(scores)
+    return _couplings.to_contact_map(scores, msa, min_separation, top)
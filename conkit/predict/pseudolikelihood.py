@@ -0,0 +1,237 @@
+# BSD 3-Clause License
+#
+# Copyright (c) 2016-18, University of Liverpool
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+"""Contact prediction by pseudo-likelihood Direct Coupling Analysis"""
+
+from __future__ import division
+from __future__ import print_function
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+__version__ = "1.0"
+
+import numpy as np
+import threading
+
+from multiprocessing.pool import ThreadPool
+
+from conkit.core import _msa
+from conkit.predict import _couplings
+
+
+def pseudo_likelihood_dca(msa, apc=True, identity=0.8, lambda_h=0.01, lambda_j=0.2, max_iterations=100, nthreads=1,
+                          min_separation=1, top=None, memory_limit=_msa.MEMORY_LIMIT):
+    """Predict contacts by pseudo-likelihood Direct Coupling Analysis [#]_
+
+    The fields and couplings of a Potts model are fitted by minimising the weighted negative
+    pseudo-log-likelihood of the alignment with :math:`L_2` regularisation, using L-BFGS.
+    Each pair of columns is scored by the Frobenius norm of its couplings in the zero-sum
+    gauge, as in CCMpred.
+
+    Parameters
+    ----------
+    msa : :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>`
+       The alignment
+    apc : bool, optional
+       Apply the Average Product Correction [default: True]
+    identity : float, optional
+       The sequence identity for the sequence weights, :obj:`None` for equal weights [default: 0.8]
+    lambda_h : float, optional
+       The regularisation coefficient of the fields [default: 0.01]
+    lambda_j : float, optional
+       The regularisation coefficient of the couplings, multiplied by ``L - 1`` [default: 0.2]
+    max_iterations : int, optional
+       The maximum number of L-BFGS iterations [default: 100]
+    nthreads : int, optional
+       The number of threads to evaluate blocks of sequences [default: 1]
+    min_separation : int, optional
+       The minimum sequence separation of the contacts [default: 1]
+    top : int, optional
+       The number of highest-scoring contacts to keep [default: all]
+    memory_limit : int, optional
+       The memory budget in MB for the intermediate matrices of a block of sequences [default: 256]
+
+    Returns
+    -------
+    :obj:`ContactMap <conkit.core.contactmap.ContactMap>`
+       The contacts ordered by descending score
+
+    Raises
+    ------
+    RuntimeError
+       SciPy package not installed
+    ValueError
+       :obj:`SequenceFile <conkit.core.sequencefile.SequenceFile>` is not an alignment
+
+    Notes
+    -----
+    Every evaluation of the objective multiplies the one-hot encoded alignment with the
+    :math:`(21L)^2` coupling matrix. The blocks of sequences are evaluated in ``nthreads``
+    threads, which run in parallel because NumPy releases the GIL in matrix products. Each
+    thread needs memory for a copy of the coupling matrix.
+
+    .. [#] Ekeberg M. et al. (2013). Improved contact prediction in proteins: Using pseudolikelihoods
+       to infer Potts models. Phys Rev E 87(1), 012707.
+
+    """
+    try:
+        import scipy.optimize
+    except ImportError:
+        raise RuntimeError('Cannot find SciPy package')
+
+    if not msa.is_alignment:
+        raise ValueError('This is not an alignment')
+
+    states = msa.state_matrix
+    if identity is None:
+        weights = np.ones(states.shape[0], dtype=np.float64)
+    else:
+        weights = np.asarray(msa.calculate_weights(identity=identity, memory_limit=memory_limit))
+
+    ncols = states.shape[1]
+    pool = ThreadPool(nthreads) if nthreads > 1 else None
+    try:
+        model = _PseudoLikelihood(states, weights, lambda_h, lambda_j * max(ncols - 1, 1), memory_limit, pool)
+        x, _, _ = scipy.optimize.fmin_l_bfgs_b(model.evaluate, model.initial(), m=5, maxiter=max_iterations)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    scores = _couplings.frobenius_norms(model.couplings(x), _couplings.NSTATES, memory_limit)
+    scores[np.diag_indices_from(scores)] = 0.
+    if apc:
+        scores = _couplings.apc(scores)
+    return _couplings.to_contact_map(scores, msa, min_separation, top)
+
+
+class _PseudoLikelihood(object):
+    """The regularised negative pseudo-log-likelihood of a Potts model for an alignment
+
+    The parameters are the fields of shape ``(21, L)`` followed by the couplings of each pair
+    of columns ``i < j`` of shape ``(21, 21)``. The coupling matrix of shape ``(21L, 21L)``
+    indexes the state ``a`` in column ``i`` by ``a * L + i``.
+
+    """
+
+    __slots__ = ['states', 'weights', 'lambda_h', 'lambda_j', 'blocks', 'pool', 'pairs']
+
+    def __init__(self, states, weights, lambda_h, lambda_j, memory_limit, pool):
+        self.states = states
+        self.weights = weights
+        self.lambda_h = lambda_h
+        self.lambda_j = lambda_j
+        self.pool = pool
+        self.pairs = np.triu_indices(states.shape[1], k=1)
+        # The encoded block, its energies, probabilities and gradients take four doubles per state
+        width = states.shape[1] * _couplings.NSTATES
+        chunk = max(1, int(memory_limit * 1024 ** 2 / (4 * 8 * max(width, 1))))
+        self.blocks = [slice(i, i + chunk) for i in range(0, states.shape[0], chunk)]
+
+    @property
+    def nstates(self):
+        return _couplings.NSTATES
+
+    def initial(self):
+        """The initial parameters with fields from the single frequencies and zero couplings"""
+        ncols = self.states.shape[1]
+        profile = _msa.profile(self.states, self.nstates, self.weights) + 0.1 / self.nstates
+        fields = np.log(profile.T)
+        fields -= fields.mean(axis=0)
+        return np.concatenate((fields.ravel(), np.zeros(self.pairs[0].shape[0] * self.nstates ** 2)))
+
+    def couplings(self, x):
+        """The coupling matrix of the parameters ``x``"""
+        nstates, ncols = self.nstates, self.states.shape[1]
+        pairs = x[nstates * ncols:].reshape(-1, nstates, nstates)
+        couplings = np.zeros((nstates, ncols, nstates, ncols), dtype=np.float64)
+        couplings[:, self.pairs[0], :, self.pairs[1]] = pairs
+        couplings[:, self.pairs[1], :, self.pairs[0]] = pairs.transpose(0, 2, 1)
+        return couplings.reshape(nstates * ncols, nstates * ncols)
+
+    def evaluate(self, x):
+        """The objective and its gradient for the parameters ``x``"""
+        nstates, ncols = self.nstates, self.states.shape[1]
+        fields = x[:nstates * ncols]
+        pairs = x[nstates * ncols:].reshape(-1, nstates, nstates)
+        couplings = self.couplings(x)
+
+        # Block results are summed as they finish, so that at most one dense product per
+        # thread exists besides the total, however many blocks the sequences are split in
+        width = nstates * ncols
+        value, grad_fields, products = [0.0], np.zeros(width), np.zeros((width, width))
+        lock = threading.Lock()
+
+        def accumulate(block):
+            block_value, block_fields, block_products = _evaluate_block(self.states[block], self.weights[block],
+                                                                        fields, couplings)
+            with lock:
+                value[0] += block_value
+                grad_fields[:] += block_fields
+                products[:] += block_products
+
+        if self.pool is None:
+            for block in self.blocks:
+                accumulate(block)
+        else:
+            self.pool.map(accumulate, self.blocks)
+        value = value[0]
+        products = products.reshape(nstates, ncols, nstates, ncols)
+
+        # Each coupling contributes to the conditional probabilities of both of its columns
+        grad_pairs = products[:, self.pairs[0], :, self.pairs[1]]
+        grad_pairs += products[:, self.pairs[1], :, self.pairs[0]].transpose(0, 2, 1)
+
+        value += self.lambda_h * np.square(fields).sum() + self.lambda_j * np.square(pairs).sum()
+        grad_fields += 2 * self.lambda_h * fields
+        grad_pairs += 2 * self.lambda_j * pairs
+        return value, np.concatenate((grad_fields, grad_pairs.ravel()))
+
+
+def _evaluate_block(states, weights, fields, couplings):
+    """The weighted negative pseudo-log-likelihood of a block of sequences and its gradients
+
+    Returns the objective, the gradient of the fields and the product of the energy gradients
+    with the encoded sequences, from which the gradient of the couplings is assembled.
+
+    """
+    nseq, ncols = states.shape
+    nstates = fields.shape[0] // ncols
+    encoded = _msa.one_hot(states, np.arange(nstates)).astype(np.float64)
+    energies = (np.dot(encoded, couplings) + fields).reshape(nseq, nstates, ncols)
+    maxima = energies.max(axis=1, keepdims=True)
+    log_norms = maxima + np.log(np.exp(energies - maxima).sum(axis=1, keepdims=True))
+    encoded = encoded.reshape(nseq, nstates, ncols)
+    value = -np.dot(weights, (encoded * energies).sum(axis=(1, 2)) - log_norms.sum(axis=(1, 2)))
+    gradients = np.exp(energies - log_norms)
+    gradients -= encoded
+    gradients *= weights[:, np.newaxis, np.newaxis]
+    gradients = gradients.reshape(nseq, nstates * ncols)
+    encoded = encoded.reshape(nseq, nstates * ncols)
+    return value, gradients.sum(axis=0), np.dot(gradients.T, encoded)
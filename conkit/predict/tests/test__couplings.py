@@ -0,0 +1,80 @@
+"""Testing facility for conkit.predict._couplings"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import numpy as np
+import unittest
+
+from conkit.core.sequence import Sequence
+from conkit.core.sequencefile import SequenceFile
+from conkit.predict import _couplings
+
+
+class TestCouplings(unittest.TestCase):
+
+    def test_frequencies_1(self):
+        msa = SequenceFile('test')
+        for s in [Sequence('foo', 'AR'), Sequence('bar', 'A-'), Sequence('cho', 'RR')]:
+            msa.add(s)
+        single, pair = _couplings.frequencies(msa, 21, None, 0.0, 1)
+        self.assertEqual((42, ), single.shape)
+        self.assertEqual((42, 42), pair.shape)
+        self.assertEqual([0.666667, 0.0, 0.333333, 0.666667], single[[0, 1, 2, 3]].round(6).tolist())
+        self.assertEqual(0.333333, round(pair[0, 3], 6))
+        self.assertEqual(0.0, pair[0, 2])
+        self.assertEqual(0.0, pair[0, 2 * 2])
+
+    def test_frequencies_2(self):
+        msa = SequenceFile('test')
+        for s in [Sequence('foo', 'AR'), Sequence('bar', 'A-')]:
+            msa.add(s)
+        single, pair = _couplings.frequencies(msa, 20, None, 0.5, 1)
+        self.assertEqual((40, ), single.shape)
+        self.assertAlmostEqual(0.5 + 0.5 / 21, single[0])
+        self.assertAlmostEqual(0.5 / 21, single[1])
+        self.assertAlmostEqual(0.25 + 0.5 / 441, pair[0, 3])
+        self.assertEqual(0.0, pair[0, 2])
+        with self.assertRaises(ValueError):
+            _couplings.frequencies(msa, 20, None, 1.5, 1)
+
+    def test_apc_1(self):
+        scores = np.array([[0., 1., 2.], [1., 0., 3.], [2., 3., 0.]])
+        corrected = _couplings.apc(scores)
+        means = np.array([1.5, 2., 2.5])
+        np.testing.assert_allclose(scores - np.outer(means, means) / 2., corrected)
+
+    def test_apc_2(self):
+        self.assertEqual([[1.0]], _couplings.apc(np.array([[1.0]])).tolist())
+        self.assertEqual([[0.0, 0.0], [0.0, 0.0]], _couplings.apc(np.zeros((2, 2))).tolist())
+
+    def test_frobenius_norms_1(self):
+        couplings = np.random.RandomState(0).rand(3 * 4, 3 * 4)
+        norms = _couplings.frobenius_norms(couplings, 3, 0.0001)
+        blocks = couplings.reshape(3, 4, 3, 4)
+        for i in range(4):
+            for j in range(4):
+                full = np.zeros((_couplings.NSTATES, _couplings.NSTATES))
+                full[:3, :3] = blocks[:, i, :, j]
+                full = full - full.mean(axis=0) - full.mean(axis=1)[:, np.newaxis] + full.mean()
+                self.assertAlmostEqual(np.sqrt(np.square(full[:3, :3]).sum()), norms[i, j])
+
+    def test_inverse_1(self):
+        matrix = np.random.RandomState(0).rand(30, 10)
+        matrix = np.dot(matrix, matrix.T) + np.eye(30)
+        expected = np.linalg.inv(matrix)
+        inverse = _couplings.inverse(matrix.copy(), 0.001)
+        np.testing.assert_allclose(expected, inverse, atol=1e-10)
+        self.assertTrue(inverse.flags.c_contiguous)
+
+    def test_to_contact_map_1(self):
+        msa = SequenceFile('test')
+        msa.add(Sequence('foo', 'ARN'))
+        scores = np.array([[0., 1., 2.], [1., 0., 3.], [2., 3., 0.]])
+        contact_map = _couplings.to_contact_map(scores, msa, 1, 2)
+        self.assertEqual([(2, 3), (1, 3)], [c.id for c in contact_map])
+        self.assertEqual('ARN', contact_map.sequence.seq)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,53 @@
+"""Testing facility for conkit.predict.mfdca"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import numpy as np
+import unittest
+
+from conkit.core.sequence import Sequence
+from conkit.core.sequencefile import SequenceFile
+from conkit.predict.mfdca import mean_field_dca
+
+AMINO_ACIDS = np.array([ord(c) for c in 'ARNDCQEGHILKMFPSTWYV-'], dtype=np.uint8)
+
+
+class TestMeanFieldDca(unittest.TestCase):
+
+    def test_mean_field_dca_1(self):
+        states = np.random.RandomState(0).randint(0, 21, size=(300, 12))
+        states[:, 9] = states[:, 2]
+        states[:, 5] = (states[:, 0] + 3) % 21
+        contact_map = mean_field_dca(SequenceFile.from_matrix(AMINO_ACIDS[states]))
+        self.assertEqual([(1, 6), (3, 10)], sorted(c.id for c in contact_map[:2]))
+        self.assertEqual(66, len(contact_map))
+
+    def test_mean_field_dca_2(self):
+        states = np.random.RandomState(1).randint(0, 21, size=(100, 8))
+        msa = SequenceFile.from_matrix(AMINO_ACIDS[states])
+        expected = [(c.id, c.raw_score) for c in mean_field_dca(msa, min_separation=3)]
+        contact_map = mean_field_dca(msa, min_separation=3, memory_limit=0.0001)
+        self.assertEqual([c[0] for c in expected], [c.id for c in contact_map])
+        np.testing.assert_allclose([c[1] for c in expected], [c.raw_score for c in contact_map])
+        self.assertTrue(all(c.res2_seq - c.res1_seq >= 3 for c in contact_map))
+
+    def test_mean_field_dca_3(self):
+        states = np.random.RandomState(1).randint(0, 21, size=(100, 8))
+        msa = SequenceFile.from_matrix(AMINO_ACIDS[states])
+        self.assertEqual(5, len(mean_field_dca(msa, shrinkage=0.5, top=5)))
+        with self.assertRaises(ValueError):
+            mean_field_dca(msa, shrinkage=1.5)
+        with self.assertRaises(ValueError):
+            mean_field_dca(msa, pseudocount=-0.1)
+
+    def test_mean_field_dca_4(self):
+        msa = SequenceFile('test')
+        for s in [Sequence('foo', 'AAR'), Sequence('bar', 'RR')]:
+            msa.add(s)
+        with self.assertRaises(ValueError):
+            mean_field_dca(msa)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,50 @@
+"""Testing facility for conkit.predict.mi"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import numpy as np
+import unittest
+
+from conkit.core.sequence import Sequence
+from conkit.core.sequencefile import SequenceFile
+from conkit.predict.mi import mutual_information
+
+AMINO_ACIDS = np.array([ord(c) for c in 'ARNDCQEGHILKMFPSTWYV-'], dtype=np.uint8)
+
+
+class TestMutualInformation(unittest.TestCase):
+
+    def test_mutual_information_1(self):
+        states = np.random.RandomState(0).randint(0, 21, size=(300, 12))
+        states[:, 9] = states[:, 2]
+        contact_map = mutual_information(SequenceFile.from_matrix(AMINO_ACIDS[states]))
+        self.assertEqual((3, 10), contact_map.top_contact.id)
+        self.assertEqual(66, len(contact_map))
+        self.assertEqual(12, contact_map.sequence.seq_len)
+
+    def test_mutual_information_2(self):
+        msa = SequenceFile('test')
+        for s in [Sequence('foo', 'AAR'), Sequence('bar', 'RRA'), Sequence('cho', 'AAA'), Sequence('doo', 'RRR')]:
+            msa.add(s)
+        contact_map = mutual_information(msa, apc=False, identity=None)
+        self.assertEqual([(1, 2), (1, 3), (2, 3)], [c.id for c in contact_map])
+        self.assertEqual([round(np.log(2), 6), 0.0, 0.0], [round(c.raw_score, 6) for c in contact_map])
+
+    def test_mutual_information_3(self):
+        msa = SequenceFile('test')
+        for s in [Sequence('foo', 'AAR'), Sequence('bar', 'RRA'), Sequence('cho', 'AAA'), Sequence('doo', 'RRR')]:
+            msa.add(s)
+        self.assertEqual([(1, 3)], [c.id for c in mutual_information(msa, min_separation=2)])
+        self.assertEqual(1, len(mutual_information(msa, top=1)))
+
+    def test_mutual_information_4(self):
+        msa = SequenceFile('test')
+        for s in [Sequence('foo', 'AAR'), Sequence('bar', 'RR')]:
+            msa.add(s)
+        with self.assertRaises(ValueError):
+            mutual_information(msa)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,99 @@
+"""Testing facility for conkit.predict.pseudolikelihood"""
+
+__author__ = "Felix Simkovic"
+__date__ = "18 Oct 2026"
+
+import numpy as np
+import unittest
+
+from multiprocessing.pool import ThreadPool
+
+try:
+    import scipy.optimize
+    SCIPY = True
+except ImportError:
+    SCIPY = False
+
+from conkit.core.sequence import Sequence
+from conkit.core.sequencefile import SequenceFile
+from conkit.predict.pseudolikelihood import _PseudoLikelihood, pseudo_likelihood_dca
+
+AMINO_ACIDS = np.array([ord(c) for c in 'ARNDCQEGHILKMFPSTWYV-'], dtype=np.uint8)
+
+
+def skipUnless(condition):
+    if condition:
+        return lambda x: x
+    else:
+        return lambda x: None
+
+
+class TestPseudoLikelihoodDca(unittest.TestCase):
+
+    @skipUnless(SCIPY)
+    def test_pseudo_likelihood_dca_1(self):
+        states = np.random.RandomState(0).randint(0, 21, size=(300, 12))
+        states[:, 9] = states[:, 2]
+        states[:, 5] = (states[:, 0] + 3) % 21
+        contact_map = pseudo_likelihood_dca(SequenceFile.from_matrix(AMINO_ACIDS[states]))
+        self.assertEqual([(1, 6), (3, 10)], sorted(c.id for c in contact_map[:2]))
+        self.assertEqual(66, len(contact_map))
+
+    @skipUnless(SCIPY)
+    def test_pseudo_likelihood_dca_2(self):
+        states = np.random.RandomState(1).randint(0, 21, size=(60, 6))
+        msa = SequenceFile.from_matrix(AMINO_ACIDS[states])
+        expected = pseudo_likelihood_dca(msa, max_iterations=10)
+        contact_map = pseudo_likelihood_dca(msa, max_iterations=10, nthreads=2, memory_limit=0.01)
+        self.assertEqual([c.id for c in expected], [c.id for c in contact_map])
+        np.testing.assert_allclose([c.raw_score for c in expected], [c.raw_score for c in contact_map])
+
+    @skipUnless(SCIPY)
+    def test_pseudo_likelihood_dca_3(self):
+        msa = SequenceFile('test')
+        for s in [Sequence('foo', 'AAR'), Sequence('bar', 'RR')]:
+            msa.add(s)
+        with self.assertRaises(ValueError):
+            pseudo_likelihood_dca(msa)
+
+    def test_evaluate_1(self):
+        random_state = np.random.RandomState(0)
+        model = _PseudoLikelihood(random_state.randint(0, 21, size=(20, 4)), random_state.rand(20), 0.01, 0.3,
+                                  0.001, None)
+        x = model.initial() + random_state.randn(21 * 4 + 6 * 21 * 21) * 0.1
+        _, gradient = model.evaluate(x)
+        for i in random_state.choice(x.size, 10, replace=False):
+            step = np.zeros(x.size)
+            step[i] = 1e-6
+            numerical = (model.evaluate(x + step)[0] - model.evaluate(x - step)[0]) / 2e-6
+            self.assertAlmostEqual(numerical, gradient[i], places=6)
+
+    def test_evaluate_2(self):
+        random_state = np.random.RandomState(1)
+        states, weights = random_state.randint(0, 21, size=(50, 5)), random_state.rand(50)
+        model = _PseudoLikelihood(states, weights, 0.01, 0.3, 1, None)
+        x = model.initial() + random_state.randn(21 * 5 + 10 * 21 * 21) * 0.1
+        value, gradient = model.evaluate(x)
+        pool = ThreadPool(2)
+        try:
+            blocked = _PseudoLikelihood(states, weights, 0.01, 0.3, 0.001, pool)
+            self.assertGreater(len(blocked.blocks), 2)
+            blocked_value, blocked_gradient = blocked.evaluate(x)
+        finally:
+            pool.close()
+            pool.join()
+        self.assertAlmostEqual(value, blocked_value, places=8)
+        np.testing.assert_allclose(gradient, blocked_gradient, atol=1e-10)
+
+    def test_couplings_1(self):
+        model = _PseudoLikelihood(np.zeros((2, 3), dtype=np.uint8), np.ones(2), 0.01, 0.3, 1, None)
+        x = np.arange(21 * 3 + 3 * 21 * 21, dtype=np.float64)
+        couplings = model.couplings(x).reshape(21, 3, 21, 3)
+        self.assertEqual(x[63 + 1], couplings[0, 0, 1, 1])
+        self.assertEqual(x[63 + 1], couplings[1, 1, 0, 0])
+        self.assertEqual(x[63 + 2 * 441 + 21 + 2], couplings[1, 1, 2, 2])
+        self.assertEqual(0.0, couplings[0, 1, 3, 1])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
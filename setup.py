@@ -132,6 +132,7 @@ PACKAGES = [
     'conkit/io',
     'conkit/misc',
     'conkit/plot',
+    'conkit/predict',
 ]
 
 CLASSIFIERS = [